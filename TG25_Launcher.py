@@ -1,25 +1,97 @@
 #!/usr/bin/env python3
 # TG25_Launcher.py — Start/Stop GUI for Hand Tracking worker
-import os, sys, time, signal, subprocess, tkinter as tk
+import os, sys, signal, asyncio, functools, logging, subprocess, threading, traceback, tkinter as tk
+from logging.handlers import RotatingFileHandler
 from tkinter import messagebox
 from pathlib import Path
 
 APP_TITLE = "TG25 Hand Tracking – Launcher"
+FROZEN = getattr(sys, "frozen", False)
+# Source mode on Windows hosts the worker on a thread of this process (no second
+# interpreter). HighGUI off the main thread is unsupported on Cocoa and fragile
+# with Qt/GTK, so other platforms keep the subprocess (which also logs to WORKER_LOG_NAME).
+INPROC_WORKER = not FROZEN and os.name == "nt"
 STOP_FILE_NAME = "TG25_STOP.flag"
+# Only Windows needs the flag file; POSIX workers are stopped with SIGTERM
+USE_STOP_FILE = os.name == "nt"
+WORKER_LOG_NAME = "TG25_worker.log"
+WORKER_LOG_MAX_BYTES = 1 << 20  # rotate at 1 MiB, keep one backup
 
+# Give the child its own process group (so we can signal/terminate cleanly).
+# Windows: new process group for CTRL_BREAK_EVENT, and no console window (its
+# output is piped into WORKER_LOG_NAME instead).
+# POSIX: new session, so os.killpg also reaches DepthAI's helper processes.
+if os.name == "nt":
+    SPAWN_KW = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.CREATE_NO_WINDOW}
+else:
+    SPAWN_KW = {"start_new_session": True}
+
+@functools.lru_cache(maxsize=1)
 def _exe_dir() -> Path:
-    if getattr(sys, "frozen", False):
+    if FROZEN:
         return Path(sys.executable).parent
     return Path(__file__).resolve().parent
 
+class InProcessWorker:
+    """
+    Source-mode worker on Windows (INPROC_WORKER): hand_tracking_app.main() on a
+    daemon thread of this process, exposing the parts of asyncio.subprocess.Process
+    the launcher uses. A thread can't be killed, so terminate()/kill() can only
+    ask it to stop. Its output goes to the launcher's console, not WORKER_LOG_NAME.
+    """
+    def __init__(self, target, loop: asyncio.AbstractEventLoop):
+        self.pid = os.getpid()
+        self.returncode: int | None = None
+        self.stop_event = threading.Event()
+        self._target = target
+        self._loop = loop
+        self._exited = loop.create_future()
+
+    def start(self):
+        threading.Thread(target=self._run, name="TG25-worker", daemon=True).start()
+
+    def _run(self):
+        code = 0
+        try:
+            self._target(stop_event=self.stop_event)
+        except Exception:
+            traceback.print_exc()
+            code = 1
+        self._loop.call_soon_threadsafe(self._set_exited, code)
+
+    def _set_exited(self, code: int):
+        self.returncode = code
+        self._exited.set_result(code)
+
+    async def wait(self) -> int:
+        # shield: a wait_for() timeout must not cancel the shared exit future
+        return await asyncio.shield(self._exited)
+
+    def send_signal(self, sig):
+        self.stop_event.set()
+
+    def terminate(self):
+        self.stop_event.set()
+
+    def kill(self):
+        self.stop_event.set()
+
 class LauncherApp:
-    def __init__(self, master: tk.Tk):
+    def __init__(self, master: tk.Tk, loop: asyncio.AbstractEventLoop):
         self.master = master
         self.master.title(APP_TITLE)
         self.master.geometry("380x160")
-        self.proc: subprocess.Popen | None = None
+        # Process spawn/wait/kill all happen on this loop (own thread);
+        # results come back to Tk via _post().
+        self.loop = loop
+        self.proc: asyncio.subprocess.Process | InProcessWorker | None = None
         self.base = _exe_dir()
         self.stop_file = self.base / STOP_FILE_NAME
+        self.worker_log = self._make_worker_log()
+        # Constant for the launcher's lifetime, so build it once
+        self._worker_env = {**os.environ, "PYTHONIOENCODING": "utf-8"}  # stdout is a pipe, not a console
+        if USE_STOP_FILE:
+            self._worker_env["TG25_STOP_FILE"] = str(self.stop_file)
 
         # UI
         self.btn_start = tk.Button(master, text="Start Hand Tracking", width=24, command=self.start_worker)
@@ -31,136 +103,242 @@ class LauncherApp:
         self.lbl_status.pack(fill="x", padx=10, pady=10)
 
         master.protocol("WM_DELETE_WINDOW", self.on_close)
-        self._poll()
+
+    def _make_worker_log(self) -> logging.Logger:
+        """Rotating file sink for the worker's stdout/stderr (it has no console)."""
+        log = logging.getLogger("tg25.worker")
+        log.setLevel(logging.INFO)
+        log.propagate = False
+        if not log.handlers:
+            handler = RotatingFileHandler(
+                self.base / WORKER_LOG_NAME, maxBytes=WORKER_LOG_MAX_BYTES,
+                backupCount=1, encoding="utf-8", delay=True
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            log.addHandler(handler)
+        return log
 
     def _worker_cmd(self) -> tuple[list[str], dict]:
         """
         Build the command + env for the worker.
         In frozen mode, we expect TG25_HandTracking.exe next to this launcher.
-        In source mode, we run run_hand_tracking.py with current Python.
+        In source mode (non-Windows), we run run_hand_tracking.py with current Python.
+        (Source mode on Windows runs the worker in-process, see _spawn_inproc.)
         """
-        env = os.environ.copy()
-        env["TG25_STOP_FILE"] = str(self.stop_file)
-
-        if getattr(sys, "frozen", False):
+        env = self._worker_env
+        if FROZEN:
             exe = self.base / "TG25_HandTracking.exe"
             if not exe.exists():
                 messagebox.showerror(APP_TITLE, f"Could not find worker:\n{exe}")
                 return [], env
             return [str(exe)], env
-        else:
-            # Source/dev mode
-            script = self.base / "run_hand_tracking.py"
-            if not script.exists():
-                messagebox.showerror(APP_TITLE, f"Could not find:\n{script}")
-                return [], env
-            return [sys.executable, "-u", str(script)], env
+        script = self.base / "run_hand_tracking.py"
+        if not script.exists():
+            messagebox.showerror(APP_TITLE, f"Could not find:\n{script}")
+            return [], env
+        return [sys.executable, "-u", str(script)], env
 
     def start_worker(self):
-        if self.proc and self.proc.poll() is None:
+        if self.proc and self.proc.returncode is None:
             messagebox.showinfo(APP_TITLE, "Already running.")
             return
-        # ensure no stale stop flag
-        try: self.stop_file.unlink()
-        except: pass
 
-        cmd, env = self._worker_cmd()
-        if not cmd:
-            return
+        if INPROC_WORKER:
+            # Source/dev mode on Windows: no second interpreter, no depthai/cv2 re-import
+            spawn = self._spawn_inproc()
+        else:
+            # ensure no stale stop flag
+            self._clear_stop_file()
+
+            cmd, env = self._worker_cmd()
+            if not cmd:
+                return
+
+            spawn = self._spawn(cmd, env)
 
-        creationflags = 0
-        # Give the child its own process group (so we can signal/terminate cleanly)
-        if os.name == "nt":
-            creationflags |= subprocess.CREATE_NEW_PROCESS_GROUP
-            creationflags |= subprocess.CREATE_NEW_CONSOLE
+        self.btn_start.config(state=tk.DISABLED)
+        self._set_status("starting...")
+        asyncio.run_coroutine_threadsafe(spawn, self.loop)
 
+    async def _spawn(self, cmd: list[str], env: dict):
         try:
-            self.proc = subprocess.Popen(
-                cmd, cwd=_exe_dir(), env=env,
-                creationflags=creationflags
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, cwd=self.base, env=env,
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT,
+                **SPAWN_KW
             )
         except Exception as e:
-            messagebox.showerror(APP_TITLE, f"Failed to start worker:\n{e}")
-            self.proc = None
+            self._post(self._on_start_failed, e)
             return
+        self._post(self._on_started, proc)
+        asyncio.ensure_future(self._pump_output(proc))
+        # Exit arrives as an event from the loop's child watcher; nothing polls
+        await proc.wait()
+        self._post(self._on_child_exit, proc)
 
-        self.btn_start.config(state=tk.DISABLED)
+    async def _spawn_inproc(self):
+        proc = InProcessWorker(self._run_worker_inproc, self.loop)
+        proc.start()
+        self._post(self._on_started, proc)
+        await proc.wait()
+        self._post(self._on_child_exit, proc)
+
+    def _run_worker_inproc(self, stop_event: threading.Event):
+        # Imported on the worker thread so the launcher window never waits on depthai/cv2
+        if str(self.base) not in sys.path:
+            sys.path.insert(0, str(self.base))
+        from src.gesture_oak.apps.hand_tracking_app import main as hand_app_main
+        hand_app_main(stop_event=stop_event)
+
+    async def _pump_output(self, proc: asyncio.subprocess.Process):
+        # Ends on EOF, i.e. once the worker (and anything inheriting its stdout) is gone
+        async for line in proc.stdout:
+            self.worker_log.info(line.decode("utf-8", "replace").rstrip())
+
+    def _on_started(self, proc: asyncio.subprocess.Process):
+        self.proc = proc
         self.btn_stop.config(state=tk.NORMAL)
-        self._set_status("running (PID: %s)" % self.proc.pid)
+        self._set_status("running (PID: %s)" % proc.pid)
 
-    def stop_worker(self):
-        if not self.proc or self.proc.poll() is not None:
+    def _on_start_failed(self, e: Exception):
+        self.proc = None
+        self.btn_start.config(state=tk.NORMAL)
+        self._set_status("idle")
+        messagebox.showerror(APP_TITLE, f"Failed to start worker:\n{e}")
+
+    def stop_worker(self, on_done=None):
+        if not self.proc or self.proc.returncode is not None:
             self._set_status("not running")
             self.btn_start.config(state=tk.NORMAL)
             self.btn_stop.config(state=tk.DISABLED)
             return
 
-        # 1) Ask politely: create STOP flag (the app checks it and exits)
+        # Run the whole sequence on the asyncio thread so the window keeps repainting
+        proc, self.proc = self.proc, None
+        self.btn_start.config(state=tk.DISABLED)
+        self.btn_stop.config(state=tk.DISABLED)
+        self._set_status("stopping (PID: %s)..." % proc.pid)
+        fut = asyncio.run_coroutine_threadsafe(self._shutdown(proc), self.loop)
+        fut.add_done_callback(lambda _f: self._post(self._on_stopped, proc, on_done))
+
+    async def _shutdown(self, proc: asyncio.subprocess.Process | InProcessWorker):
+        if isinstance(proc, InProcessWorker):
+            # Cooperative only: set its stop_event and give it the same 8 s
+            proc.terminate()
+            await self._wait(proc, 8.0)
+            return
+
+        # 1) Ask politely. POSIX: SIGTERM, which the worker turns into a clean exit.
+        # Windows: console control events can't reach a child without a console
+        # of its own, so the STOP flag (checked by the app) stays the request there.
         try:
-            self.stop_file.write_text("stop", encoding="utf-8")
+            if USE_STOP_FILE:
+                self.stop_file.write_text("stop", encoding="utf-8")
+            else:
+                self._signal_group(proc, signal.SIGTERM)
         except Exception:
             pass
 
         # 2) Wait a bit for graceful exit
-        deadline = time.time() + 8.0
-        while time.time() < deadline:
-            if self.proc.poll() is not None:
-                break
-            time.sleep(0.2)
+        if await self._wait(proc, 8.0):
+            return
 
         # 3) If still alive, try gentle terminate
-        if self.proc.poll() is None:
-            try:
-                if os.name == "nt":
-                    # Send CTRL_BREAK_EVENT to the process group (if console process)
-                    # Not all builds will have a console, so ignore errors.
-                    os.kill(self.proc.pid, signal.CTRL_BREAK_EVENT)  # type: ignore[attr-defined]
-                    time.sleep(1.0)
-                self.proc.terminate()
-            except Exception:
-                pass
+        try:
+            if os.name == "nt":
+                # Send CTRL_BREAK_EVENT to the process group (if console process)
+                # Not all builds will have a console, so ignore errors.
+                os.kill(proc.pid, signal.CTRL_BREAK_EVENT)  # type: ignore[attr-defined]
+                if await self._wait(proc, 1.0):
+                    return
+                proc.terminate()
+            else:
+                self._signal_group(proc, signal.SIGTERM)
+        except Exception:
+            pass
+        # Give terminate() a real chance: returns as soon as the child is gone
+        if await self._wait(proc, 1.0):
+            return
 
         # 4) Hard kill as last resort
         try:
-            if self.proc.poll() is None:
-                self.proc.kill()
+            if proc.returncode is None:
+                if os.name == "nt":
+                    proc.kill()
+                else:
+                    self._signal_group(proc, signal.SIGKILL)
         except Exception:
             pass
 
-        # Cleanup flag
-        try: self.stop_file.unlink()
-        except: pass
+    @staticmethod
+    def _signal_group(proc: asyncio.subprocess.Process, sig: int):
+        """POSIX: signal the worker's whole session (see SPAWN_KW), not just its PID."""
+        os.killpg(os.getpgid(proc.pid), sig)
 
-        self._set_status("stopped")
+    @staticmethod
+    async def _wait(proc: asyncio.subprocess.Process, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(proc.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def _on_stopped(self, proc, on_done=None):
+        self._clear_stop_file()
+
+        if isinstance(proc, InProcessWorker) and proc.returncode is None:
+            self._set_status("stop timed out (worker thread still running)")
+        else:
+            self._set_status("stopped")
+        self.btn_start.config(state=tk.NORMAL)
+        self.btn_stop.config(state=tk.DISABLED)
+        if on_done is not None:
+            on_done()
+
+    def _on_child_exit(self, proc: asyncio.subprocess.Process):
+        if proc is not self.proc:
+            return  # stop_worker already handled this one
+        # Update status if the worker died unexpectedly
+        self._set_status("exited (code %s)" % proc.returncode)
         self.btn_start.config(state=tk.NORMAL)
         self.btn_stop.config(state=tk.DISABLED)
         self.proc = None
+        self._clear_stop_file()
 
-    def _poll(self):
-        # Periodically update status if the worker died unexpectedly
-        if self.proc and self.proc.poll() is not None:
-            self._set_status("exited (code %s)" % self.proc.returncode)
-            self.btn_start.config(state=tk.NORMAL)
-            self.btn_stop.config(state=tk.DISABLED)
-            self.proc = None
-            try: self.stop_file.unlink()
-            except: pass
-        self.master.after(500, self._poll)
+    def _clear_stop_file(self):
+        if not USE_STOP_FILE:
+            return  # never written on this platform
+        try:
+            self.stop_file.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    def _post(self, fn, *args):
+        """Run fn(*args) on the Tk thread; safe to call from the asyncio thread."""
+        try:
+            self.master.after_idle(fn, *args)
+        except (RuntimeError, tk.TclError):
+            pass  # launcher window already gone
 
     def _set_status(self, text: str):
         self.lbl_status.config(text=f"Status: {text}")
 
     def on_close(self):
-        if self.proc and self.proc.poll() is None:
+        if self.proc and self.proc.returncode is None:
             if not messagebox.askyesno(APP_TITLE, "Worker is running. Stop it and exit?"):
                 return
-            self.stop_worker()
+            self.stop_worker(on_done=self.master.destroy)
+            return
         self.master.destroy()
 
 def main():
+    # Tk keeps the main thread; asyncio gets its own (see LauncherApp.loop)
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
     root = tk.Tk()
-    LauncherApp(root)
+    LauncherApp(root, loop)
     root.mainloop()
+    loop.call_soon_threadsafe(loop.stop)
 
 if __name__ == "__main__":
     main()
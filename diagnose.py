@@ -2,12 +2,28 @@
 Simple diagnostic to find the ghost import error
 Save as: diagnose.py in project root
 """
+import ast
 import sys
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+
+def _handtracker_imports(tree):
+    """Yield module-level import statements that mention HandTracker (also inside try/if)"""
+    pending = list(tree.body)
+    while pending:
+        node = pending.pop()
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            if any("HandTracker" in a.name for a in node.names):
+                yield node
+        elif isinstance(node, (ast.If, ast.Try)):
+            pending.extend(node.body)
+            pending.extend(node.orelse)
+            for handler in getattr(node, "handlers", ()):
+                pending.extend(handler.body)
+
 print("="*70)
 print("DIAGNOSTIC: Finding the Import Ghost")
 print("="*70)
@@ -26,13 +42,16 @@ print("\n[Test 2] Checking rgb_hand_detector.py content...")
 rgb_path = Path("src/gesture_oak/detection/rgb_hand_detector.py")
 if rgb_path.exists():
     print(f"✅ File exists: {rgb_path.absolute()}")
-    with open(rgb_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
+    tree = ast.parse(rgb_path.read_bytes(), filename=str(rgb_path))
+    # Parsed rather than substring-matched, so comments and strings can't match
+    imports = sorted(_handtracker_imports(tree), key=lambda n: n.lineno)
+    node = next((n for n in imports if isinstance(n, ast.ImportFrom)
+                 and n.module == "HandTracker"), None)
+
     # Check for the correct import
-    if "from .HandTracker import HandTracker" in content:
+    if node is not None and node.level == 1:
         print("✅ Has correct relative import: 'from .HandTracker import HandTracker'")
-    elif "from HandTracker import HandTracker" in content:
+    elif node is not None and node.level == 0:
         print("⚠️  Has OLD import: 'from HandTracker import HandTracker'")
         print("   This needs to be changed to: 'from .HandTracker import HandTracker'")
     else:
@@ -40,9 +59,8 @@ if rgb_path.exists():
         
     # Show the actual import lines
     print("\n   Import lines found:")
-    for i, line in enumerate(content.split('\n')[:50], 1):
-        if 'HandTracker' in line and 'import' in line:
-            print(f"   Line {i}: {line.strip()}")
+    for n in imports:
+        print(f"   Line {n.lineno}: {ast.unparse(n)}")
 else:
     print(f"❌ File NOT found: {rgb_path.absolute()}")
 
@@ -3,11 +3,62 @@
 TG_25_GestureOAK-D Main Menu
 Updated with Smart Combined Detection
 """
+import argparse
+import importlib
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Menu choice -> (label, "module:function", message shown before launching).
+# Nothing here is imported until the choice is actually picked, so the menu
+# shows up before depthai/OpenCV/MediaPipe load.
+MENU = {
+    '1': ("Test camera connection",
+          "gesture_oak.core.oak_camera:test_camera_connection",
+          "Testing camera connection..."),
+    '2': ("Run hand tracking app (with swipe)",
+          "gesture_oak.apps.hand_tracking_app:main",
+          "Starting hand tracking application..."),
+    '3': ("Run swipe detection app",
+          "gesture_oak.apps.swipe_detection_app:main",
+          "Starting swipe detection application..."),
+    '4': ("Run motion-based swipe",
+          "gesture_oak.apps.motion_swipe_app:main",
+          "Starting motion-based swipe application..."),
+    '5': ("Run wrist rotation detection",
+          "gesture_oak.apps.wrist_rotation_app:main",
+          "Starting wrist rotation detection..."),
+    '6': ("Run 3-area detection (RGB)",
+          "gesture_oak.apps.three_area_app:main",
+          "Starting 3-area detection (RGB mode)..."),
+    '7': ("Run smart combined detection (NEW)",
+          "gesture_oak.apps.smart_combined_app:main",
+          "Starting smart combined detection...\n"
+          "  🤚 OPEN hand → Wrist Rotation (4 zones)\n"
+          "  ☝  ONE finger → 3-Area Pointing (3 zones)\n"
+          "  ✊ FIST → Universal gesture"),
+}
+EXIT_CHOICE = '8'
+
+# Setup hints for the apps that ship as drop-in files
+IMPORT_HINTS = {
+    '6': ("three_area_app", [
+        "Copied three_area_app.py to src/gesture_oak/apps/",
+        "Copied rgb_hand_detector.py to src/gesture_oak/detection/",
+        "Copied three_area_detector.py to src/gesture_oak/detection/",
+    ], "INTEGRATION_SUMMARY.md"),
+    '7': ("smart_combined_app", [
+        "Copied smart_combined_detector.py to src/gesture_oak/detection/",
+        "Copied smart_combined_app.py to src/gesture_oak/apps/",
+    ], "SMART_COMBINED_INTEGRATION.md"),
+}
+
+
+@lru_cache(maxsize=None)
+def load_entry(choice):
+    """Import and return the callable for a menu choice (cached after first use)"""
+    module_name, func_name = MENU[choice][1].split(":")
+    return getattr(importlib.import_module(module_name), func_name)
 
 
 def print_menu():
@@ -15,92 +66,59 @@ def print_menu():
     print("\n" + "="*60)
     print("TG_25_GestureOAK-D - Main Menu")
     print("="*60)
-    print("1. Test camera connection")
-    print("2. Run hand tracking app (with swipe)")
-    print("3. Run swipe detection app")
-    print("4. Run motion-based swipe")
-    print("5. Run wrist rotation detection")
-    print("6. Run 3-area detection (RGB)")
-    print("7. Run smart combined detection (NEW)")
-    print("8. Exit")
+    for choice, (label, _, _) in MENU.items():
+        print(f"{choice}. {label}")
+    print(f"{EXIT_CHOICE}. Exit")
     print("="*60)
 
 
+def dispatch(choice):
+    """Run one menu choice. Returns False when the user asked to exit."""
+    if choice == EXIT_CHOICE:
+        print("\nExiting...")
+        return False
+
+    entry = MENU.get(choice)
+    if entry is None:
+        print(f"\nInvalid choice. Please enter 1-{EXIT_CHOICE}.")
+        return True
+
+    print("\n" + entry[2])
+    try:
+        load_entry(choice)()
+    except ImportError as e:
+        if choice not in IMPORT_HINTS:
+            raise
+        module_name, steps, doc = IMPORT_HINTS[choice]
+        print(f"\n❌ Error: Could not import {module_name}")
+        print(f"Details: {e}")
+        print("\nMake sure you have:")
+        for i, step in enumerate(steps, 1):
+            print(f"  {i}. {step}")
+        print(f"\nRefer to {doc} for setup instructions.")
+    return True
+
+
 def main():
-    """Main menu loop"""
+    """Main menu loop, or a single app with --choice N (no prompt, for scripted launches)"""
+    parser = argparse.ArgumentParser(description="TG_25_GestureOAK-D main menu")
+    parser.add_argument("--choice", help=f"run menu entry 1-{len(MENU)} directly and exit")
+    args, _ = parser.parse_known_args()
+
+    # Add src to path
+    src_dir = str(Path(__file__).parent / "src")
+    if src_dir not in sys.path:
+        sys.path.insert(0, src_dir)
+
+    if args.choice:
+        dispatch(args.choice.strip())
+        return
+
     while True:
         print_menu()
-        choice = input("Enter your choice (1-8): ").strip()
-        
-        if choice == '1':
-            # Test camera
-            print("\nTesting camera connection...")
-            from gesture_oak.core.oak_camera import test_camera_connection
-            test_camera_connection()
-        
-        elif choice == '2':
-            # Hand tracking with swipe
-            print("\nStarting hand tracking application...")
-            from gesture_oak.apps.hand_tracking_app import main as hand_main
-            hand_main()
-        
-        elif choice == '3':
-            # Swipe detection only
-            print("\nStarting swipe detection application...")
-            from gesture_oak.apps.swipe_detection_app import main as swipe_main
-            swipe_main()
-        
-        elif choice == '4':
-            # Motion-based swipe
-            print("\nStarting motion-based swipe application...")
-            from gesture_oak.apps.motion_swipe_app import main as motion_main
-            motion_main()
-        
-        elif choice == '5':
-            # Wrist rotation detection
-            print("\nStarting wrist rotation detection...")
-            from gesture_oak.apps.wrist_rotation_app import main as rotation_main
-            rotation_main()
-        
-        elif choice == '6':
-            # 3-area detection (RGB mode)
-            print("\nStarting 3-area detection (RGB mode)...")
-            try:
-                from gesture_oak.apps.three_area_app import main as area_main
-                area_main()
-            except ImportError as e:
-                print(f"\n❌ Error: Could not import three_area_app")
-                print(f"Details: {e}")
-                print("\nMake sure you have:")
-                print("  1. Copied three_area_app.py to src/gesture_oak/apps/")
-                print("  2. Copied rgb_hand_detector.py to src/gesture_oak/detection/")
-                print("  3. Copied three_area_detector.py to src/gesture_oak/detection/")
-                print("\nRefer to INTEGRATION_SUMMARY.md for setup instructions.")
-        
-        elif choice == '7':
-            # Smart Combined Detection (NEW!)
-            print("\nStarting smart combined detection...")
-            print("  🤚 OPEN hand → Wrist Rotation (4 zones)")
-            print("  ☝  ONE finger → 3-Area Pointing (3 zones)")
-            print("  ✊ FIST → Universal gesture")
-            try:
-                from gesture_oak.apps.smart_combined_app import main as smart_main
-                smart_main()
-            except ImportError as e:
-                print(f"\n❌ Error: Could not import smart_combined_app")
-                print(f"Details: {e}")
-                print("\nMake sure you have:")
-                print("  1. Copied smart_combined_detector.py to src/gesture_oak/detection/")
-                print("  2. Copied smart_combined_app.py to src/gesture_oak/apps/")
-                print("\nRefer to SMART_COMBINED_INTEGRATION.md for setup instructions.")
-        
-        elif choice == '8':
-            # Exit
-            print("\nExiting...")
+        choice = input(f"Enter your choice (1-{EXIT_CHOICE}): ").strip()
+        if not dispatch(choice):
             break
-        
-        else:
-            print("\nInvalid choice. Please enter 1-8.")
 
 
 if __name__ == "__main__":
@@ -1,36 +1,137 @@
-import os, time
-import depthai as dai
+"""
+DepthAI probe: list devices, boot the board, or pull RGB preview frames.
 
-os.environ["DEPTHAI_BOOTUP_TIMEOUT"] = "20000"
-os.environ["DEPTHAI_DEVICE_TIMEOUT"] = "20000"
-os.environ["DEPTHAI_USB2"] = "1"
+  python probe_dai.py                 # list devices, open + close (default)
+  python probe_dai.py --mode list     # USB scan only
+  python probe_dai.py --mode rgb      # open once with an RGB preview pipeline, pull 1 s of frames
+  python probe_dai.py --usb2 --debug  # force USB2, device-side DEBUG logging
 
-print("DepthAI version:", dai.__version__)
-print("Scanning devices...")
-for d in dai.Device.getAllAvailableDevices():
-    print(" -", d.getMxId(), d.state, d.protocol)
+Replaces sanity_open.py / sanity_rgb.py: the USB scan runs once and its result
+is handed to the open step, and rgb mode checks "open" with the same Device.
+"""
+import argparse
+import os
+import sys
+import time
 
-print("Building empty pipeline...")
-p = dai.Pipeline()
-# No nodes: just boot the device
 
-def cfg():
-    c = dai.Device.Config()
-    c.board.usb.maxUsbSpeed = dai.UsbSpeed.HIGH
-    c.logLevel = dai.LogLevel.DEBUG
-    return c
+def parse_args():
+    parser = argparse.ArgumentParser(description="DepthAI device probe")
+    parser.add_argument("--mode", choices=("list", "open", "rgb"), default="open")
+    parser.add_argument("--usb2", action="store_true", help="force USB2 (DEPTHAI_USB2=1)")
+    parser.add_argument("--timeout-ms", type=int, default=20000,
+                        help="DEPTHAI_BOOTUP_TIMEOUT / DEPTHAI_DEVICE_TIMEOUT")
+    parser.add_argument("--fps", type=int, default=20, help="RGB preview FPS (rgb mode)")
+    parser.add_argument("--frames", type=int, default=None,
+                        help="frames to receive in rgb mode (default: one second's worth)")
+    parser.add_argument("--frame-timeout", type=float, default=5.0,
+                        help="seconds to wait for each frame before giving up")
+    parser.add_argument("--debug", action="store_true", help="device log level DEBUG")
+    return parser.parse_args()
 
-for i in range(2):
+
+def configure_env(args):
+    """Set DepthAI env vars before depthai is imported"""
+    os.environ["DEPTHAI_BOOTUP_TIMEOUT"] = str(args.timeout_ms)
+    os.environ["DEPTHAI_DEVICE_TIMEOUT"] = str(args.timeout_ms)
+    if args.usb2:
+        os.environ["DEPTHAI_USB2"] = "1"
+
+
+def list_devices(dai):
+    print("Scanning devices...")
     try:
-        print(f"Attempt {i+1}/2: opening device...")
-        with dai.Device(p, usb2Mode=True, config=cfg()) as dev:
-            print("Opened. Waiting 1s, then closing...")
-            time.sleep(1)
-        print("Closed cleanly.")
-        break
+        devices = dai.Device.getAllAvailableDevices()
     except Exception as e:
-        print("Open failed:", e)
-        time.sleep(1.5)
+        print("List devices failed:", e)
+        return []
+    for d in devices:
+        print(" -", d.getMxId(), d.state, d.protocol)
+    if not devices:
+        print(" (none found)")
+    return devices
+
+
+def rgb_pipeline(dai, fps):
+    p = dai.Pipeline()
+    cam = p.createColorCamera()
+    cam.setPreviewSize(640, 400)
+    cam.setFps(fps)
+    xout = p.createXLinkOut()
+    xout.setStreamName("preview")
+    cam.preview.link(xout.input)
+    return p
+
+
+def open_device(dai, pipeline, devices, args):
+    """Open the first scanned device (no second USB scan), retrying once"""
+    for i in range(2):
+        try:
+            print(f"Attempt {i+1}/2: opening device...")
+            if devices:
+                dev = dai.Device(pipeline, devices[0], usb2Mode=args.usb2)
+            else:
+                dev = dai.Device(pipeline, usb2Mode=args.usb2)
+            print("Opened:", dev.getDeviceName(), dev.getUsbSpeed())
+            if args.debug:
+                dev.setLogLevel(dai.LogLevel.DEBUG)
+                dev.setLogOutputLevel(dai.LogLevel.DEBUG)
+            return dev
+        except Exception as e:
+            print("Open failed:", e)
+            if i == 0:
+                time.sleep(1.5)
+    return None
+
+
+def stream_rgb(dev, frames, timeout_s):
+    """Pull a fixed number of preview frames; a stalled link times out instead of hanging"""
+    q = dev.getOutputQueue("preview", 2, False)
+    print(f"Receiving {frames} RGB preview frames...")
+    for i in range(frames):
+        deadline = time.monotonic() + timeout_s
+        frame = q.tryGet()
+        while frame is None:
+            if time.monotonic() > deadline:
+                print(f"No frame within {timeout_s:.1f}s (got {i}/{frames})")
+                return False
+            time.sleep(0.01)
+            frame = q.tryGet()
+        print(i, frame.getWidth(), frame.getHeight())
+    return True
+
+
+def main():
+    args = parse_args()
+    configure_env(args)
+    import depthai as dai
+
+    print("DepthAI version:", dai.__version__)
+    devices = list_devices(dai)
+    if args.mode == "list":
+        return 0
+
+    # "open" boots an empty pipeline; "rgb" boots the preview pipeline and
+    # streams from that same Device instead of closing and reopening it
+    pipeline = rgb_pipeline(dai, args.fps) if args.mode == "rgb" else dai.Pipeline()
+    dev = open_device(dai, pipeline, devices, args)
+    if dev is None:
+        return 1
+    ok = True
+    try:
+        if args.mode == "rgb":
+            ok = stream_rgb(dev, args.frames or args.fps, args.frame_timeout)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        dev.close()
+        print("Closed cleanly.")
+    return 0 if ok else 1
+
 
-print("Probe done.")
-input("Press Enter to exit...")
+if __name__ == "__main__":
+    code = main()
+    print("Probe done.")
+    if getattr(sys, "frozen", False):
+        input("Press Enter to exit...")  # keep the double-clicked console open
+    sys.exit(code)
@@ -1,41 +1,69 @@
 # run_hand_tracking.py
 #!/usr/bin/env python3
 from pathlib import Path
-import os, sys, time, traceback
+import io, os, sys, time, signal, functools, traceback
 
+@functools.lru_cache(maxsize=1)
 def _exe_dir() -> Path:
     if getattr(sys, "frozen", False):
         return Path(sys.executable).parent
     return Path(__file__).resolve().parent
 
+# Resolved up front so the crash path doesn't pay for importing ctypes
+if os.name == "nt":
+    import ctypes
+    _MessageBoxW = ctypes.windll.user32.MessageBoxW
+    _MessageBoxW.argtypes = [ctypes.c_void_p, ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_uint]
+    _MessageBoxW.restype = ctypes.c_int
+else:
+    _MessageBoxW = None
+
 def _msgbox(title: str, text: str) -> None:
+    if _MessageBoxW is None:
+        return
     try:
-        import ctypes
-        ctypes.windll.user32.MessageBoxW(0, text, title, 0x00000010)  # MB_ICONERROR
+        _MessageBoxW(None, text, title, 0x00000010)  # MB_ICONERROR
     except Exception:
         pass
 
+ROOT = _exe_dir()
+
 # --- run from the EXE folder so relative paths work on double-click ---
-os.chdir(_exe_dir())
+os.chdir(ROOT)
 
 # Make project importable both frozen and unfrozen
-ROOT = _exe_dir()
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from src.gesture_oak.apps.hand_tracking_app import main as hand_app_main
+from src.gesture_oak.apps.hand_tracking_app import main as hand_app_main, stop_event
+
+def _on_stop(signum, frame) -> None:
+    # Launcher's SIGTERM (POSIX) / CTRL_BREAK_EVENT (Windows), or Ctrl+C in the console
+    stop_event.set()
 
 if __name__ == "__main__":
+    for _name in ("SIGTERM", "SIGINT", "SIGBREAK"):
+        if hasattr(signal, _name):
+            signal.signal(getattr(signal, _name), _on_stop)
     try:
         hand_app_main()
     except SystemExit:
         raise
     except Exception:
-        log_path = _exe_dir() / "TG25_HandTracking_error.log"
+        log_path = ROOT / "TG25_HandTracking_error.log"
+        buf = io.StringIO()
+        buf.write(f"\n==== {time.strftime('%Y-%m-%d %H:%M:%S')} ====\n")
+        traceback.print_exc(file=buf)
+        report = buf.getvalue()
         try:
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(f"\n==== {time.strftime('%Y-%m-%d %H:%M:%S')} ====\n")
-                traceback.print_exc(file=f)
+            # One O_APPEND write + fsync: a launcher kill() right after can't
+            # leave half a traceback, and concurrent appends don't interleave
+            fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, report.encode("utf-8"))
+                os.fsync(fd)
+            finally:
+                os.close(fd)
         except Exception:
             pass
         _msgbox(
@@ -43,6 +71,6 @@ if __name__ == "__main__":
             f"An unexpected error occurred.\n\n"
             f"A log was written to:\n{log_path}\n"
         )
-        traceback.print_exc()
+        sys.stderr.write(report)
         time.sleep(0.3)
         raise
@@ -14,6 +14,7 @@ datas = [
     # Source files
     ('src/gesture_oak/detection/*.py', 'gesture_oak/detection'),
     ('src/gesture_oak/utils/*.py', 'gesture_oak/utils'),
+    ('src/gesture_oak/_bootstrap.py', 'gesture_oak'),
 ]
 
 # Hidden imports that PyInstaller might miss
@@ -33,6 +34,7 @@ hiddenimports = [
     'usb.backend',
     'usb.backend.libusb1',
     'gesture_oak',
+    'gesture_oak._bootstrap',
     'gesture_oak.detection',
     'gesture_oak.detection.rgb_hand_detector',
     'gesture_oak.detection.smart_combined_detector',
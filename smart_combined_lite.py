@@ -4,9 +4,11 @@ Smart Combined Detection - LITE VERSION
 Optimized for slower PCs - Lower resolution, better FPS
 """
 import sys
-import os
 from pathlib import Path
-import shutil
+import threading
+import time
+from collections import deque
+from functools import lru_cache
 
 # Get paths
 if getattr(sys, 'frozen', False):
@@ -16,77 +18,76 @@ else:
     application_path = Path(__file__).parent
     exe_dir = application_path
 
-# Set up model paths
-models_locations = [
-    exe_dir / "models",
-    application_path / "models",
-    application_path / "gesture_oak" / "detection" / "models",
-]
+sys.path.insert(0, str(application_path))
+sys.path.insert(0, str(application_path / "gesture_oak"))
 
-models_source = None
-for loc in models_locations:
-    if loc.exists() and (loc / "palm_detection_sh4.blob").exists():
-        models_source = loc
-        print(f"✓ Models: {loc}")
-        break
+# Find models and copy them where HandTracker expects
+try:
+    from gesture_oak._bootstrap import setup_models
+except ImportError as e:
+    print(f"\n❌ Model setup helper missing from the build: {e}")
+    input("Press Enter to exit...")
+    sys.exit(1)
 
+models_source = setup_models(application_path, exe_dir)
 if models_source is None:
     print("\n❌ Models not found!")
     input("Press Enter to exit...")
     sys.exit(1)
-
-# Copy to temp (where HandTracker expects)
-temp_models = Path(os.environ.get('TEMP', '/tmp')) / "models"
-try:
-    temp_models.mkdir(parents=True, exist_ok=True)
-    for blob_file in models_source.glob("*.blob"):
-        target = temp_models / blob_file.name
-        if not target.exists():
-            shutil.copy2(blob_file, target)
-except Exception as e:
-    print(f"⚠ Copy warning: {e}")
-
-sys.path.insert(0, str(application_path))
-sys.path.insert(0, str(application_path / "gesture_oak"))
+print(f"✓ Models: {models_source}")
 
 import cv2
 import numpy as np
 
+# Drawing ops here are ~1 ms; OpenCV's all-cores default just fights the
+# capture/inference thread for CPU on the small machines this build targets
+cv2.setNumThreads(1)
+cv2.setUseOptimized(True)
+
+# Non-blocking key poll (OpenCV >= 4.5); older builds fall back to waitKey(1)
+poll_key = getattr(cv2, "pollKey", None) or (lambda: cv2.waitKey(1))
+
 try:
     from gesture_oak.detection.rgb_hand_detector import RGBHandDetector
     from gesture_oak.detection.smart_combined_detector import (
         SmartCombinedDetector, DetectionMode, GestureType
     )
+    from gesture_oak.utils.frame_pipeline import LatestFrameWorker
 except ImportError as e:
     print(f"❌ Import Error: {e}")
     input("Press Enter...")
     sys.exit(1)
 
 WRIST, INDEX_TIP = 0, 8
+PALM_CONNECTIONS = np.array([(0,5), (0,9), (0,13), (0,17), (5,9), (9,13), (13,17)], dtype=np.int32)
+
+WRIST_ROTATION, THREE_AREA = DetectionMode.WRIST_ROTATION.value, DetectionMode.THREE_AREA.value
 
+# Colours and overlay labels, built once instead of per frame.
+# Mode/gesture tables are keyed by the enum's int value (read once per frame)
+ZONE_COLORS = {1: (0, 255, 255), 2: (0, 255, 0), 3: (255, 128, 0), 4: (0, 0, 255)}
+AREA_COLORS = {1: (0, 255, 255), 2: (0, 255, 0), 3: (0, 0, 255)}
+MODE_TXT = {WRIST_ROTATION: "Mode: WRIST", THREE_AREA: "Mode: AREA"}
+GEST_TXT = {GestureType.FIST.value: "Gest: FIST", GestureType.OPEN.value: "Gest: OPEN", GestureType.ONE.value: "Gest: ONE"}
 
-def draw_simple_hand(img, hand):
+
+def draw_simple_hand(img, landmarks):
     """Simplified hand drawing - faster"""
-    if not hasattr(hand, 'landmarks') or hand.landmarks is None:
-        return
-    
-    lm = hand.landmarks
+    lm_i = np.rint(landmarks).astype(np.int32)
     # Only draw key points (faster)
-    for i in [0, 4, 8, 12, 16, 20]:  # Just fingertips and wrist
-        cv2.circle(img, tuple(lm[i].astype(int)), 8, (0, 255, 0), -1)
+    for pt in lm_i[[0, 4, 8, 12, 16, 20]].tolist():  # Just fingertips and wrist
+        cv2.circle(img, tuple(pt), 8, (0, 255, 0), -1)
     
-    # Simple palm lines
-    for a, b in [(0,5), (0,9), (0,13), (0,17), (5,9), (9,13), (13,17)]:
-        cv2.line(img, tuple(lm[a].astype(int)), tuple(lm[b].astype(int)), (0, 255, 0), 2)
+    # Simple palm lines, one polylines call
+    cv2.polylines(img, list(lm_i[PALM_CONNECTIONS]), False, (0, 255, 0), 2)
 
 
 def draw_simple_wrist_zones(img, wrist_pt, position):
     """Simplified wrist zones - just show active position"""
     cx, cy = int(wrist_pt[0]), int(wrist_pt[1])
-    colors = {1: (0, 255, 255), 2: (0, 255, 0), 3: (255, 128, 0), 4: (0, 0, 255)}
     
     if position > 0:
-        col = colors[position]
+        col = ZONE_COLORS[position]
         cv2.circle(img, (cx, cy), 80, col, 4)
         cv2.putText(img, str(position), (cx - 20, cy + 10), 
                    cv2.FONT_HERSHEY_SIMPLEX, 2.0, col, 4)
@@ -95,16 +96,57 @@ def draw_simple_wrist_zones(img, wrist_pt, position):
 def draw_simple_areas(img, position):
     """Simplified 3-area display"""
     h, w = img.shape[:2]
-    colors = {1: (0, 255, 255), 2: (0, 255, 0), 3: (0, 0, 255)}
     area_w = w // 3
     
     if position > 0:
         x1 = (position - 1) * area_w
         x2 = position * area_w
-        col = colors[position]
+        col = AREA_COLORS[position]
         cv2.rectangle(img, (x1, 0), (x2, h), col, 8)
 
 
+# Per-mode zone drawing: (img, landmarks, position)
+ZONE_DRAW = {
+    WRIST_ROTATION: lambda img, lm, position: draw_simple_wrist_zones(img, lm[WRIST], position),
+    THREE_AREA: lambda img, lm, position: draw_simple_areas(img, position),
+}
+
+
+@lru_cache(maxsize=64)
+def info_box(mode_txt, gest_txt, position):
+    """Black info box (5,5)-(250,90) with its three lines, rasterised once per combination"""
+    box = np.zeros((86, 246, 3), dtype=np.uint8)
+    cv2.putText(box, mode_txt, (5, 25), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+    cv2.putText(box, gest_txt, (5, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+    cv2.putText(box, f"Pos: {position}", (5, 75), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
+    return box
+
+
+def draw_overlay(display, hand, mode, gesture, position):
+    """Zones, hand and info text for one frame"""
+    h, w = display.shape[:2]
+    if hand is not None:
+        m = mode.value
+        # SIMPLIFIED DRAWING (faster)
+        draw_zones = ZONE_DRAW.get(m)
+        if draw_zones is not None:
+            draw_zones(display, hand.landmarks, position)
+        
+        draw_simple_hand(display, hand.landmarks)
+        
+        # Minimal info overlay: opaque box, pasted from cache
+        display[5:91, 5:251] = info_box(MODE_TXT.get(m, "Mode: ?"), GEST_TXT.get(gesture.value, "Gest: ?"), position)
+        
+        # Big position indicator
+        if position > 0:
+            col = ZONE_COLORS.get(position, (255, 255, 255))
+            cv2.putText(display, str(position), (w - 80, h - 30), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 2.5, col, 6)
+    else:
+        cv2.putText(display, "SHOW HAND", (w//2 - 100, h//2), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 255), 2)
+
+
 def main():
     print("="*70)
     print("SMART COMBINED DETECTION - LITE VERSION")
@@ -127,7 +169,8 @@ def main():
             fps=TARGET_FPS, 
             resolution=(WIDTH, HEIGHT), 
             pd_score_thresh=PD_THRESH, 
-            use_gesture=False
+            use_gesture=False,
+            mirror=True
         )
     except Exception as e:
         print(f"❌ Init failed: {e}")
@@ -142,76 +185,79 @@ def main():
     combined = SmartCombinedDetector(resolution=(WIDTH, HEIGHT))
     print("✓ Ready!\n")
     
-    # Performance tracking
-    frame_times = []
+    reset_requested = threading.Event()
+    
+    def capture():
+        """Capture thread: grab, mirror and classify the next frame"""
+        frame, hands, _ = detector.get_frame_and_hands()
+        if frame is None:
+            return None
+        
+        # Frames and landmarks arrive already mirrored (mirror=True on the camera)
+        h, w = frame.shape[:2]
+        
+        if reset_requested.is_set():  # 'r' pressed; reset on this thread
+            reset_requested.clear()
+            combined.reset()
+        
+        hand = hands[0] if hands else None
+        mode, gesture, position, angle = combined.update(hand, w, h)
+        return frame, hand, mode, gesture, position, angle
     
+    # Performance tracking (last 30 frames, running sum instead of re-summing)
+    frame_times = deque(maxlen=30)
+    frame_time_sum = 0.0
+    shown_fps, fps_txt = None, ""
+    frame_period = 1.0 / TARGET_FPS
+    t_prev_frame = None  # when the previous frame was taken off the worker
+    
+    # Capture + detection run on a worker thread; this thread only draws
+    worker = LatestFrameWorker(capture).start()
     try:
         while True:
-            import time
             t_start = time.time()
             
-            frame, hands, _ = detector.get_frame_and_hands()
-            if frame is None:
+            item = worker.get()
+            if item is None:
+                # No frame yet: keep the window responsive and 'q' working during a stall
+                if (poll_key() & 0xFF) == ord('q'):
+                    break
                 continue
             
-            frame = cv2.flip(frame, 1)
+            frame, hand, mode, gesture, position, angle = item
             h, w = frame.shape[:2]
             
-            for hand in hands:
-                if hasattr(hand, 'landmarks') and hand.landmarks is not None:
-                    hand.landmarks[:, 0] = w - hand.landmarks[:, 0]
-            
-            # Use original frame (no copying for performance)
-            display = frame
-            hand = hands[0] if hands else None
-            mode, gesture, position, angle = combined.update(hand, w, h)
-            
-            if hand is not None:
-                # SIMPLIFIED DRAWING (faster)
-                if mode == DetectionMode.WRIST_ROTATION:
-                    draw_simple_wrist_zones(display, hand.landmarks[WRIST], position)
-                elif mode == DetectionMode.THREE_AREA:
-                    draw_simple_areas(display, position)
-                
-                draw_simple_hand(display, hand)
-                
-                # Minimal info overlay
-                mode_txt = "WRIST" if mode == DetectionMode.WRIST_ROTATION else "AREA" if mode == DetectionMode.THREE_AREA else "?"
-                gest_txt = "FIST" if gesture == GestureType.FIST else "OPEN" if gesture == GestureType.OPEN else "ONE" if gesture == GestureType.ONE else "?"
-                
-                # Simple text overlay
-                cv2.rectangle(display, (5, 5), (250, 90), (0, 0, 0), -1)
-                cv2.putText(display, f"Mode: {mode_txt}", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
-                cv2.putText(display, f"Gest: {gest_txt}", (10, 55), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-                cv2.putText(display, f"Pos: {position}", (10, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
-                
-                # Big position indicator
-                if position > 0:
-                    colors = {1: (0, 255, 255), 2: (0, 255, 0), 3: (255, 128, 0), 4: (0, 0, 255)}
-                    col = colors.get(position, (255, 255, 255))
-                    cv2.putText(display, str(position), (w - 80, h - 30), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 2.5, col, 6)
-            else:
-                cv2.putText(display, "SHOW HAND", (w//2 - 100, h//2), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 255), 2)
+            # Frame-to-frame time: capture, draw, display and pacing included
+            now = time.time()
+            dt = now - t_prev_frame if t_prev_frame is not None else 0.0
+            t_prev_frame = now
             
             # FPS (track last 30 frames)
-            frame_times.append(time.time() - t_start)
-            if len(frame_times) > 30:
-                frame_times.pop(0)
-            avg_time = sum(frame_times) / len(frame_times)
-            current_fps = 1.0 / avg_time if avg_time > 0 else 0
+            if dt > 0:
+                if len(frame_times) == frame_times.maxlen:
+                    frame_time_sum -= frame_times[0]  # about to be evicted
+                frame_times.append(dt)
+                frame_time_sum += dt
+                current_fps = round(len(frame_times) / frame_time_sum, 1)
+                if current_fps != shown_fps:  # only re-format when the displayed value changes
+                    shown_fps, fps_txt = current_fps, f"FPS: {current_fps:.1f}"
             
-            cv2.putText(display, f"FPS: {current_fps:.1f}", (w - 120, 25), 
+            # Use original frame (no copying for performance)
+            display = frame
+            draw_overlay(display, hand, mode, gesture, position)
+            cv2.putText(display, fps_txt, (w - 120, 25), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-            
             cv2.imshow("Smart Combined (LITE)", display)
             
-            key = cv2.waitKey(1) & 0xFF
+            # Pace the UI to TARGET_FPS, then poll keys without waitKey's forced tick
+            remaining = frame_period - (time.time() - t_start)
+            if remaining > 0:
+                time.sleep(remaining)
+            key = poll_key() & 0xFF
             if key == ord('q'):
                 break
             elif key == ord('r'):
-                combined.reset()
+                reset_requested.set()
     
     except KeyboardInterrupt:
         print("\nStopped")
@@ -221,6 +267,7 @@ def main():
         traceback.print_exc()
         input("Press Enter...")
     finally:
+        worker.stop()
         detector.close()
         cv2.destroyAllWindows()
         print("Done!")
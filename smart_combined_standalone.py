@@ -5,8 +5,9 @@ Properly handles model file locations for PyInstaller
 """
 import sys
 import os
+import math
 from pathlib import Path
-import shutil
+import threading
 
 # Get paths
 if getattr(sys, 'frozen', False):
@@ -18,62 +19,51 @@ else:
     application_path = Path(__file__).parent
     exe_dir = application_path
 
-# Set up model paths BEFORE importing anything
-# Priority: 1. Next to EXE, 2. In bundle, 3. In detection folder
-models_locations = [
-    exe_dir / "models",                          # Next to EXE (BEST)
-    application_path / "models",                 # Inside bundle
-    application_path / "gesture_oak" / "detection" / "models",  # In detection
-]
+# Add paths
+sys.path.insert(0, str(application_path))
+sys.path.insert(0, str(application_path / "gesture_oak"))
 
-# Find models
-models_source = None
-for loc in models_locations:
-    if loc.exists() and (loc / "palm_detection_sh4.blob").exists():
-        models_source = loc
-        print(f"✓ Found models at: {loc}")
-        break
+# Set up models BEFORE importing anything heavy
+# Priority: 1. Next to EXE, 2. In bundle, 3. In detection folder
+try:
+    from gesture_oak._bootstrap import model_locations, setup_models
+except ImportError as e:
+    print("\n❌ ERROR: Model setup helper not found!")
+    print(f"Details: {e}")
+    print("\nThe build is missing gesture_oak/_bootstrap.py; rebuild with smart_combined.spec.")
+    input("\nPress Enter to exit...")
+    sys.exit(1)
 
+models_source = setup_models(application_path, exe_dir)
 if models_source is None:
     print("\n❌ ERROR: Model files not found!")
     print("Searched in:")
-    for loc in models_locations:
+    for loc in model_locations(application_path, exe_dir):
         print(f"  - {loc}")
     print("\nMake sure models folder is next to the EXE:")
     print(f"  {exe_dir / 'models'}")
     input("\nPress Enter to exit...")
     sys.exit(1)
-
-# Copy models to detection folder if needed (for HandTracker)
-detection_models = application_path / "gesture_oak" / "detection" / "models"
-temp_models = Path(os.environ.get('TEMP', '/tmp')) / "models"
-
-# Copy to both locations
-for target_dir in [detection_models, temp_models]:
-    if not target_dir.exists() or not (target_dir / "palm_detection_sh4.blob").exists():
-        try:
-            target_dir.mkdir(parents=True, exist_ok=True)
-            for blob_file in models_source.glob("*.blob"):
-                target_file = target_dir / blob_file.name
-                if not target_file.exists():
-                    shutil.copy2(blob_file, target_file)
-            print(f"✓ Copied models to: {target_dir}")
-        except Exception as e:
-            print(f"⚠ Could not copy models to {target_dir}: {e}")
-
-# Add paths
-sys.path.insert(0, str(application_path))
-sys.path.insert(0, str(application_path / "gesture_oak"))
+print(f"✓ Found models at: {models_source}")
 
 # Now import
 import cv2
 import numpy as np
 
+# Leave cores for the capture/inference thread instead of OpenCV's all-cores default
+cv2.setNumThreads(max(1, min(4, (os.cpu_count() or 2) // 2)))
+cv2.setUseOptimized(True)
+
+# Non-blocking key poll (OpenCV >= 4.5); older builds fall back to waitKey(1)
+poll_key = getattr(cv2, "pollKey", None) or (lambda: cv2.waitKey(1))
+
 try:
     from gesture_oak.detection.rgb_hand_detector import RGBHandDetector
     from gesture_oak.detection.smart_combined_detector import (
         SmartCombinedDetector, DetectionMode, GestureType
     )
+    from gesture_oak.utils.frame_pipeline import LatestFrameWorker, FrameSaver
+    from gesture_oak.utils.text_cache import put_cached_text
 except ImportError as e:
     print(f"❌ Import Error: {e}")
     print(f"Application path: {application_path}")
@@ -83,64 +73,78 @@ except ImportError as e:
 
 # Landmarks
 WRIST, INDEX_TIP = 0, 8
+HAND_CONNECTIONS = np.array([
+    (0,1),(1,2),(2,3),(3,4), (0,5),(5,6),(6,7),(7,8),
+    (0,9),(9,10),(10,11),(11,12), (0,13),(13,14),(14,15),(15,16),
+    (0,17),(17,18),(18,19),(19,20), (5,9),(9,13),(13,17)
+], dtype=np.int32)
 
 
-def draw_hand_skeleton(img, hand):
+def draw_hand_skeleton(img, landmarks):
     """Draw hand skeleton"""
-    if not hasattr(hand, 'landmarks') or hand.landmarks is None:
-        return
+    lm_i = np.rint(landmarks).astype(np.int32)
+    # All 23 bones in one call: lm_i[HAND_CONNECTIONS] is (23, 2, 2) = 23 two-point polylines
+    cv2.polylines(img, list(lm_i[HAND_CONNECTIONS]), False, (0, 255, 0), 2)
     
-    lm = hand.landmarks
-    connections = [
-        (0,1),(1,2),(2,3),(3,4), (0,5),(5,6),(6,7),(7,8),
-        (0,9),(9,10),(10,11),(11,12), (0,13),(13,14),(14,15),(15,16),
-        (0,17),(17,18),(18,19),(19,20), (5,9),(9,13),(13,17)
-    ]
-    
-    for a, b in connections:
-        cv2.line(img, tuple(lm[a].astype(int)), tuple(lm[b].astype(int)), (0, 255, 0), 2)
-    
-    for i, pt in enumerate(lm):
+    for i, pt in enumerate(map(tuple, lm_i.tolist())):
         r = 6 if i in [0, 4, 8, 12, 16, 20] else 4
         col = (0, 0, 255) if i in [0, 4, 8, 12, 16, 20] else (255, 255, 255)
-        cv2.circle(img, tuple(pt.astype(int)), r, col, -1)
+        cv2.circle(img, pt, r, col, -1)
+
+
+def _arc_offsets(angles_deg, radius):
+    """Pixel offsets from the wrist for detector angles (0° = right, 180° = left, up is -y)"""
+    rad = np.radians(180.0 - np.asarray(angles_deg, dtype=np.float64))
+    return np.stack([radius * np.cos(rad), -radius * np.sin(rad)], axis=-1).astype(np.int32)
+
+
+# Wrist zone geometry is fixed, so it is built once here rather than per frame
+ZONE_RADIUS = 200
+ZONE_BOUNDARIES = [0, 60, 90, 120, 180]
+ZONE_COLORS = {1: (0, 255, 255), 2: (0, 255, 0), 3: (255, 128, 0), 4: (0, 0, 255)}
+# Per zone: fill polygon = centre point + arc sampled every 5°
+ZONE_POLYS = [np.vstack([np.zeros((1, 2), np.int32),
+                         _arc_offsets(np.arange(start, end + 1, 5), ZONE_RADIUS)])
+              for start, end in zip(ZONE_BOUNDARIES[:-1], ZONE_BOUNDARIES[1:])]
+# Scratch buffer for the translated fill polygon (UI thread only, never shared)
+_ZONE_PTS_BUF = np.empty((max(len(p) for p in ZONE_POLYS), 2), dtype=np.int32)
+# Boundary spoke end points and zone label positions (60% of the way out)
+ZONE_EDGES = [tuple(map(int, off)) for off in _arc_offsets(ZONE_BOUNDARIES, ZONE_RADIUS)]
+ZONE_LABELS = [(0.6 * off).tolist() for off in _arc_offsets(
+    [(start + end) / 2 for start, end in zip(ZONE_BOUNDARIES[:-1], ZONE_BOUNDARIES[1:])], ZONE_RADIUS)]
 
 
 def draw_wrist_rotation_zones(img, wrist_pt, angle, current_position):
     """Draw 4-position wrist rotation zones"""
     cx, cy = int(wrist_pt[0]), int(wrist_pt[1])
-    radius = 200
-    boundaries = [0, 60, 90, 120, 180]
-    zone_colors = {1: (0, 255, 255), 2: (0, 255, 0), 3: (255, 128, 0), 4: (0, 0, 255)}
-    
-    def angle_to_point(angle_deg):
-        screen_angle = 180.0 - angle_deg
-        rad = np.radians(screen_angle)
-        return (cx + int(radius * np.cos(rad)), cy - int(radius * np.sin(rad)))
     
     for zone_num in range(1, 5):
-        start_angle, end_angle = boundaries[zone_num - 1], boundaries[zone_num]
-        color = zone_colors[zone_num]
+        start_angle, end_angle = ZONE_BOUNDARIES[zone_num - 1], ZONE_BOUNDARIES[zone_num]
+        color = ZONE_COLORS[zone_num]
         
         if zone_num == current_position:
-            overlay = img.copy()
-            pts = [np.array([cx, cy])]
-            for a in range(int(start_angle), int(end_angle) + 1, 5):
-                pts.append(np.array(angle_to_point(a)))
-            cv2.fillPoly(overlay, [np.array(pts, dtype=np.int32)], color)
-            cv2.addWeighted(overlay, 0.3, img, 0.7, 0, img)
+            # Blend only inside the slice's bounding box (clipped to the image)
+            poly = ZONE_POLYS[zone_num - 1]
+            pts = np.add(poly, (cx, cy), out=_ZONE_PTS_BUF[:len(poly)])
+            x, y, bw, bh = cv2.boundingRect(pts)
+            x0, y0 = max(x, 0), max(y, 0)
+            x1, y1 = min(x + bw, img.shape[1]), min(y + bh, img.shape[0])
+            if x1 > x0 and y1 > y0:
+                roi = img[y0:y1, x0:x1]
+                overlay = roi.copy()
+                cv2.fillPoly(overlay, [pts], color, offset=(-x0, -y0))
+                cv2.addWeighted(overlay, 0.3, roi, 0.7, 0, roi)
         
-        cv2.line(img, (cx, cy), angle_to_point(start_angle), (200, 200, 200), 2)
-        cv2.line(img, (cx, cy), angle_to_point(end_angle), (200, 200, 200), 2)
-        cv2.ellipse(img, (cx, cy), (radius, radius), 0, -int(end_angle), -int(start_angle), (200, 200, 200), 2)
+        for dx, dy in (ZONE_EDGES[zone_num - 1], ZONE_EDGES[zone_num]):
+            cv2.line(img, (cx, cy), (cx + dx, cy + dy), (200, 200, 200), 2)
+        cv2.ellipse(img, (cx, cy), (ZONE_RADIUS, ZONE_RADIUS), 0, -end_angle, -start_angle, (200, 200, 200), 2)
         
-        mid_angle = (start_angle + end_angle) / 2
-        label_pt = angle_to_point(mid_angle)
-        label_pt = (int(label_pt[0] * 0.6 + cx * 0.4), int(label_pt[1] * 0.6 + cy * 0.4))
-        cv2.putText(img, str(zone_num), label_pt, cv2.FONT_HERSHEY_SIMPLEX, 1.2, color, 3)
+        lx, ly = ZONE_LABELS[zone_num - 1]
+        cv2.putText(img, str(zone_num), (int(cx + lx), int(cy + ly)), cv2.FONT_HERSHEY_SIMPLEX, 1.2, color, 3)
     
     if angle is not None:
-        angle_pt = angle_to_point(angle)
+        rad = math.radians(180.0 - angle)  # scalar: math is far cheaper than NumPy ufuncs
+        angle_pt = (cx + int(ZONE_RADIUS * math.cos(rad)), cy - int(ZONE_RADIUS * math.sin(rad)))
         cv2.line(img, (cx, cy), angle_pt, (255, 255, 255), 3)
         cv2.circle(img, angle_pt, 8, (0, 255, 0), -1)
     
@@ -148,23 +152,39 @@ def draw_wrist_rotation_zones(img, wrist_pt, angle, current_position):
     cv2.circle(img, (cx, cy), 10, (0, 0, 0), 2)
 
 
+AREA_COLORS = {1: (0, 255, 255), 2: (0, 255, 0), 3: (0, 0, 255)}
+AREA_LABELS = {n: f"Area {n}" for n in AREA_COLORS}
+
+# Info panel labels/colours, looked up per frame instead of rebuilt.
+# Keyed by the enums' int values, read once per frame
+WRIST_ROTATION, THREE_AREA = DetectionMode.WRIST_ROTATION.value, DetectionMode.THREE_AREA.value
+MODE_TEXT = {WRIST_ROTATION: ("Mode: WRIST ROTATION", (0, 255, 255)),
+             THREE_AREA: ("Mode: 3-AREA POINTING", (255, 128, 255))}
+GEST_TEXT = {GestureType.FIST.value: ("Gesture: FIST", (0, 0, 255)),
+             GestureType.OPEN.value: ("Gesture: OPEN", (0, 255, 0)),
+             GestureType.ONE.value: ("Gesture: ONE", (255, 0, 255))}
+POS_TEXT = {**{(WRIST_ROTATION, p): f"Pos: {p}/4" for p in range(5)},
+            **{(THREE_AREA, p): f"Area: {p}/3" for p in range(4)}}
+POS_COLORS = {WRIST_ROTATION: ZONE_COLORS}  # anything else: AREA_COLORS
+
+
 def draw_three_area_zones(img, index_tip, current_area):
     """Draw 3 vertical area zones"""
     h, w = img.shape[:2]
     area_width = w // 3
-    area_colors = {1: (0, 255, 255), 2: (0, 255, 0), 3: (0, 0, 255)}
     
     for area_num in range(1, 4):
         x1, x2 = (area_num - 1) * area_width, area_num * area_width
-        color = area_colors[area_num]
+        color = AREA_COLORS[area_num]
         
         if area_num == current_area:
-            overlay = img.copy()
-            cv2.rectangle(overlay, (x1, 0), (x2, h), color, -1)
-            cv2.addWeighted(overlay, 0.2, img, 0.8, 0, img)
+            roi = img[:, x1:x2 + 1]
+            overlay = roi.copy()
+            overlay[:] = color
+            cv2.addWeighted(overlay, 0.2, roi, 0.8, 0, roi)
         
         cv2.rectangle(img, (x1, 0), (x2, h), color, 3)
-        cv2.putText(img, f"Area {area_num}", (x1 + area_width // 2 - 20, 50),
+        cv2.putText(img, AREA_LABELS[area_num], (x1 + area_width // 2 - 20, 50),
                    cv2.FONT_HERSHEY_SIMPLEX, 1.0, color, 3)
     
     if index_tip is not None:
@@ -173,6 +193,13 @@ def draw_three_area_zones(img, index_tip, current_area):
         cv2.circle(img, (tip_x, tip_y), 5, (255, 0, 255), -1)
 
 
+# Per-mode zone drawing: (img, landmarks, position, angle)
+ZONE_DRAW = {
+    WRIST_ROTATION: lambda img, lm, position, angle: draw_wrist_rotation_zones(img, lm[WRIST], angle, position),
+    THREE_AREA: lambda img, lm, position, angle: draw_three_area_zones(img, lm[INDEX_TIP], position),
+}
+
+
 def main():
     print("="*80)
     print("SMART COMBINED DETECTION - STANDALONE")
@@ -183,7 +210,7 @@ def main():
     
     print("\nInitializing...")
     try:
-        detector = RGBHandDetector(fps=30, resolution=(1280, 720), pd_score_thresh=0.5, use_gesture=False)
+        detector = RGBHandDetector(fps=30, resolution=(1280, 720), pd_score_thresh=0.5, use_gesture=False, mirror=True)
     except Exception as e:
         print(f"\n❌ Failed to initialize: {e}")
         print("\nMake sure OAK-D camera is connected to USB 3.0 port")
@@ -199,61 +226,73 @@ def main():
     print("✓ All systems ready!\n")
     
     saved_count = 0
+    saver = FrameSaver()  # 's' snapshots are encoded/written off this thread
+    shown_fps, fps_text = None, ""
+    reset_requested = threading.Event()
     
+    def capture():
+        """Capture thread: grab, mirror and classify the next frame"""
+        frame, hands, _ = detector.get_frame_and_hands()
+        if frame is None:
+            return None
+        
+        # Frames and landmarks arrive already mirrored (mirror=True on the camera)
+        h, w = frame.shape[:2]
+        
+        if reset_requested.is_set():  # 'r' pressed; reset on this thread
+            reset_requested.clear()
+            combined.reset()
+        
+        hand = hands[0] if hands else None
+        mode, gesture, position, angle = combined.update(hand, w, h)
+        return frame, hand, mode, gesture, position, angle
+    
+    # Capture + detection run on a worker thread; this thread only draws
+    worker = LatestFrameWorker(capture).start()
     try:
         while True:
-            frame, hands, _ = detector.get_frame_and_hands()
-            if frame is None:
+            item = worker.get()
+            if item is None:
+                # No frame yet: keep the window responsive and 'q' working during a stall
+                if (poll_key() & 0xFF) == ord('q'):
+                    break
                 continue
             
-            frame = cv2.flip(frame, 1)
+            frame, hand, mode, gesture, position, angle = item
             h, w = frame.shape[:2]
             
-            for hand in hands:
-                if hasattr(hand, 'landmarks') and hand.landmarks is not None:
-                    hand.landmarks[:, 0] = w - hand.landmarks[:, 0]
-            
-            display = frame.copy()
-            hand = hands[0] if hands else None
-            mode, gesture, position, angle = combined.update(hand, w, h)
+            display = frame  # the capture thread hands over a fresh frame, draw on it directly
             
             if hand is not None:
-                wrist_pt, index_tip = hand.landmarks[WRIST], hand.landmarks[INDEX_TIP]
-                
-                if mode == DetectionMode.WRIST_ROTATION:
-                    draw_wrist_rotation_zones(display, wrist_pt, angle, position)
-                    draw_hand_skeleton(display, hand)
-                elif mode == DetectionMode.THREE_AREA:
-                    draw_three_area_zones(display, index_tip, position)
-                    draw_hand_skeleton(display, hand)
-                else:
-                    draw_hand_skeleton(display, hand)
+                m = mode.value
+                draw_zones = ZONE_DRAW.get(m)
+                if draw_zones is not None:
+                    draw_zones(display, hand.landmarks, position, angle)
+                draw_hand_skeleton(display, hand.landmarks)
                 
                 # Info panel
-                overlay = display.copy()
-                cv2.rectangle(overlay, (10, 10), (450, 170), (0, 0, 0), -1)
-                cv2.addWeighted(overlay, 0.7, display, 0.3, 0, display)
+                # 70% black over the panel area only, i.e. darken it to 30%
+                panel = display[10:171, 10:451]
+                panel[:] = cv2.convertScaleAbs(panel, alpha=0.3)
                 
                 y = 40
-                mode_text = "WRIST ROTATION" if mode == DetectionMode.WRIST_ROTATION else "3-AREA POINTING" if mode == DetectionMode.THREE_AREA else "UNKNOWN"
-                mode_color = (0, 255, 255) if mode == DetectionMode.WRIST_ROTATION else (255, 128, 255) if mode == DetectionMode.THREE_AREA else (128, 128, 128)
-                cv2.putText(display, f"Mode: {mode_text}", (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.7, mode_color, 2)
+                mode_text, mode_color = MODE_TEXT.get(m, ("Mode: UNKNOWN", (128, 128, 128)))
+                put_cached_text(display, mode_text, (20, y), 0.7, mode_color, 2)
                 y += 35
                 
-                gest_text = "FIST" if gesture == GestureType.FIST else "OPEN" if gesture == GestureType.OPEN else "ONE" if gesture == GestureType.ONE else "?"
-                gest_color = (0, 0, 255) if gesture == GestureType.FIST else (0, 255, 0) if gesture == GestureType.OPEN else (255, 0, 255) if gesture == GestureType.ONE else (128, 128, 128)
-                cv2.putText(display, f"Gesture: {gest_text}", (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.7, gest_color, 2)
+                gest_text, gest_color = GEST_TEXT.get(gesture.value, ("Gesture: ?", (128, 128, 128)))
+                put_cached_text(display, gest_text, (20, y), 0.7, gest_color, 2)
                 y += 35
                 
-                pos_text = f"Pos: {position}/4" if mode == DetectionMode.WRIST_ROTATION else f"Area: {position}/3" if mode == DetectionMode.THREE_AREA else "Pos: --"
-                cv2.putText(display, pos_text, (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
+                pos_text = POS_TEXT.get((m, position), "Pos: --")
+                put_cached_text(display, pos_text, (20, y), 0.7, (255, 255, 0), 2)
                 y += 35
                 
-                if mode == DetectionMode.WRIST_ROTATION and angle is not None:
+                if m == WRIST_ROTATION and angle is not None:
                     cv2.putText(display, f"Angle: {angle:.1f}°", (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 128, 0), 2)
                 
                 # Large position indicator
-                pos_colors = {1: (0, 255, 255), 2: (0, 255, 0), 3: (255, 128, 0), 4: (0, 0, 255)} if mode == DetectionMode.WRIST_ROTATION else {1: (0, 255, 255), 2: (0, 255, 0), 3: (0, 0, 255)}
+                pos_colors = POS_COLORS.get(m, AREA_COLORS)
                 if position > 0:
                     col = pos_colors.get(position, (255, 255, 255))
                     cv2.putText(display, str(position), (w - 110, h - 50), cv2.FONT_HERSHEY_SIMPLEX, 3.0, col, 7)
@@ -261,19 +300,20 @@ def main():
             else:
                 cv2.putText(display, "SHOW YOUR HAND", (w//2 - 160, h//2), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 255), 3)
             
-            fps = detector.fps_counter.get_global()
-            cv2.putText(display, f"FPS: {fps:.1f}", (w - 140, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+            fps = round(detector.fps_counter.get_global(), 1)
+            if fps != shown_fps:  # only re-format when the displayed value changes
+                shown_fps, fps_text = fps, f"FPS: {fps:.1f}"
+            cv2.putText(display, fps_text, (w - 140, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
             
             cv2.imshow("Smart Combined Detection", display)
             
-            key = cv2.waitKey(1) & 0xFF
+            key = poll_key() & 0xFF
             if key == ord('q'):
                 break
             elif key == ord('r'):
-                combined.reset()
+                reset_requested.set()
             elif key == ord('s'):
-                cv2.imwrite(f"screenshot_{saved_count:04d}.jpg", display)
-                print(f"💾 Saved screenshot_{saved_count:04d}.jpg")
+                saver.save(f"screenshot_{saved_count:04d}.jpg", display)
                 saved_count += 1
     
     except KeyboardInterrupt:
@@ -284,6 +324,8 @@ def main():
         traceback.print_exc()
         input("\nPress Enter to exit...")
     finally:
+        worker.stop()
+        saver.close()
         detector.close()
         cv2.destroyAllWindows()
         print("✓ Done!")
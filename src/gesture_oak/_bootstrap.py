@@ -0,0 +1,67 @@
+# src/gesture_oak/_bootstrap.py
+"""
+Model setup shared by the standalone launchers (smart_combined_*.py)
+
+HandTracker loads its blobs from <gesture_oak>/../../models. From source that
+is the repo's models/ folder; in a PyInstaller onefile build it is
+%TEMP%/models, outside the bundle, so the blobs are copied there first.
+"""
+import os
+import shutil
+from pathlib import Path
+
+CHECK_BLOB = "palm_detection_sh4.blob"
+
+# Same rule as HandTracker.MODELS_DIR (detection/../../../models)
+TRACKER_MODELS_DIR = Path(__file__).resolve().parent.parent.parent / "models"
+
+
+def model_locations(application_path: Path, exe_dir: Path):
+    """Where to look for the blobs, best first"""
+    return [
+        exe_dir / "models",                                         # Next to EXE (BEST)
+        application_path / "models",                                # Inside bundle
+        application_path / "gesture_oak" / "detection" / "models",  # In detection
+    ]
+
+
+def _place(src: Path, dst: Path):
+    """Hard-link src to dst (instant, no data copied); copy when linking isn't possible"""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:  # other volume, FAT32, no permission...
+        shutil.copy2(src, dst)
+
+
+def sync_blobs(source: Path, target: Path) -> int:
+    """Link/copy *.blob from source to target, skipping files already there with the same size"""
+    if target.resolve() == source.resolve():
+        return 0
+    target.mkdir(parents=True, exist_ok=True)
+    copied = 0
+    for blob_file in source.glob("*.blob"):
+        target_file = target / blob_file.name
+        if target_file.exists() and target_file.stat().st_size == blob_file.stat().st_size:
+            continue
+        _place(blob_file, target_file)
+        copied += 1
+    return copied
+
+
+def setup_models(application_path: Path, exe_dir: Path):
+    """
+    Find the model folder and make its blobs visible to HandTracker.
+    Returns the folder the models were found in, or None if there is none.
+    """
+    for loc in model_locations(application_path, exe_dir):
+        if (loc / CHECK_BLOB).exists():
+            break
+    else:
+        return None
+    try:
+        if sync_blobs(loc, TRACKER_MODELS_DIR):
+            print(f"✓ Copied models to: {TRACKER_MODELS_DIR}")
+    except OSError as e:
+        print(f"⚠ Could not copy models to {TRACKER_MODELS_DIR}: {e}")
+    return loc
@@ -1,6 +1,11 @@
 # src/gesture_oak/apps/hand_tracking_app.py
 #!/usr/bin/env python3
 import os
+import sys
+import queue
+import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener
 import cv2
 cv2.setUseOptimized(True)
 cv2.setNumThreads(0)  # let OpenCV choose best for this process
@@ -9,68 +14,96 @@ from pathlib import Path
 from ..detection.hand_detector import HandDetector
 from ..detection.swipe_detector import SwipeDetector
 from ..utils import mediapipe_utils as mpu
+from ..utils.frame_pipeline import LatestFrameWorker, FrameSaver
+from ..utils.display import open_window, poll_key
+from ..utils.text_cache import put_cached_text, put_label_value
+
+# Set from outside (run_hand_tracking's SIGTERM/SIGINT handler, or the launcher
+# when it hosts main() on a thread) to end the frame loop; checking it is a
+# plain memory read, unlike the stop flag file.
+stop_event = threading.Event()
+
+# Per-hand detection log. Off by default (it used to be a print + flush per
+# hand every other frame); OAK_HAND_LOG=1 turns it on, and the lines are then
+# written by the QueueListener thread, not the frame loop.
+log = logging.getLogger(__name__)
+log.setLevel(logging.WARNING)
+if os.environ.get("OAK_HAND_LOG", "0") == "1":
+    log.setLevel(logging.DEBUG)
+    _log_queue = queue.SimpleQueue()
+    log.addHandler(QueueHandler(_log_queue))
+    QueueListener(_log_queue, logging.StreamHandler(sys.stdout)).start()
+
+WINDOW_NAME = "OAK-D Hand Detection with Swipe"
+
+# HUD text layout (left column, fixed positions)
+WHITE = (255, 255, 255)
+HANDS_POS = (10, 60)
+SWIPES_POS = (10, 90)
+STATE_POS = (10, 120)
+DISTANCE_POS = (10, 150)
+VELOCITY_POS = (10, 180)
+PROGRESS_POS = (10, 210)
+DEPTH_POS = (10, 450)
+
+# Wrist + fingertips, drawn as bigger blue dots over the green ones
+KEY_LANDMARKS = [0, 4, 8, 12, 16, 20]
+
+def _dots(pts):
+    """Points as zero-length 2-point polylines: with a thick pen each one is a
+    filled round dot of radius thickness/2, so a whole set is one polylines call"""
+    return list(np.repeat(pts[:, None, :], 2, axis=1))
 
 def draw_hand_landmarks(frame, hand):
     """Draw hand landmarks and bounding box on frame"""
+    # One getattr per field (HandRegion attributes are set dynamically, so
+    # any of them may be missing)
+    landmarks = getattr(hand, 'landmarks', None)
+    rect_points = getattr(hand, 'rect_points_i32', None)
+    if rect_points is None:
+        rect_points = getattr(hand, 'rect_points', None)
+    cx = getattr(hand, 'rect_x_center_a', None)
+    gesture = getattr(hand, 'gesture', None)
+
     # Draw landmarks
-    if hasattr(hand, 'landmarks') and hand.landmarks is not None:
-        for idx, landmark in enumerate(hand.landmarks):
-            x, y = int(landmark[0]), int(landmark[1])
-            cv2.circle(frame, (x, y), 3, (0, 255, 0), -1)
-            if idx in [0, 4, 8, 12, 16, 20]:  # Fingertips and wrist
-                cv2.circle(frame, (x, y), 5, (255, 0, 0), -1)
+    if landmarks is not None:
+        pts = np.asarray(landmarks[:, :2], dtype=np.int32)
+        cv2.polylines(frame, _dots(pts), False, (0, 255, 0), 6)
+        cv2.polylines(frame, _dots(pts[KEY_LANDMARKS]), False, (255, 0, 0), 10)
 
     # Draw bounding box
-    if hasattr(hand, 'rect_points') and hand.rect_points is not None:
-        points = np.array(hand.rect_points, dtype=np.int32)
-        cv2.polylines(frame, [points], True, (0, 255, 255), 2)
+    if rect_points is not None:
+        cv2.polylines(frame, [np.asarray(rect_points, dtype=np.int32)], True, (0, 255, 255), 2)
+
+    # Text is anchored on the rotated rect; nothing to place it with otherwise
+    if cx is None:
+        return
+    x = int(cx - hand.rect_w_a // 2)
 
     # Draw label and confidence with depth info
-    if hasattr(hand, 'label') and hasattr(hand, 'lm_score'):
+    label = getattr(hand, 'label', None)
+    lm_score = getattr(hand, 'lm_score', None)
+    if label is not None and lm_score is not None:
+        depth = getattr(hand, 'depth', None)
+        depth_conf = getattr(hand, 'depth_confidence', None)
         depth_info = ""
-        if hasattr(hand, 'depth'):
-            depth_info = f" D:{hand.depth:.0f}mm"
-        if hasattr(hand, 'depth_confidence'):
-            depth_info += f" C:{hand.depth_confidence:.2f}"
-        label_text = f"{hand.label}: {hand.lm_score:.2f}{depth_info}"
-        if hasattr(hand, 'rect_x_center_a'):
-            x = int(hand.rect_x_center_a - hand.rect_w_a // 2)
-            y = int(hand.rect_y_center_a - hand.rect_h_a // 2 - 10)
-            cv2.putText(
-                frame, label_text, (x, y), cv2.FONT_HERSHEY_SIMPLEX,
-                0.5, (255, 255, 0), 2
-            )
+        if depth is not None:
+            depth_info = f" D:{depth:.0f}mm"
+        if depth_conf is not None:
+            depth_info += f" C:{depth_conf:.2f}"
+        y = int(hand.rect_y_center_a - hand.rect_h_a // 2 - 10)
+        cv2.putText(
+            frame, f"{label}: {lm_score:.2f}{depth_info}", (x, y), cv2.FONT_HERSHEY_SIMPLEX,
+            0.5, (255, 255, 0), 2
+        )
 
     # Draw gesture if available
-    if hasattr(hand, 'gesture') and hand.gesture is not None:
-        if hasattr(hand, 'rect_x_center_a'):
-            x = int(hand.rect_x_center_a - hand.rect_w_a // 2)
-            y = int(hand.rect_y_center_a + hand.rect_h_a // 2 + 20)
-            cv2.putText(
-                frame, f"Gesture: {hand.gesture}", (x, y),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2
-            )
-
-def _safe_fps(detector) -> float:
-    """Return rolling/avg FPS safely regardless of FPS implementation."""
-    fc = getattr(detector, "fps_counter", None)
-    if fc is None:
-        return 0.0
-    # Prefer short-window/rolling if available
-    for attr in ("get", "fps"):
-        if hasattr(fc, attr):
-            try:
-                return float(getattr(fc, attr)())
-            except Exception:
-                pass
-    # Fallback to average/global
-    for attr in ("get_global", "avg_fps"):
-        if hasattr(fc, attr):
-            try:
-                return float(getattr(fc, attr)())
-            except Exception:
-                pass
-    return 0.0
+    if gesture is not None:
+        y = int(hand.rect_y_center_a + hand.rect_h_a // 2 + 20)
+        cv2.putText(
+            frame, f"Gesture: {gesture}", (x, y),
+            cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2
+        )
 
 def _safe_fps_avg(detector) -> float:
     """Return global/average FPS safely."""
@@ -91,7 +124,17 @@ def _safe_fps_avg(detector) -> float:
     except Exception:
         return 0.0
 
-def main():
+def _watch_stop_file(stop_file: Path, stop_event: threading.Event, done: threading.Event,
+                     interval: float = 0.5):
+    """Turn the launcher's stop flag file into stop_event, polling it at 2 Hz
+    instead of stat()ing it on every frame"""
+    while not done.wait(interval):
+        if stop_file.exists():
+            stop_event.set()
+            return
+
+def main(stop_event: threading.Event = stop_event):
+    """Run the demo until 'q', Ctrl+C, the stop flag file, or stop_event is set."""
     print("OAK-D Hand Detection Demo with Swipe Detection")
     print("=" * 45)
     print("Press 'q' to quit")
@@ -128,103 +171,116 @@ def main():
         return
 
     print("Hand detection started. Showing live preview...")
+    open_window(WINDOW_NAME)
 
     frame_count = 0
     last_swipe_alert = 0
+    alert_pos = arrow_from = arrow_to = None  # centred on the first frame
+
+    def read_frame():
+        frame, hands, depth_frame = detector.get_frame_and_hands()
+        return None if frame is None else (frame, hands, depth_frame)
+
+    # Device I/O + inference on a reader thread; this thread runs the stateful
+    # swipe detector, drawing and the window (keys drive the loop)
+    reader = LatestFrameWorker(read_frame, name="hand-reader").start()
+    saver = FrameSaver()  # 's' snapshots are encoded/written off this thread
+
+    # Stop flag file -> stop_event (watcher thread ends with main)
+    loop_done = threading.Event()
+    if stop_file:
+        threading.Thread(target=_watch_stop_file, args=(stop_file, stop_event, loop_done),
+                         name="stop-file-watch", daemon=True).start()
+
+    # Methods used every frame, resolved once (they never change after construction)
+    fps_update = getattr(getattr(detector, "fps_counter", None), "update", None) or (lambda: None)
+    swipe_update = swipe_detector.update
+    swipe_counts = swipe_detector.get_counts
+    swipe_progress = swipe_detector.get_current_swipe_progress
 
     try:
         while True:
             # External graceful stop?
-            if stop_file and stop_file.exists():
-                print("Stop flag detected. Shutting down gracefully...")
+            if stop_event.is_set():
+                print("Stop requested. Shutting down gracefully...")
                 break
 
-            # Get frame & detections
-            frame, hands, depth_frame = detector.get_frame_and_hands()
-            if frame is None:
+            # Get frame & detections (None if nothing new within 100 ms)
+            item = reader.get()
+            if item is None:
+                # No frame yet: keep the window responsive and 'q' working during a stall
+                if (poll_key() & 0xFF) == ord('q'):
+                    break
                 continue
+            frame, hands, depth_frame = item
+
+            if alert_pos is None:
+                cx = frame.shape[1] // 2
+                alert_pos, arrow_from, arrow_to = (cx - 100, 50), (cx - 50, 80), (cx + 50, 80)
 
             frame_count += 1
-            if hasattr(detector, "fps_counter") and hasattr(detector.fps_counter, "update"):
-                try:
-                    detector.fps_counter.update()
-                except Exception:
-                    pass
+            fps_update()
 
             # Swipe input = center of first hand
             hand_center = None
             if hands:
                 hand = hands[0]
-                if hasattr(hand, 'rect_x_center_a') and hasattr(hand, 'rect_y_center_a'):
-                    hand_center = (hand.rect_x_center_a, hand.rect_y_center_a)
+                cx = getattr(hand, 'rect_x_center_a', None)
+                cy = getattr(hand, 'rect_y_center_a', None)
+                if cx is not None and cy is not None:
+                    hand_center = (cx, cy)
 
             # Update swipe
-            swipe_detected = swipe_detector.update(hand_center)
+            swipe_detected = swipe_update(hand_center)
 
             # Draw overlays
-            fps = _safe_fps(detector)
-            cv2.putText(frame, f"", (10, 30),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-
-            cv2.putText(frame, f"Hands: {len(hands)}", (10, 60),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-
-            depth_status = "" if depth_frame is not None else "Depth: OFF"
-            cv2.putText(frame, depth_status, (10, 450), cv2.FONT_HERSHEY_SIMPLEX, 0.6,
-                        (0, 255, 0) if depth_frame is not None else (0, 0, 255), 2)
+            # Lines that repeat frame to frame are pasted from cached bitmaps;
+            # lines with live numbers only rasterise the number
+            put_cached_text(frame, f"Hands: {len(hands)}", HANDS_POS, 0.7, WHITE, 2)
 
-            if len(hands) == 0:
-                cv2.putText(frame, "",
-                            (frame.shape[1] // 2 - 200, frame.shape[0] // 2),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+            if depth_frame is None:
+                put_cached_text(frame, "Depth: OFF", DEPTH_POS, 0.6, (0, 0, 255), 2)
 
-            stats = swipe_detector.get_statistics()
-            cv2.putText(frame, f"Swipes: {stats['total_swipes_detected']}", (10, 90),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+            total_swipes, _ = swipe_counts()
+            put_cached_text(frame, f"Swipes: {total_swipes}", SWIPES_POS, 0.7, WHITE, 2)
 
-            progress = swipe_detector.get_current_swipe_progress()
+            progress = swipe_progress()
             if progress:
                 state_color = (0, 255, 255) if progress['state'] != 'idle' else (128, 128, 128)
-                cv2.putText(frame, f"State: {progress['state']}", (10, 120),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, state_color, 2)
+                put_cached_text(frame, f"State: {progress['state']}", STATE_POS, 0.6, state_color, 2)
                 if progress['distance'] > 0:
-                    cv2.putText(frame, f"Distance: {progress['distance']:.0f}px (need: 80px)",
-                                (10, 150), cv2.FONT_HERSHEY_SIMPLEX, 0.5, state_color, 2)
-                cv2.putText(frame, f"Velocity: {progress['velocity']:.0f}px/s (need: 30-1000)",
-                            (10, 180), cv2.FONT_HERSHEY_SIMPLEX, 0.5, state_color, 2)
-                cv2.putText(frame, f"Progress: {progress['progress']:.1%}", (10, 210),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, state_color, 2)
+                    put_label_value(frame, "Distance: ", f"{progress['distance']:.0f}px (need: 80px)",
+                                    DISTANCE_POS, 0.5, state_color, 2)
+                put_label_value(frame, "Velocity: ", f"{progress['velocity']:.0f}px/s (need: 30-1000)",
+                                VELOCITY_POS, 0.5, state_color, 2)
+                put_label_value(frame, "Progress: ", f"{progress['progress']:.1%}", PROGRESS_POS, 0.6, state_color, 2)
 
             # Swipe alert
             if swipe_detected:
                 last_swipe_alert = frame_count
-                print(f" LEFT-TO-RIGHT SWIPE DETECTED! (Total: {stats['total_swipes_detected']})")
+                print(f" LEFT-TO-RIGHT SWIPE DETECTED! (Total: {total_swipes})")
             if frame_count - last_swipe_alert < 90:  # ~3s @30fps
-                cv2.putText(frame, "SWIPE DETECTED!", (frame.shape[1] // 2 - 100, 50),
-                            cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 255, 0), 3)
-                cv2.arrowedLine(frame, (frame.shape[1] // 2 - 50, 80),
-                                (frame.shape[1] // 2 + 50, 80), (0, 255, 0), 5)
+                put_cached_text(frame, "SWIPE DETECTED!", alert_pos, 1.0, (0, 255, 0), 3)
+                cv2.arrowedLine(frame, arrow_from, arrow_to, (0, 255, 0), 5)
 
             # Draw hands + optional logging
+            log_hands = frame_count % 2 == 0 and log.isEnabledFor(logging.DEBUG)
             for i, hand in enumerate(hands):
                 draw_hand_landmarks(frame, hand)
-                if frame_count % 2 == 0:
-                    lab = getattr(hand, 'label', '?')
-                    sc = getattr(hand, 'lm_score', 0.0)
-                    print(f"Hand {i+1}: {lab} (confidence: {sc:.3f})")
-                    if hasattr(hand, 'gesture') and hand.gesture:
-                        print(f"  Gesture: {hand.gesture}")
+                if log_hands:
+                    log.debug("Hand %d: %s (confidence: %.3f)",
+                              i + 1, getattr(hand, 'label', '?'), getattr(hand, 'lm_score', 0.0))
+                    if getattr(hand, 'gesture', None):
+                        log.debug("  Gesture: %s", hand.gesture)
 
-            cv2.imshow("OAK-D Hand Detection with Swipe", frame)
+            cv2.imshow(WINDOW_NAME, frame)
 
             # Local keys (still allow 'q' to quit)
-            key = cv2.waitKey(1) & 0xFF
+            key = poll_key() & 0xFF
             if key == ord('q'):
                 break
             elif key == ord('s'):
-                filename = f"hand_detection_frame_{frame_count}.jpg"
-                cv2.imwrite(filename, frame)
-                print(f"Frame saved as {filename}")
+                saver.save(f"hand_detection_frame_{frame_count}.jpg", frame)
             elif key == ord('r'):
                 swipe_detector.reset_statistics()
                 print("Swipe statistics reset")
@@ -235,6 +291,9 @@ def main():
         print(f"Error during execution: {e}")
     finally:
         # Always close resources
+        loop_done.set()
+        reader.stop()
+        saver.close()
         try: detector.close()
         except Exception: pass
         try: cv2.destroyAllWindows()
@@ -250,15 +309,12 @@ def main():
             except Exception: frames = 0
 
         avg_fps = _safe_fps_avg(detector)
-        final_stats = swipe_detector.get_statistics() if hasattr(swipe_detector, "get_statistics") else {
-            "total_swipes_detected": getattr(swipe_detector, "total_swipes", 0),
-            "filtered_false_positives": getattr(swipe_detector, "filtered_fp", 0)
-        }
+        final_stats = swipe_detector.get_statistics()
         print("\nSession Statistics:")
         print(f"Total frames processed: {frames}")
         print(f"Average FPS: {avg_fps:.2f}")
         print(f"Total swipes detected: {final_stats.get('total_swipes_detected', 0)}")
-        print(f"False positives filtered: {final_stats.get('filtered_false_positives', 0)}")
+        print(f"False positives filtered: {final_stats.get('false_positives_filtered', 0)}")
         print("Hand detection demo completed.")
 
 if __name__ == "__main__":
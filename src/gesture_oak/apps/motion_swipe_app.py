@@ -5,6 +5,28 @@ import numpy as np
 import depthai as dai
 from ..detection.motion_detector import MotionDetector
 from ..detection.motion_swipe_detector import MotionSwipeDetector
+from ..utils.frame_pipeline import LatestFrameWorker, FrameSaver
+from ..utils.display import open_window, poll_key
+from ..utils.text_cache import put_cached_text, put_label_value
+
+# 背景差分はNフレームに1回だけ実行（間のフレームは前回の検出結果を再描画）
+PROCESS_EVERY_N = 2
+
+WINDOW_NAME = "OAK-D Motion Swipe Detection"
+
+# HUD（左上の固定位置テキスト）
+WHITE = (255, 255, 255)
+FPS_POS = (10, 30)
+OBJECTS_POS = (10, 60)
+SWIPES_POS = (10, 90)
+# 軌跡のフェード色（古い→新しい の4段階、各段の中央の透明度）
+TRAIL_COLORS = [(int(255 * a), int(100 * a), int(100 * a))
+                for a in (np.arange(4) + 0.5) / 4 * 0.8 + 0.2]
+STATE_COLORS = {
+    'detecting': (0, 255, 255),
+    'validating': (255, 255, 0),
+    'confirmed': (0, 255, 0)
+}
 
 
 class SimpleIRCamera:
@@ -13,9 +35,10 @@ class SimpleIRCamera:
     MediaPipeの複雑さを排除して軽量化
     """
     
-    def __init__(self, fps=30, resolution=(640, 480)):
+    def __init__(self, fps=30, resolution=(640, 480), use_depth=False):
         self.fps_target = fps
         self.resolution = resolution
+        self.use_depth = use_depth  # モーション検出には不要（右カメラ/ステレオも作らない）
         self.device = None
         self.pipeline = None
         self.q_video = None
@@ -31,18 +54,23 @@ class SimpleIRCamera:
         cam_left.setBoardSocket(dai.CameraBoardSocket.LEFT)
         cam_left.setFps(self.fps_target)
         
-        cam_right = pipeline.createMonoCamera()
-        cam_right.setResolution(dai.MonoCameraProperties.SensorResolution.THE_480_P)
-        cam_right.setBoardSocket(dai.CameraBoardSocket.RIGHT)
-        cam_right.setFps(self.fps_target)
-        
-        # Depth
-        depth = pipeline.createStereoDepth()
-        depth.setDefaultProfilePreset(dai.node.StereoDepth.PresetMode.HIGH_ACCURACY)
-        depth.initialConfig.setMedianFilter(dai.MedianFilter.KERNEL_7x7)
-        depth.setLeftRightCheck(True)
-        cam_left.out.link(depth.left)
-        cam_right.out.link(depth.right)
+        if self.use_depth:
+            cam_right = pipeline.createMonoCamera()
+            cam_right.setResolution(dai.MonoCameraProperties.SensorResolution.THE_480_P)
+            cam_right.setBoardSocket(dai.CameraBoardSocket.RIGHT)
+            cam_right.setFps(self.fps_target)
+            
+            # Depth
+            depth = pipeline.createStereoDepth()
+            depth.setDefaultProfilePreset(dai.node.StereoDepth.PresetMode.HIGH_ACCURACY)
+            depth.initialConfig.setMedianFilter(dai.MedianFilter.KERNEL_7x7)
+            depth.setLeftRightCheck(True)
+            cam_left.out.link(depth.left)
+            cam_right.out.link(depth.right)
+            
+            depth_out = pipeline.createXLinkOut()
+            depth_out.setStreamName("depth")
+            depth.depth.link(depth_out.input)
         
         # Convert mono to RGB
         mono_to_rgb = pipeline.createImageManip()
@@ -55,10 +83,6 @@ class SimpleIRCamera:
         rgb_out.setStreamName("rgb")
         mono_to_rgb.out.link(rgb_out.input)
         
-        depth_out = pipeline.createXLinkOut()
-        depth_out.setStreamName("depth")
-        depth.depth.link(depth_out.input)
-        
         return pipeline
     
     def connect(self):
@@ -72,7 +96,8 @@ class SimpleIRCamera:
             
             # Setup queues
             self.q_video = self.device.getOutputQueue("rgb", maxSize=1, blocking=False)
-            self.q_depth = self.device.getOutputQueue("depth", maxSize=1, blocking=False)
+            if self.use_depth:
+                self.q_depth = self.device.getOutputQueue("depth", maxSize=1, blocking=False)
             
             return True
             
@@ -87,11 +112,11 @@ class SimpleIRCamera:
             in_rgb = self.q_video.get()
             frame = in_rgb.getCvFrame()
             
-            # Depth frame
+            # Depth frame (latest one if any; single non-blocking call)
             depth_frame = None
-            if self.q_depth.has():
-                in_depth = self.q_depth.get()
-                depth_frame = in_depth.getFrame()
+            if self.q_depth is not None:
+                in_depth = self.q_depth.tryGet()
+                depth_frame = in_depth.getFrame() if in_depth is not None else None
             
             return frame, depth_frame
             
@@ -125,22 +150,20 @@ def draw_motion_objects(frame, motion_objects):
                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
 
 
-def draw_motion_trail(frame, motion_points):
-    """モーション軌跡を描画"""
-    if len(motion_points) < 2:
+def draw_motion_trail(frame, motion_trail):
+    """モーション軌跡 (xy, t) を描画"""
+    pts, _ = motion_trail
+    if len(pts) < 2:
         return
     
-    # 軌跡の線を描画
-    points = [p['position'] for p in motion_points]
-    for i in range(1, len(points)):
-        # 透明度を時間経過で変更
-        alpha = (i / len(points)) * 0.8 + 0.2
-        color = (int(255 * alpha), int(100 * alpha), int(100 * alpha))
-        cv2.line(frame, points[i-1], points[i], color, 3)
+    # 軌跡の線を描画（段ごとに1回のpolylines、隣の段と端点を共有）
+    bounds = np.linspace(0, len(pts) - 1, len(TRAIL_COLORS) + 1).astype(int).tolist()
+    for color, a, b in zip(TRAIL_COLORS, bounds, bounds[1:]):
+        if b > a:
+            cv2.polylines(frame, [pts[a:b + 1]], False, color, 3)
     
     # 最新位置
-    if points:
-        cv2.circle(frame, points[-1], 8, (0, 255, 255), -1)
+    cv2.circle(frame, tuple(pts[-1].tolist()), 8, (0, 255, 255), -1)
 
 
 def main():
@@ -181,45 +204,73 @@ def main():
         return
     
     print("Motion detection started. Please wait for calibration...")
+    open_window(WINDOW_NAME)
     
     frame_count = 0
     last_swipe_alert = 0
+    motion_objects = []
+    motion_trail = motion_detector.get_motion_trail()
+    layout = None  # 画面サイズ依存の座標（最初のフレームで計算）
+    
+    def read_frame():
+        frame, depth_frame = camera.get_frame()
+        return None if frame is None else (frame, depth_frame)
+    
+    # カメラI/Oは読み込みスレッドで、検出・描画・表示はこのスレッドで
+    reader = LatestFrameWorker(read_frame, name="motion-reader").start()
+    saver = FrameSaver()  # 's'キーの保存はバックグラウンドでエンコード/書き込み
     
     try:
         while True:
-            frame, depth_frame = camera.get_frame()
-            
-            if frame is None:
+            item = reader.get()
+            if item is None:
+                # カメラ停止中もウィンドウを応答させ、'q'で終了できるようにする
+                if (poll_key() & 0xFF) == ord('q'):
+                    break
                 continue
+            frame, depth_frame = item
+            
+            if layout is None:
+                h, w = frame.shape[:2]
+                cx, cy = w // 2, h // 2
+                layout = {
+                    'calib_text': (cx - 100, cy),
+                    'bar_x': cx - 100, 'bar_y': cy + 40,
+                    'state': (w - 200, 30), 'distance': (w - 200, 60), 'progress': (w - 200, 90),
+                    'alert': (cx - 100, 100), 'arrow_from': (cx - 80, 130), 'arrow_to': (cx + 80, 130),
+                    'hint1': (10, h - 60), 'hint2': (10, h - 30),
+                }
             
             frame_count += 1
             
             # キャリブレーション状況表示
             if motion_detector.is_calibrating():
                 progress = motion_detector.get_calibration_progress()
-                cv2.putText(frame, f"Calibrating... {progress*100:.0f}%", 
-                           (frame.shape[1]//2 - 100, frame.shape[0]//2), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 255, 255), 2)
+                put_cached_text(frame, f"Calibrating... {progress*100:.0f}%", 
+                                layout['calib_text'], 1.0, (0, 255, 255), 2)
                 
                 # プログレスバー
                 bar_width = 200
-                bar_x = frame.shape[1]//2 - bar_width//2
-                bar_y = frame.shape[0]//2 + 40
+                bar_x, bar_y = layout['bar_x'], layout['bar_y']
                 cv2.rectangle(frame, (bar_x, bar_y), (bar_x + bar_width, bar_y + 20), (50, 50, 50), -1)
                 cv2.rectangle(frame, (bar_x, bar_y), (bar_x + int(bar_width * progress), bar_y + 20), (0, 255, 255), -1)
             
-            # モーション検出
-            motion_objects = motion_detector.detect_motion(frame)
-            
-            # モーション軌跡更新
-            motion_trail = motion_detector.update_motion_trail(motion_objects)
-            
-            # スワイプ検出
-            swipe_detected = False
-            if not motion_detector.is_calibrating():
-                swipe_detected = swipe_detector.analyze_motion_trail(motion_trail)
-                if swipe_detected:
-                    last_swipe_alert = frame_count
+            # モーション検出（キャリブレーション中は毎フレーム）
+            calibrating = motion_detector.is_calibrating()
+            if calibrating or frame_count % PROCESS_EVERY_N == 0:
+                # 間引き中はNフレーム分の学習率で背景を更新（追従速度は毎フレーム処理と同じ）
+                step = 1 if calibrating else PROCESS_EVERY_N
+                motion_objects = motion_detector.detect_motion(frame, frame_step=step)
+                
+                # モーション軌跡更新
+                motion_trail = motion_detector.update_motion_trail(motion_objects)
+                
+                # スワイプ検出（軌跡が更新されたフレームのみ）
+                if not motion_detector.is_calibrating():
+                    if swipe_detector.analyze_motion_trail(motion_trail):
+                        last_swipe_alert = frame_count
+            else:
+                motion_detector.fps_counter.update()  # FPSは表示フレームで数える
             
             # 描画
             draw_motion_objects(frame, motion_objects)
@@ -227,60 +278,48 @@ def main():
             
             # 情報表示
             fps = motion_detector.fps_counter.get()
-            cv2.putText(frame, f"FPS: {fps:.1f}", (10, 30), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+            # 毎フレーム同じ文字列はキャッシュ画像を貼り付け、数値だけputText
+            put_label_value(frame, "FPS: ", f"{fps:.1f}", FPS_POS, 0.7, WHITE, 2)
             
-            cv2.putText(frame, f"Objects: {len(motion_objects)}", (10, 60), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+            put_cached_text(frame, f"Objects: {len(motion_objects)}", OBJECTS_POS, 0.7, WHITE, 2)
             
             # スワイプ統計
-            stats = swipe_detector.get_statistics()
-            cv2.putText(frame, f"Swipes: {stats['total_swipes_detected']}", (10, 90), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+            total_swipes, _ = swipe_detector.get_counts()
+            put_cached_text(frame, f"Swipes: {total_swipes}", SWIPES_POS, 0.7, WHITE, 2)
             
             # スワイプ進行状況
             progress = swipe_detector.get_current_progress()
             if progress['state'] != 'idle':
-                state_colors = {
-                    'detecting': (0, 255, 255),
-                    'validating': (255, 255, 0),
-                    'confirmed': (0, 255, 0)
-                }
-                color = state_colors.get(progress['state'], (255, 255, 255))
+                color = STATE_COLORS.get(progress['state'], WHITE)
                 
-                cv2.putText(frame, f"State: {progress['state']}", (frame.shape[1] - 200, 30), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+                put_cached_text(frame, f"State: {progress['state']}", layout['state'], 0.6, color, 2)
                 
                 if progress['distance'] > 0:
-                    cv2.putText(frame, f"Distance: {progress['distance']:.0f}px", (frame.shape[1] - 200, 60), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
-                    cv2.putText(frame, f"Progress: {progress['progress']*100:.0f}%", (frame.shape[1] - 200, 90), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+                    put_label_value(frame, "Distance: ", f"{progress['distance']:.0f}px", layout['distance'], 
+                                    0.6, color, 2)
+                    put_cached_text(frame, f"Progress: {progress['progress']*100:.0f}%", layout['progress'], 
+                                    0.6, color, 2)
             
             # スワイプ検出アラート
             if frame_count - last_swipe_alert < 60:  # 2秒間表示
-                cv2.putText(frame, "SWIPE DETECTED!", (frame.shape[1]//2 - 100, 100), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 255, 0), 3)
-                cv2.arrowedLine(frame, (frame.shape[1]//2 - 80, 130), 
-                               (frame.shape[1]//2 + 80, 130), (0, 255, 0), 8)
+                put_cached_text(frame, "SWIPE DETECTED!", layout['alert'], 1.2, (0, 255, 0), 3)
+                cv2.arrowedLine(frame, layout['arrow_from'], layout['arrow_to'], (0, 255, 0), 8)
             
             # 使用説明
             if not motion_detector.is_calibrating() and len(motion_objects) == 0:
-                cv2.putText(frame, "Move your hand from left to right", (10, frame.shape[0] - 60), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
-                cv2.putText(frame, "Keep movement smooth and steady", (10, frame.shape[0] - 30), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+                put_cached_text(frame, "Move your hand from left to right", layout['hint1'], 
+                                0.6, (0, 255, 255), 2)
+                put_cached_text(frame, "Keep movement smooth and steady", layout['hint2'], 
+                                0.6, (0, 255, 255), 2)
             
-            cv2.imshow("OAK-D Motion Swipe Detection", frame)
+            cv2.imshow(WINDOW_NAME, frame)
             
             # キー処理
-            key = cv2.waitKey(1) & 0xFF
+            key = poll_key() & 0xFF
             if key == ord('q'):
                 break
             elif key == ord('s'):
-                filename = f"motion_swipe_frame_{frame_count}.jpg"
-                cv2.imwrite(filename, frame)
-                print(f"Frame saved as {filename}")
+                saver.save(f"motion_swipe_frame_{frame_count}.jpg", frame)
             elif key == ord('r'):
                 swipe_detector.reset_statistics()
                 motion_detector.reset_calibration()
@@ -300,6 +339,8 @@ def main():
         print(f"Error during execution: {e}")
     
     finally:
+        reader.stop()
+        saver.close()
         camera.close()
         cv2.destroyAllWindows()
         
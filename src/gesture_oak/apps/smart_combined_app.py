@@ -6,105 +6,143 @@ Automatically switches between:
 - 3-Area Pointing (ONE finger) → 3 areas
 - FIST works in both modes
 """
-import os, sys, cv2, numpy as np
+import os, sys, math, cv2, numpy as np
 from pathlib import Path
 
+# The per-frame OpenCV work here is small ROI blends and draw calls, where
+# handing chunks to a worker pool costs more than it saves; keep it on the
+# calling thread and leave the other cores to the capture thread
+cv2.setUseOptimized(True)
+cv2.setNumThreads(1)
+
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from gesture_oak.detection.rgb_hand_detector import RGBHandDetector
 from gesture_oak.detection.smart_combined_detector import (
     SmartCombinedDetector, DetectionMode, GestureType
 )
+from gesture_oak.utils.frame_pipeline import LatestFrameWorker, FrameSaver
+from gesture_oak.utils.text_cache import put_cached_text, put_label_value
+from gesture_oak.utils.display import DisplayLimiter
 
 # Landmarks
 WRIST, INDEX_TIP = 0, 8
 
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+# Info panel (top-left): the old filled rectangle (10,10)-(500,200), as a slice
+PANEL_ROWS, PANEL_COLS = slice(10, 201), slice(10, 501)
+
+# Info panel lines per mode / gesture: (text, color)
+MODE_HUD = {
+    DetectionMode.WRIST_ROTATION: ("Mode: WRIST ROTATION", (0, 255, 255)),
+    DetectionMode.THREE_AREA: ("Mode: 3-AREA POINTING", (255, 128, 255)),
+}
+MODE_HUD_UNKNOWN = ("Mode: UNKNOWN", (128, 128, 128))
+GESTURE_HUD = {
+    GestureType.FIST: ("Gesture: FIST ✊", (0, 0, 255)),
+    GestureType.OPEN: ("Gesture: OPEN 🤚", (0, 255, 0)),
+    GestureType.ONE: ("Gesture: ONE ☝", (255, 0, 255)),
+}
+GESTURE_HUD_UNKNOWN = ("Gesture: ???", (128, 128, 128))
+
+# Skeleton as index chains: wrist → thumb/index/middle/ring/pinky tips, then palm knuckles
+FINGER_CHAINS = [np.array([0, 1, 2, 3, 4]), np.array([0, 5, 6, 7, 8]),
+                 np.array([0, 9, 10, 11, 12]), np.array([0, 13, 14, 15, 16]),
+                 np.array([0, 17, 18, 19, 20])]
+PALM_CHAIN = np.array([5, 9, 13, 17])
+SKELETON_CHAINS = FINGER_CHAINS + [PALM_CHAIN]
+# Wrist + fingertips are drawn big/red, the rest small/white
+TIP_IDX = np.array([0, 4, 8, 12, 16, 20])
+OTHER_IDX = np.setdiff1d(np.arange(21), TIP_IDX)
+
+
+def _arc_offsets(angles_deg, radius):
+    """Pixel offsets from the wrist for detector angles (0° = right, 180° = left, up is -y)"""
+    rad = np.radians(180.0 - np.asarray(angles_deg, dtype=np.float64))
+    return np.stack([radius * np.cos(rad), -radius * np.sin(rad)], axis=-1).astype(np.int32)
+
+
+# Wrist zone geometry is fixed, so it is built once here rather than per frame
+ZONE_RADIUS = 200
+ZONE_BOUNDARIES = [0, 60, 90, 120, 180]
+ZONE_COLORS = {
+    1: (0, 255, 255),    # Yellow
+    2: (0, 255, 0),      # Green
+    3: (255, 128, 0),    # Orange
+    4: (0, 0, 255)       # Red
+}
+# Per zone: fill polygon = centre point + arc sampled every 5°
+ZONE_POLYS = [np.vstack([np.zeros((1, 2), np.int32),
+                         _arc_offsets(np.arange(start, end + 1, 5), ZONE_RADIUS)])
+              for start, end in zip(ZONE_BOUNDARIES[:-1], ZONE_BOUNDARIES[1:])]
+_ZONE_PTS_BUF = np.empty((max(len(p) for p in ZONE_POLYS), 2), np.int32)  # translated polygon
+# Boundary spokes as (5, 2, 2) wrist → edge segments, and zone label positions (60% of the way out)
+_edges = _arc_offsets(ZONE_BOUNDARIES, ZONE_RADIUS)
+ZONE_SPOKES = np.stack([np.zeros_like(_edges), _edges], axis=1)
+ZONE_LABELS = [(0.6 * off).tolist() for off in _arc_offsets(
+    [(start + end) / 2 for start, end in zip(ZONE_BOUNDARIES[:-1], ZONE_BOUNDARIES[1:])], ZONE_RADIUS)]
+
+AREA_COLORS = {
+    1: (0, 255, 255),    # Yellow - Left
+    2: (0, 255, 0),      # Green - Center
+    3: (0, 0, 255)       # Red - Right
+}
+# Large position indicator colour per mode (other modes: white)
+POS_COLORS = {
+    DetectionMode.WRIST_ROTATION: ZONE_COLORS,
+    DetectionMode.THREE_AREA: AREA_COLORS,
+}
+
 
 def draw_hand_skeleton(img, hand):
     """Draw hand skeleton"""
     if not hasattr(hand, 'landmarks') or hand.landmarks is None:
         return
     
-    lm = hand.landmarks
-    
-    # Connection lines
-    connections = [
-        (0,1),(1,2),(2,3),(3,4),          # Thumb
-        (0,5),(5,6),(6,7),(7,8),          # Index
-        (0,9),(9,10),(10,11),(11,12),     # Middle
-        (0,13),(13,14),(14,15),(15,16),   # Ring
-        (0,17),(17,18),(18,19),(19,20),   # Pinky
-        (5,9),(9,13),(13,17)              # Palm
-    ]
+    pts = hand.landmarks.astype(np.int32)
     
-    for a, b in connections:
-        pt1 = tuple(lm[a].astype(int))
-        pt2 = tuple(lm[b].astype(int))
-        cv2.line(img, pt1, pt2, (0, 255, 0), 2)
+    # Connection lines: one open polyline per finger + the palm knuckles, all in one call
+    cv2.polylines(img, [pts[chain] for chain in SKELETON_CHAINS], False, (0, 255, 0), 2)
     
     # Landmark points
-    for i, pt in enumerate(lm):
-        radius = 6 if i in [0, 4, 8, 12, 16, 20] else 4
-        color = (0, 0, 255) if i in [0, 4, 8, 12, 16, 20] else (255, 255, 255)
-        cv2.circle(img, tuple(pt.astype(int)), radius, color, -1)
+    for pt in pts[OTHER_IDX].tolist():
+        cv2.circle(img, tuple(pt), 4, (255, 255, 255), -1)
+    for pt in pts[TIP_IDX].tolist():
+        cv2.circle(img, tuple(pt), 6, (0, 0, 255), -1)
 
 
 def draw_wrist_rotation_zones(img, wrist_pt, angle, current_position):
     """Draw 4-position wrist rotation zones (fan shape)"""
     cx, cy = int(wrist_pt[0]), int(wrist_pt[1])
-    radius = 200
     
-    boundaries = [0, 60, 90, 120, 180]
-    zone_colors = {
-        1: (0, 255, 255),    # Yellow
-        2: (0, 255, 0),      # Green
-        3: (255, 128, 0),    # Orange
-        4: (0, 0, 255)       # Red
-    }
+    # Highlight current zone
+    if 1 <= current_position <= 4:
+        # Blend only inside the slice's bounding box (clipped to the image)
+        poly = ZONE_POLYS[current_position - 1]
+        pts = np.add(poly, (cx, cy), out=_ZONE_PTS_BUF[:len(poly)])
+        x, y, bw, bh = cv2.boundingRect(pts)
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + bw, img.shape[1]), min(y + bh, img.shape[0])
+        if x1 > x0 and y1 > y0:
+            roi = img[y0:y1, x0:x1]
+            overlay = roi.copy()
+            cv2.fillPoly(overlay, [pts], ZONE_COLORS[current_position], offset=(-x0, -y0))
+            cv2.addWeighted(overlay, 0.3, roi, 0.7, 0, roi)
     
-    def angle_to_point(angle_deg):
-        screen_angle = 180.0 - angle_deg
-        rad = np.radians(screen_angle)
-        x = cx + int(radius * np.cos(rad))
-        y = cy - int(radius * np.sin(rad))
-        return (x, y)
+    # Boundary lines (5 spokes, each drawn once) and the whole 0-180° arc in two calls
+    cv2.polylines(img, list(ZONE_SPOKES + np.int32((cx, cy))), False, (200, 200, 200), 2)
+    cv2.ellipse(img, (cx, cy), (ZONE_RADIUS, ZONE_RADIUS), 0,
+               -ZONE_BOUNDARIES[-1], -ZONE_BOUNDARIES[0], (200, 200, 200), 2)
     
-    # Draw zones
-    for zone_num in range(1, 5):
-        start_angle = boundaries[zone_num - 1]
-        end_angle = boundaries[zone_num]
-        color = zone_colors[zone_num]
-        
-        # Highlight current zone
-        if zone_num == current_position:
-            overlay = img.copy()
-            pts = [np.array([cx, cy])]
-            for a in range(int(start_angle), int(end_angle) + 1, 5):
-                pt = angle_to_point(a)
-                pts.append(np.array(pt))
-            pts = np.array(pts, dtype=np.int32)
-            cv2.fillPoly(overlay, [pts], color)
-            cv2.addWeighted(overlay, 0.3, img, 0.7, 0, img)
-        
-        # Boundary lines
-        start_pt = angle_to_point(start_angle)
-        end_pt = angle_to_point(end_angle)
-        cv2.line(img, (cx, cy), start_pt, (200, 200, 200), 2)
-        cv2.line(img, (cx, cy), end_pt, (200, 200, 200), 2)
-        
-        # Arc
-        cv2.ellipse(img, (cx, cy), (radius, radius), 0,
-                   -int(end_angle), -int(start_angle), (200, 200, 200), 2)
-        
-        # Zone label
-        mid_angle = (start_angle + end_angle) / 2
-        label_pt = angle_to_point(mid_angle)
-        label_pt = (int(label_pt[0] * 0.6 + cx * 0.4), int(label_pt[1] * 0.6 + cy * 0.4))
-        cv2.putText(img, str(zone_num), label_pt,
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.2, color, 3)
+    # Zone labels
+    for zone_num, (lx, ly) in enumerate(ZONE_LABELS, 1):
+        cv2.putText(img, str(zone_num), (int(cx + lx), int(cy + ly)),
+                   FONT, 1.2, ZONE_COLORS[zone_num], 3)
     
     # Current angle line
     if angle is not None:
-        angle_pt = angle_to_point(angle)
+        rad = math.radians(180.0 - angle)  # scalar: math is far cheaper than NumPy ufuncs
+        angle_pt = (cx + int(ZONE_RADIUS * math.cos(rad)), cy - int(ZONE_RADIUS * math.sin(rad)))
         cv2.line(img, (cx, cy), angle_pt, (255, 255, 255), 3)
         cv2.circle(img, angle_pt, 8, (0, 255, 0), -1)
     
@@ -118,32 +156,26 @@ def draw_three_area_zones(img, index_tip, current_area):
     h, w = img.shape[:2]
     area_width = w // 3
     
-    # Zone colors
-    area_colors = {
-        1: (0, 255, 255),    # Yellow - Left
-        2: (0, 255, 0),      # Green - Center
-        3: (0, 0, 255)       # Red - Right
-    }
-    
     # Draw zones
     for area_num in range(1, 4):
         x1 = (area_num - 1) * area_width
         x2 = area_num * area_width
-        color = area_colors[area_num]
+        color = AREA_COLORS[area_num]
         
         # Highlight current area
         if area_num == current_area:
-            overlay = img.copy()
-            cv2.rectangle(overlay, (x1, 0), (x2, h), color, -1)
-            cv2.addWeighted(overlay, 0.2, img, 0.8, 0, img)
+            # Blend just this column (the filled rect spans x1..x2 inclusive)
+            roi = img[:, x1:x2 + 1]
+            overlay = roi.copy()
+            overlay[:] = color
+            cv2.addWeighted(overlay, 0.2, roi, 0.8, 0, roi)
         
         # Border
         cv2.rectangle(img, (x1, 0), (x2, h), color, 3)
         
         # Area number (top)
         label_x = x1 + area_width // 2 - 20
-        cv2.putText(img, f"Area {area_num}", (label_x, 50),
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.0, color, 3)
+        put_cached_text(img, f"Area {area_num}", (label_x, 50), 1.0, color, 3)
     
     # Draw index finger tip indicator
     if index_tip is not None:
@@ -185,7 +217,8 @@ def main():
     # Initialize RGB detector
     print("\nInitializing RGB hand detector...")
     detector = RGBHandDetector(fps=30, resolution=(1280, 720), 
-                               pd_score_thresh=0.5, use_gesture=False)
+                               pd_score_thresh=0.5, use_gesture=False,
+                               mirror=True)  # selfie view, flipped on the camera
     
     if not detector.connect():
         print("❌ Failed to connect camera!")
@@ -197,24 +230,46 @@ def main():
     print("✓ All systems ready!\n")
     
     saved_count = 0
+    layout = None  # HUD anchor points, computed from the first frame's size
+    limiter = DisplayLimiter()  # window refresh capped (OAK_DISPLAY_FPS, default 30)
+    saver = FrameSaver()  # 's' snapshots are encoded/written off this thread
+    
+    def capture():
+        """Capture thread: grab the next frame"""
+        frame, hands, _ = detector.get_frame_and_hands()
+        if frame is None:
+            return None
+        
+        # Frames and landmarks arrive already mirrored (mirror=True on the camera)
+        return frame, hands
+    
+    # Camera I/O + inference on a worker thread; this thread runs the
+    # stateful combined detector, drawing and the window
+    worker = LatestFrameWorker(capture).start()
     
     try:
         while True:
-            # Get frame and hands
-            frame, hands, _ = detector.get_frame_and_hands()
-            if frame is None:
+            # Newest frame and hands (None if nothing new within 100 ms)
+            item = worker.get()
+            if item is None:
+                # No frame yet: keep the window responsive and 'q' working during a stall
+                if (cv2.waitKey(1) & 0xFF) == ord('q'):
+                    break
                 continue
             
-            # Mirror for natural interaction
-            frame = cv2.flip(frame, 1)
+            frame, hands = item
             h, w = frame.shape[:2]
             
-            # Mirror landmarks
-            for hand in hands:
-                if hasattr(hand, 'landmarks') and hand.landmarks is not None:
-                    hand.landmarks[:, 0] = w - hand.landmarks[:, 0]
+            if layout is None:
+                layout = {
+                    'pos_digit': (w - 120, h - 50),
+                    'pos_ring': (w - 70, h - 60),
+                    'no_hand': (w // 2 - 180, h // 2),
+                    'fps': (w - 160, 30),
+                    'rgb': (w - 160, 60),
+                }
             
-            display = frame.copy()
+            display = frame  # the capture thread hands over a fresh frame, draw on it directly
             
             # Get first hand
             hand = hands[0] if hands else None
@@ -245,32 +300,20 @@ def main():
                     draw_hand_skeleton(display, hand)
                 
                 # Info panel (top-left)
-                panel_w = 500
-                panel_h = 200
-                overlay = display.copy()
-                cv2.rectangle(overlay, (10, 10), (panel_w, panel_h), (0, 0, 0), -1)
-                cv2.addWeighted(overlay, 0.7, display, 0.3, 0, display)
+                # 70% black over the panel area only, i.e. darken it to 30%
+                panel = display[PANEL_ROWS, PANEL_COLS]
+                panel[:] = cv2.convertScaleAbs(panel, alpha=0.3)
                 
                 y = 45
                 
                 # Mode indicator
-                mode_text = "WRIST ROTATION" if mode == DetectionMode.WRIST_ROTATION else \
-                           "3-AREA POINTING" if mode == DetectionMode.THREE_AREA else "UNKNOWN"
-                mode_color = (0, 255, 255) if mode == DetectionMode.WRIST_ROTATION else \
-                            (255, 128, 255) if mode == DetectionMode.THREE_AREA else (128, 128, 128)
-                cv2.putText(display, f"Mode: {mode_text}", (20, y),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.8, mode_color, 2)
+                mode_text, mode_color = MODE_HUD.get(mode, MODE_HUD_UNKNOWN)
+                put_cached_text(display, mode_text, (20, y), 0.8, mode_color, 2)
                 y += 40
                 
                 # Gesture
-                gesture_text = "FIST ✊" if gesture == GestureType.FIST else \
-                              "OPEN 🤚" if gesture == GestureType.OPEN else \
-                              "ONE ☝" if gesture == GestureType.ONE else "???"
-                gesture_color = (0, 0, 255) if gesture == GestureType.FIST else \
-                               (0, 255, 0) if gesture == GestureType.OPEN else \
-                               (255, 0, 255) if gesture == GestureType.ONE else (128, 128, 128)
-                cv2.putText(display, f"Gesture: {gesture_text}", (20, y),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.8, gesture_color, 2)
+                gesture_text, gesture_color = GESTURE_HUD.get(gesture, GESTURE_HUD_UNKNOWN)
+                put_cached_text(display, gesture_text, (20, y), 0.8, gesture_color, 2)
                 y += 40
                 
                 # Position
@@ -281,50 +324,33 @@ def main():
                 else:
                     pos_text = "Position: --"
                 
-                cv2.putText(display, pos_text, (20, y),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 0), 2)
+                put_cached_text(display, pos_text, (20, y), 0.8, (255, 255, 0), 2)
                 y += 40
                 
                 # Angle (if wrist rotation mode)
                 if mode == DetectionMode.WRIST_ROTATION and angle is not None:
-                    cv2.putText(display, f"Angle: {angle:.1f}°", (20, y),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 128, 0), 2)
+                    put_label_value(display, "Angle: ", f"{angle:.1f}°", (20, y),
+                                    0.7, (255, 128, 0), 2)
                 
                 # Large position indicator (bottom-right)
-                if mode == DetectionMode.WRIST_ROTATION:
-                    pos_colors = {
-                        1: (0, 255, 255), 2: (0, 255, 0),
-                        3: (255, 128, 0), 4: (0, 0, 255)
-                    }
-                elif mode == DetectionMode.THREE_AREA:
-                    pos_colors = {
-                        1: (0, 255, 255), 2: (0, 255, 0), 3: (0, 0, 255)
-                    }
-                else:
-                    pos_colors = {}
-                
                 if position > 0:
-                    col = pos_colors.get(position, (255, 255, 255))
-                    cv2.putText(display, str(position), (w - 120, h - 50),
-                               cv2.FONT_HERSHEY_SIMPLEX, 3.5, col, 8)
-                    cv2.circle(display, (w - 70, h - 60), 45, col, 4)
+                    col = POS_COLORS.get(mode, {}).get(position, (255, 255, 255))
+                    put_cached_text(display, str(position), layout['pos_digit'], 3.5, col, 8)
+                    cv2.circle(display, layout['pos_ring'], 45, col, 4)
             
             else:
                 # NO HAND
-                cv2.putText(display, "SHOW YOUR HAND", (w//2 - 180, h//2),
-                           cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 255), 3)
+                put_cached_text(display, "SHOW YOUR HAND", layout['no_hand'], 1.2, (0, 0, 255), 3)
             
             # FPS counter
             fps = detector.fps_counter.get_global()
-            cv2.putText(display, f"FPS: {fps:.1f}", (w - 160, 30),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+            put_label_value(display, "FPS: ", f"{fps:.1f}", layout['fps'], 0.7, (0, 255, 0), 2)
             
             # RGB mode indicator
-            cv2.putText(display, "RGB MODE", (w - 160, 60),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+            put_cached_text(display, "RGB MODE", layout['rgb'], 0.6, (0, 255, 255), 2)
             
             # Show frame
-            cv2.imshow("Smart Combined Detection (RGB)", display)
+            limiter.show("Smart Combined Detection (RGB)", display)
             
             # Handle keys
             key = cv2.waitKey(1) & 0xFF
@@ -334,15 +360,15 @@ def main():
                 combined.reset()
                 print("🔄 Reset")
             elif key == ord('s'):
-                filename = f"smart_combined_{saved_count:04d}.jpg"
-                cv2.imwrite(filename, display)
-                print(f"💾 Saved: {filename}")
+                saver.save(f"smart_combined_{saved_count:04d}.jpg", display)
                 saved_count += 1
     
     except KeyboardInterrupt:
         print("\n⏹ Stopped by user")
     
     finally:
+        worker.stop()
+        saver.close()
         detector.close()
         cv2.destroyAllWindows()
         print("✓ Done!")
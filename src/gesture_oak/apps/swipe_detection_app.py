@@ -2,34 +2,59 @@
 
 import cv2
 cv2.setUseOptimized(True)
-cv2.setNumThreads(0)  # let OpenCV choose best for this process
+cv2.setNumThreads(1)  # draw-only workload: no OpenCV worker pool, the reader thread has the other cores
 import numpy as np
 from ..detection.hand_detector import HandDetector
 from ..detection.swipe_detector import SwipeDetector
+from ..utils.frame_pipeline import LatestFrameWorker, FrameSaver
+from ..utils.text_cache import put_cached_text, put_label_value
+from ..utils.display import DisplayLimiter
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+WHITE = (255, 255, 255)
+STATE_COLORS = {
+    'idle': (128, 128, 128),
+    'detecting': (0, 255, 255),
+    'validating': (255, 255, 0),
+    'confirmed': (0, 255, 0)
+}
+# 感度プリセット: キー -> (モード名, SwipeDetector.reconfigure の引数, メッセージ)
+SWIPE_MODES = {
+    '1': ("Strict", dict(buffer_size=20, min_distance=150, min_duration=0.4,
+                         max_duration=1.5, min_velocity=80, max_velocity=600,
+                         max_y_deviation=0.2),
+          "Switched to Strict mode (high precision)"),
+    '2': ("Normal", dict(buffer_size=15, min_distance=120, min_duration=0.3,
+                         max_duration=2.0, min_velocity=50, max_velocity=800,
+                         max_y_deviation=0.3),
+          "Switched to Normal mode"),
+    '3': ("Loose", dict(buffer_size=10, min_distance=80, min_duration=0.2,
+                        max_duration=3.0, min_velocity=30, max_velocity=1000,
+                        max_y_deviation=0.5),
+          "Switched to Loose mode (easy detection)"),
+}
+# 軌跡のフェード色（古い→新しい の4段階、各段の中央の透明度）
+TRAIL_COLORS = [(int(255 * a), int(100 * a), int(100 * a))
+                for a in (np.arange(4) + 0.5) / 4 * 0.8 + 0.2]
 
 
 def draw_swipe_trail(frame, swipe_detector):
     """スワイプの軌跡を描画"""
-    if len(swipe_detector.position_buffer) < 2:
+    xy, _ = swipe_detector.get_trail()
+    if len(xy) < 2:
         return
     
-    positions = list(swipe_detector.position_buffer)
+    # リングバッファのビューを一度だけ (N, 2) int32 に変換
+    pts = xy.astype(np.int32)
     
-    # 軌跡を線で描画
-    for i in range(1, len(positions)):
-        pt1 = (int(positions[i-1][0]), int(positions[i-1][1]))
-        pt2 = (int(positions[i][0]), int(positions[i][1]))
-        
-        # 透明度を距離に応じて変更
-        alpha = (i / len(positions)) * 0.8 + 0.2
-        color = (int(255 * alpha), int(100 * alpha), int(100 * alpha))
-        
-        cv2.line(frame, pt1, pt2, color, 3)
+    # 軌跡の線を描画（段ごとに1回のpolylines、隣の段と端点を共有）
+    bounds = np.linspace(0, len(pts) - 1, len(TRAIL_COLORS) + 1).astype(int).tolist()
+    for color, a, b in zip(TRAIL_COLORS, bounds, bounds[1:]):
+        if b > a:
+            cv2.polylines(frame, [pts[a:b + 1]], False, color, 3)
     
     # 最新位置に円を描画
-    if positions:
-        latest_pos = (int(positions[-1][0]), int(positions[-1][1]))
-        cv2.circle(frame, latest_pos, 8, (0, 255, 255), -1)
+    cv2.circle(frame, tuple(pts[-1].tolist()), 8, (0, 255, 255), -1)
 
 
 def draw_swipe_zone(frame, min_distance=120):
@@ -42,9 +67,9 @@ def draw_swipe_zone(frame, min_distance=120):
     
     # ゾーン説明
     cv2.putText(frame, "Swipe Zone", (10, height//4 - 10), 
-               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (128, 255, 128), 2)
+               FONT, 0.6, (128, 255, 128), 2)
     cv2.putText(frame, f"Min: {min_distance}px", (10, 3*height//4 + 20), 
-               cv2.FONT_HERSHEY_SIMPLEX, 0.5, (128, 255, 128), 1)
+               FONT, 0.5, (128, 255, 128), 1)
 
 
 def main():
@@ -89,14 +114,32 @@ def main():
     frame_count = 0
     last_swipe_alert = 0
     current_mode = "Normal"
+    hud_x = alert_pos = arrow_from = arrow_to = None  # placed on the first frame
+    limiter = DisplayLimiter()  # 表示更新の上限 (OAK_DISPLAY_FPS、既定 30)
+    saver = FrameSaver()  # 's'キーの保存はバックグラウンドでエンコード/書き込み
+    
+    def read_frame():
+        frame, hands, depth_frame = detector.get_frame_and_hands()
+        return None if frame is None else (frame, hands, depth_frame)
+    
+    # デバイスI/Oと推論は読み込みスレッドで実行（描画・スワイプ判定はこのスレッド）
+    reader = LatestFrameWorker(read_frame, name="swipe-reader").start()
     
     try:
         while True:
-            # Get frame and hand detections
-            frame, hands, depth_frame = detector.get_frame_and_hands()
-            
-            if frame is None:
+            # Get frame and hand detections (None if nothing new within 100 ms)
+            item = reader.get()
+            if item is None:
+                # カメラ停止中もウィンドウを応答させ、'q'で終了できるようにする
+                if (cv2.waitKey(1) & 0xFF) == ord('q'):
+                    break
                 continue
+            frame, hands, depth_frame = item
+            
+            if hud_x is None:
+                hud_x = frame.shape[1] - 150
+                cx = frame.shape[1] // 2
+                alert_pos, arrow_from, arrow_to = (cx - 50, 80), (cx - 80, 120), (cx + 80, 120)
                 
             frame_count += 1
             
@@ -122,59 +165,47 @@ def main():
                     points = np.array(hand.rect_points, dtype=np.int32)
                     cv2.polylines(frame, [points], True, (0, 255, 255), 2)
             
-            # 情報表示
+            # 情報表示（右端の列、固定文字列はキャッシュ済みビットマップを貼るだけ）
+            x = hud_x
             y_offset = 30
             line_height = 25
             
             # FPS
             fps = detector.fps_counter.get()
-            cv2.putText(frame, f"FPS: {fps:.1f}", (frame.shape[1] - 150, y_offset), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+            put_label_value(frame, "FPS: ", f"{fps:.1f}", (x, y_offset), 0.6, WHITE, 2)
             y_offset += line_height
             
             # モード表示
-            cv2.putText(frame, f"Mode: {current_mode}", (frame.shape[1] - 150, y_offset), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+            put_cached_text(frame, f"Mode: {current_mode}", (x, y_offset), 0.6, WHITE, 2)
             y_offset += line_height
             
             # 統計情報
-            stats = swipe_detector.get_statistics()
-            cv2.putText(frame, f"Swipes: {stats['total_swipes_detected']}", (frame.shape[1] - 150, y_offset), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+            total_swipes, filtered = swipe_detector.get_counts()
+            put_label_value(frame, "Swipes: ", str(total_swipes), (x, y_offset), 0.6, WHITE, 2)
             y_offset += line_height
             
-            cv2.putText(frame, f"Filtered: {stats['false_positives_filtered']}", (frame.shape[1] - 150, y_offset), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+            put_label_value(frame, "Filtered: ", str(filtered), (x, y_offset), 0.6, WHITE, 2)
             y_offset += line_height
             
             # スワイプ進行状況
             progress = swipe_detector.get_current_swipe_progress()
             if progress:
-                state_colors = {
-                    'idle': (128, 128, 128),
-                    'detecting': (0, 255, 255),
-                    'validating': (255, 255, 0),
-                    'confirmed': (0, 255, 0)
-                }
-                color = state_colors.get(progress['state'], (255, 255, 255))
+                color = STATE_COLORS.get(progress['state'], WHITE)
                 
-                cv2.putText(frame, f"State: {progress['state']}", (frame.shape[1] - 150, y_offset), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+                put_cached_text(frame, f"State: {progress['state']}", (x, y_offset), 0.6, color, 2)
                 y_offset += line_height
                 
                 if progress['distance'] > 0:
-                    cv2.putText(frame, f"Dist: {progress['distance']:.0f}px", (frame.shape[1] - 150, y_offset), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+                    put_label_value(frame, "Dist: ", f"{progress['distance']:.0f}px", (x, y_offset), 0.6, color, 2)
                     y_offset += line_height
                     
-                    cv2.putText(frame, f"Vel: {progress['velocity']:.0f}px/s", (frame.shape[1] - 150, y_offset), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+                    put_label_value(frame, "Vel: ", f"{progress['velocity']:.0f}px/s", (x, y_offset), 0.6, color, 2)
                     y_offset += line_height
                     
                     # 進行度バー
                     bar_width = 100
                     bar_height = 10
-                    bar_x = frame.shape[1] - 150
+                    bar_x = x
                     bar_y = y_offset
                     
                     # 背景
@@ -186,54 +217,30 @@ def main():
             # スワイプ検出時の視覚的フィードバック
             if swipe_detected:
                 last_swipe_alert = frame_count
-                print(f"🚀 SWIPE DETECTED! (#{stats['total_swipes_detected']}) - Mode: {current_mode}")
+                print(f"🚀 SWIPE DETECTED! (#{total_swipes}) - Mode: {current_mode}")
             
             # スワイプアラート表示（2秒間）
             if frame_count - last_swipe_alert < 60:  # 30fps * 2sec
-                cv2.putText(frame, "SWIPE!", (frame.shape[1]//2 - 50, 80), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0, 255, 0), 4)
+                put_cached_text(frame, "SWIPE!", alert_pos, 1.5, (0, 255, 0), 4)
                 # 矢印
-                cv2.arrowedLine(frame, (frame.shape[1]//2 - 80, 120), 
-                               (frame.shape[1]//2 + 80, 120), (0, 255, 0), 8)
+                cv2.arrowedLine(frame, arrow_from, arrow_to, (0, 255, 0), 8)
             
             # Display frame
-            cv2.imshow("OAK-D Swipe Detection Demo", frame)
+            limiter.show("OAK-D Swipe Detection Demo", frame)
             
             # Handle key presses
             key = cv2.waitKey(1) & 0xFF
             if key == ord('q'):
                 break
             elif key == ord('s'):
-                filename = f"swipe_demo_frame_{frame_count}.jpg"
-                cv2.imwrite(filename, frame)
-                print(f"Frame saved as {filename}")
+                saver.save(f"swipe_demo_frame_{frame_count}.jpg", frame)
             elif key == ord('r'):
                 swipe_detector.reset_statistics()
                 print("Statistics reset")
-            elif key == ord('1'):  # Strict mode
-                swipe_detector = SwipeDetector(
-                    buffer_size=20, min_distance=150, min_duration=0.4,
-                    max_duration=1.5, min_velocity=80, max_velocity=600,
-                    max_y_deviation=0.2
-                )
-                current_mode = "Strict"
-                print("Switched to Strict mode (high precision)")
-            elif key == ord('2'):  # Normal mode
-                swipe_detector = SwipeDetector(
-                    buffer_size=15, min_distance=120, min_duration=0.3,
-                    max_duration=2.0, min_velocity=50, max_velocity=800,
-                    max_y_deviation=0.3
-                )
-                current_mode = "Normal"
-                print("Switched to Normal mode")
-            elif key == ord('3'):  # Loose mode
-                swipe_detector = SwipeDetector(
-                    buffer_size=10, min_distance=80, min_duration=0.2,
-                    max_duration=3.0, min_velocity=30, max_velocity=1000,
-                    max_y_deviation=0.5
-                )
-                current_mode = "Loose"
-                print("Switched to Loose mode (easy detection)")
+            elif chr(key) in SWIPE_MODES:  # 1/2/3: Strict/Normal/Loose
+                current_mode, params, message = SWIPE_MODES[chr(key)]
+                swipe_detector.reconfigure(**params)
+                print(message)
     
     except KeyboardInterrupt:
         print("\nInterrupted by user")
@@ -243,6 +250,8 @@ def main():
     
     finally:
         # Cleanup
+        reader.stop()
+        saver.close()
         detector.close()
         cv2.destroyAllWindows()
         
@@ -21,6 +21,7 @@ UDP Messages:
 """
 import os
 import sys
+import threading
 import cv2
 import numpy as np
 from pathlib import Path
@@ -32,6 +33,28 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 # Note: This assumes rgb_hand_detector.py and three_area_detector.py are in gesture_oak/detection/
 from gesture_oak.detection.rgb_hand_detector import RGBHandDetector
 from gesture_oak.detection.three_area_detector import ThreeAreaDetector, GestureType
+from gesture_oak.utils.text_cache import put_cached_text, put_label_value
+from gesture_oak.utils.frame_pipeline import LatestFrameWorker, FrameSaver
+from gesture_oak.utils.display import DisplayLimiter
+
+
+# Hand skeleton connections (landmark index pairs)
+_CONNECTIONS = np.array([
+    # Thumb
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    # Index finger
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    # Middle finger
+    (0, 9), (9, 10), (10, 11), (11, 12),
+    # Ring finger
+    (0, 13), (13, 14), (14, 15), (15, 16),
+    # Pinky
+    (0, 17), (17, 18), (18, 19), (19, 20),
+    # Palm
+    (5, 9), (9, 13), (13, 17)
+], dtype=np.int32)
+# Wrist and fingertips
+_FINGERTIPS = frozenset({0, 4, 8, 12, 16, 20})
 
 
 def draw_hand_skeleton(img: np.ndarray, hand, color=(0, 255, 0)):
@@ -46,46 +69,40 @@ def draw_hand_skeleton(img: np.ndarray, hand, color=(0, 255, 0)):
     if not hasattr(hand, 'landmarks') or hand.landmarks is None:
         return
     
-    lm = hand.landmarks
-    
-    # Handle 3D landmarks
-    if len(lm.shape) == 2 and lm.shape[1] >= 2:
-        lm = lm[:, :2]
+    # Pixel coordinates once (x, y only; handles 3D landmarks)
+    lm_int = np.rint(hand.landmarks[:, :2]).astype(np.int32)
     
-    # Hand skeleton connections
-    connections = [
-        # Thumb
-        (0, 1), (1, 2), (2, 3), (3, 4),
-        # Index finger
-        (0, 5), (5, 6), (6, 7), (7, 8),
-        # Middle finger
-        (0, 9), (9, 10), (10, 11), (11, 12),
-        # Ring finger
-        (0, 13), (13, 14), (14, 15), (15, 16),
-        # Pinky
-        (0, 17), (17, 18), (18, 19), (19, 20),
-        # Palm
-        (5, 9), (9, 13), (13, 17)
-    ]
-    
-    # Draw lines
-    for a, b in connections:
-        pt1 = tuple(lm[a].astype(int))
-        pt2 = tuple(lm[b].astype(int))
-        cv2.line(img, pt1, pt2, color, 2)
+    # Draw lines: all 23 bones in one call, lm_int[_CONNECTIONS] is (23, 2, 2) = 23 two-point polylines
+    cv2.polylines(img, list(lm_int[_CONNECTIONS]), False, color, 2)
     
     # Draw landmark points
-    for i, pt in enumerate(lm):
+    for i, pt in enumerate(map(tuple, lm_int.tolist())):
         # Larger circles for important points
-        if i in [0, 4, 8, 12, 16, 20]:  # Wrist and fingertips
+        if i in _FINGERTIPS:
             radius = 7
             point_color = (0, 0, 255)
         else:
             radius = 4
             point_color = (255, 255, 255)
         
-        cv2.circle(img, tuple(pt.astype(int)), radius, point_color, -1)
-        cv2.circle(img, tuple(pt.astype(int)), radius + 1, (0, 0, 0), 1)
+        cv2.circle(img, pt, radius, point_color, -1)
+        cv2.circle(img, pt, radius + 1, (0, 0, 0), 1)
+
+
+AREA_LABELS = {1: "LEFT", 2: "CENTER", 3: "RIGHT"}
+# Area colors (BGR format for OpenCV)
+AREA_COLORS = {
+    1: (0, 255, 255),    # Yellow (left)
+    2: (0, 255, 0),      # Green (center)
+    3: (0, 0, 255)       # Red (right)
+}
+
+# Info panel gesture line: (text, color)
+GESTURE_HUD = {
+    GestureType.ONE: ("GESTURE: ONE ☝", (0, 255, 255)),   # Yellow
+    GestureType.FIST: ("GESTURE: FIST ✊", (0, 0, 255)),   # Red
+}
+GESTURE_HUD_NONE = ("GESTURE: NONE", (128, 128, 128))    # Gray
 
 
 def draw_area_grid(img: np.ndarray, current_area: int, gesture_type: GestureType):
@@ -99,13 +116,6 @@ def draw_area_grid(img: np.ndarray, current_area: int, gesture_type: GestureType
     """
     h, w = img.shape[:2]
     
-    # Area colors (BGR format for OpenCV)
-    area_colors = {
-        1: (0, 255, 255),    # Yellow (left)
-        2: (0, 255, 0),      # Green (center)
-        3: (0, 0, 255)       # Red (right)
-    }
-    
     # Calculate area boundaries
     third = w // 3
     
@@ -115,14 +125,16 @@ def draw_area_grid(img: np.ndarray, current_area: int, gesture_type: GestureType
     
     # Highlight active area if gesture is detected
     if current_area > 0 and gesture_type != GestureType.NONE:
-        overlay = img.copy()
         x_start = (current_area - 1) * third
         x_end = current_area * third
-        color = area_colors.get(current_area, (255, 255, 255))
+        color = AREA_COLORS.get(current_area, (255, 255, 255))
         
-        # Fill area with semi-transparent color
-        cv2.rectangle(overlay, (x_start, 0), (x_end, h), color, -1)
-        cv2.addWeighted(overlay, 0.2, img, 0.8, 0, img)
+        # Fill area with semi-transparent color (blend just this column,
+        # the filled rect spans x_start..x_end inclusive)
+        roi = img[:, x_start:x_end + 1]
+        overlay = roi.copy()
+        overlay[:] = color
+        cv2.addWeighted(overlay, 0.2, roi, 0.8, 0, roi)
         
         # Draw thick border around active area
         cv2.rectangle(img, (x_start, 0), (x_end, h), color, 6)
@@ -131,28 +143,22 @@ def draw_area_grid(img: np.ndarray, current_area: int, gesture_type: GestureType
     for i in range(1, 4):
         x_pos = int((i - 0.5) * third)
         y_pos = h // 2
-        color = area_colors.get(i, (255, 255, 255))
-        
-        # Large area number
-        cv2.putText(img, str(i), (x_pos - 35, y_pos),
-                   cv2.FONT_HERSHEY_SIMPLEX, 3.5, color, 7)
+        color = AREA_COLORS.get(i, (255, 255, 255))
         
-        # Area label
-        labels = {1: "LEFT", 2: "CENTER", 3: "RIGHT"}
-        cv2.putText(img, labels[i], (x_pos - 70, y_pos + 60),
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.0, color, 2)
+        # Large area number and label (fixed text: pasted from cached bitmaps)
+        put_cached_text(img, str(i), (x_pos - 35, y_pos), 3.5, color, 7)
+        put_cached_text(img, AREA_LABELS[i], (x_pos - 70, y_pos + 60), 1.0, color, 2)
 
 
-def draw_reference_point(img: np.ndarray, detector: ThreeAreaDetector, color=(255, 0, 255)):
+def draw_reference_point(img: np.ndarray, info: dict, color=(255, 0, 255)):
     """
     Draw the reference point used for area calculation
     
     Args:
         img: Image to draw on
-        detector: ThreeAreaDetector instance
+        info: ThreeAreaDetector.get_state_info() for this frame
         color: RGB color for reference point
     """
-    info = detector.get_state_info()
     ref_point = info.get('reference_point')
     
     if ref_point is not None:
@@ -204,7 +210,8 @@ def main():
         fps=30,
         resolution=(1280, 720),
         pd_score_thresh=0.5,  # Moderate sensitivity
-        use_gesture=False     # We're doing custom gesture detection
+        use_gesture=False,    # We're doing custom gesture detection
+        mirror=True           # Selfie view, flipped on the camera
     )
     
     if not hd.connect():
@@ -224,34 +231,51 @@ def main():
     
     saved_count = 0
     show_debug = False
+    reset_requested = threading.Event()
+    limiter = DisplayLimiter()  # window refresh capped (OAK_DISPLAY_FPS, default 30)
+    saver = FrameSaver()  # 's' snapshots are encoded/written off this thread
+    
+    def capture():
+        """Capture thread: grab and run the 3-area detector on the next frame"""
+        frame, hands, _ = hd.get_frame_and_hands()
+        if frame is None:
+            return None
+        
+        # Frames and landmarks arrive already mirrored (mirror=True on the camera)
+        
+        if reset_requested.is_set():  # 'r' pressed; reset on this thread
+            reset_requested.clear()
+            detector.reset()
+        
+        # Update detector with the first detected hand (None = no hand)
+        hand = hands[0] if hands else None
+        if hand is not None:
+            gesture, area = detector.update(hand, frame.shape[:2])
+        else:
+            detector.update(None, frame.shape[:2])
+            gesture, area = GestureType.NONE, 0
+        return frame, hand, gesture, area, detector.get_state_info()
+    
+    # Camera I/O + detection on a worker thread (only the newest result is
+    # kept); this thread draws and runs the window
+    worker = LatestFrameWorker(capture, name="3area-capture").start()
     
     try:
         while True:
-            # Get frame and hands
-            frame, hands, _ = hd.get_frame_and_hands()
-            
-            if frame is None:
+            item = worker.get()
+            if item is None:
+                # No frame yet: keep the window responsive and 'q' working during a stall
+                if (cv2.waitKey(1) & 0xFF) == ord('q'):
+                    break
                 continue
-            
-            # Mirror frame for natural interaction
-            frame = cv2.flip(frame, 1)
+            frame, hand, gesture, area, info = item
             h, w = frame.shape[:2]
             
-            # Mirror hand landmarks
-            for hand in hands:
-                if hasattr(hand, 'landmarks') and hand.landmarks is not None:
-                    hand.landmarks[:, 0] = w - hand.landmarks[:, 0]
-            
-            # Create display frame
-            disp = frame.copy()
+            # The capture thread hands over a fresh frame each time, so draw on it directly
+            disp = frame
             
             # Process first detected hand
-            if hands:
-                hand = hands[0]
-                
-                # Update detector
-                gesture, area = detector.update(hand, frame.shape[:2])
-                
+            if hand is not None:
                 # Draw area grid (behind hand)
                 draw_area_grid(disp, area, gesture)
                 
@@ -261,74 +285,51 @@ def main():
                 
                 # Draw reference point
                 if show_debug:
-                    draw_reference_point(disp, detector)
+                    draw_reference_point(disp, info)
                 
                 # Info panel (top-left)
-                overlay = disp.copy()
-                cv2.rectangle(overlay, (10, 10), (500, 160), (0, 0, 0), -1)
-                cv2.addWeighted(overlay, 0.7, disp, 0.3, 0, disp)
+                # 70% black over the panel area only, i.e. darken it to 30%
+                panel = disp[10:161, 10:501]
+                panel[:] = cv2.convertScaleAbs(panel, alpha=0.3)
                 
                 y = 50
                 
                 # Gesture display
-                if gesture == GestureType.ONE:
-                    gesture_txt = "GESTURE: ONE ☝"
-                    gesture_color = (0, 255, 255)  # Yellow
-                elif gesture == GestureType.FIST:
-                    gesture_txt = "GESTURE: FIST ✊"
-                    gesture_color = (0, 0, 255)    # Red
-                else:
-                    gesture_txt = "GESTURE: NONE"
-                    gesture_color = (128, 128, 128)  # Gray
-                
-                cv2.putText(disp, gesture_txt, (20, y),
-                           cv2.FONT_HERSHEY_SIMPLEX, 1.0, gesture_color, 2)
+                gesture_txt, gesture_color = GESTURE_HUD.get(gesture, GESTURE_HUD_NONE)
+                put_cached_text(disp, gesture_txt, (20, y), 1.0, gesture_color, 2)
                 y += 55
                 
                 # Area display
                 if area > 0:
-                    area_colors = {1: (0, 255, 255), 2: (0, 255, 0), 3: (0, 0, 255)}
-                    area_names = {1: "LEFT", 2: "CENTER", 3: "RIGHT"}
-                    cv2.putText(disp, f"AREA: {area} ({area_names[area]})", (20, y),
-                               cv2.FONT_HERSHEY_SIMPLEX, 1.0,
-                               area_colors.get(area, (255, 255, 255)), 2)
+                    put_cached_text(disp, f"AREA: {area} ({AREA_LABELS[area]})", (20, y), 1.0,
+                                    AREA_COLORS.get(area, (255, 255, 255)), 2)
                 else:
-                    cv2.putText(disp, "AREA: -", (20, y),
-                               cv2.FONT_HERSHEY_SIMPLEX, 1.0, (128, 128, 128), 2)
+                    put_cached_text(disp, "AREA: -", (20, y), 1.0, (128, 128, 128), 2)
                 
                 # Large area indicator (bottom-right)
                 if area > 0 and gesture != GestureType.NONE:
-                    area_colors = {1: (0, 255, 255), 2: (0, 255, 0), 3: (0, 0, 255)}
-                    col = area_colors[area]
-                    cv2.putText(disp, str(area), (w - 120, h - 50),
-                               cv2.FONT_HERSHEY_SIMPLEX, 4.0, col, 10)
+                    col = AREA_COLORS[area]
+                    put_cached_text(disp, str(area), (w - 120, h - 50), 4.0, col, 10)
                     cv2.circle(disp, (w - 70, h - 60), 50, col, 5)
             
             else:
-                # No hand detected
-                detector.update(None, frame.shape[:2])
-                
-                # Draw grid without highlight
+                # No hand detected: draw grid without highlight
                 draw_area_grid(disp, 0, GestureType.NONE)
                 
                 # Instructions
-                cv2.putText(disp, "SHOW YOUR HAND", (w//2 - 250, h//2),
-                           cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0, 0, 255), 3)
-                cv2.putText(disp, "Try ONE ☝ or FIST ✊", (w//2 - 200, h//2 + 60),
-                           cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2)
+                put_cached_text(disp, "SHOW YOUR HAND", (w//2 - 250, h//2), 1.5, (0, 0, 255), 3)
+                put_cached_text(disp, "Try ONE ☝ or FIST ✊", (w//2 - 200, h//2 + 60), 1.0, (255, 255, 255), 2)
             
             # FPS counter (top-right)
             fps = hd.fps_counter.get_global()
-            cv2.putText(disp, f"FPS: {fps:.1f}", (w - 150, 40),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
+            put_label_value(disp, "FPS: ", f"{fps:.1f}", (w - 150, 40), 0.8, (0, 255, 0), 2)
             
             # Debug mode indicator
             if show_debug:
-                cv2.putText(disp, "DEBUG", (w - 150, 80),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 0, 255), 2)
+                put_cached_text(disp, "DEBUG", (w - 150, 80), 0.7, (255, 0, 255), 2)
             
             # Display frame
-            cv2.imshow("3-Area Detection", disp)
+            limiter.show("3-Area Detection", disp)
             
             # Handle keyboard input
             key = cv2.waitKey(1) & 0xFF
@@ -339,15 +340,13 @@ def main():
                 break
             
             elif key == ord('r'):
-                # Reset detector
-                detector.reset()
+                # Reset detector (done by the capture thread)
+                reset_requested.set()
                 print("Detector reset!")
             
             elif key == ord('s'):
                 # Save screenshot
-                filename = f"3area_{saved_count:04d}.jpg"
-                cv2.imwrite(filename, disp)
-                print(f"Saved screenshot: {filename}")
+                saver.save(f"3area_{saved_count:04d}.jpg", disp)
                 saved_count += 1
             
             elif key == ord('d'):
@@ -366,6 +365,8 @@ def main():
     finally:
         # Cleanup
         print("\nCleaning up...")
+        worker.stop()
+        saver.close()
         hd.close()
         cv2.destroyAllWindows()
         print("Done!")
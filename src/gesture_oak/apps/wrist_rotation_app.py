@@ -4,7 +4,7 @@ Wrist Rotation Detection App - RGB Version
 Uses RGB camera with Nakakawa-san's HandTracker
 All features from original IR version, now with RGB camera
 """
-import os, sys, cv2, numpy as np
+import os, sys, math, threading, cv2, numpy as np
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -12,30 +12,53 @@ from gesture_oak.detection.rgb_hand_detector import RGBHandDetector
 from gesture_oak.detection.wrist_rotation_detector import (
     WristRotationDetector, HandState, RotationPosition, WRIST
 )
+from gesture_oak.utils.text_cache import put_cached_text, put_label_value
+from gesture_oak.utils.frame_pipeline import LatestFrameWorker, FrameSaver
+from gesture_oak.utils.display import DisplayLimiter
+
+DEG2RAD = math.pi / 180.0
+
+# Skeleton lines (landmark index pairs) and the wrist/fingertip points drawn big
+HAND_LINES = np.array([
+    (0,1),(1,2),(2,3),(3,4),
+    (0,5),(5,6),(6,7),(7,8),
+    (0,9),(9,10),(10,11),(11,12),
+    (0,13),(13,14),(14,15),(15,16),
+    (0,17),(17,18),(18,19),(19,20),
+    (5,9),(9,13),(13,17)
+], dtype=np.int32)
+TIPS = frozenset({0, 4, 8, 12, 16, 20})
+
+# Info panel hand-state line: (text, color)
+STATE_HUD = {
+    HandState.FISTED: ("FISTED = 1", (0, 0, 255)),
+    HandState.OPEN: ("HAND OPEN = 1", (0, 255, 0)),
+}
+STATE_HUD_UNKNOWN = ("PUT YOUR FISTED HAND", (128, 128, 128))
+
+# Large position indicator colors (position 1-4)
+POS_COLORS = {
+    1: (0, 255, 255),    # Yellow
+    2: (0, 255, 0),      # Green
+    3: (255, 128, 0),    # Orange
+    4: (0, 0, 255)       # Red
+}
+
 
 def draw_hand_landmarks(img, hand):
     """Draw hand skeleton"""
     if not hasattr(hand, 'landmarks') or hand.landmarks is None: 
         return
-    lm = hand.landmarks
+    lm_int = np.rint(hand.landmarks[:, :2]).astype(np.int32)
     
-    # Lines
-    lines = [
-        (0,1),(1,2),(2,3),(3,4),
-        (0,5),(5,6),(6,7),(7,8),
-        (0,9),(9,10),(10,11),(11,12),
-        (0,13),(13,14),(14,15),(15,16),
-        (0,17),(17,18),(18,19),(19,20),
-        (5,9),(9,13),(13,17)
-    ]
-    for a,b in lines:
-        cv2.line(img, tuple(lm[a].astype(int)), tuple(lm[b].astype(int)), (0,255,0), 2)
+    # Lines: one polylines call, lm_int[HAND_LINES] is (23, 2, 2) = 23 two-point polylines
+    cv2.polylines(img, list(lm_int[HAND_LINES]), False, (0,255,0), 2)
     
     # Points
-    for i,p in enumerate(lm):
-        r = 6 if i in [0,4,8,12,16,20] else 4
-        col = (0,0,255) if i in [0,4,8,12,16,20] else (255,255,255)
-        cv2.circle(img, tuple(p.astype(int)), r, col, -1)
+    for i,p in enumerate(map(tuple, lm_int.tolist())):
+        r = 6 if i in TIPS else 4
+        col = (0,0,255) if i in TIPS else (255,255,255)
+        cv2.circle(img, p, r, col, -1)
 
 
 def draw_position_zones(img, wrist_pt, angle, current_position):
@@ -63,11 +86,9 @@ def draw_position_zones(img, wrist_pt, angle, current_position):
     
     def angle_to_point(angle_deg):
         """Convert angle to point on screen"""
-        screen_angle = 180.0 - angle_deg
-        rad = np.radians(screen_angle)
-        x = cx + int(radius * np.cos(rad))
-        y = cy - int(radius * np.sin(rad))
-        return (x, y)
+        # Plain float math: np.radians/np.cos/np.sin on a scalar cost a ufunc dispatch each
+        rad = (180.0 - angle_deg) * DEG2RAD
+        return (cx + int(radius * math.cos(rad)), cy - int(radius * math.sin(rad)))
     
     # Draw each zone
     for zone_num in range(1, 5):
@@ -84,20 +105,24 @@ def draw_position_zones(img, wrist_pt, angle, current_position):
             thickness = 2
             alpha = 0.15
         
-        # Create overlay for transparency
-        overlay = img.copy()
-        
         # Draw filled sector for current position
         if zone_num == current_position:
             # Create polygon for filled sector
-            pts = [np.array([cx, cy])]
+            pts = [(cx, cy)]
             # Add arc points
             for a in range(int(start_angle), int(end_angle) + 1, 5):
-                pt = angle_to_point(a)
-                pts.append(np.array(pt))
+                pts.append(angle_to_point(a))
             pts = np.array(pts, dtype=np.int32)
-            cv2.fillPoly(overlay, [pts], color)
-            cv2.addWeighted(overlay, alpha, img, 1 - alpha, 0, img)
+            
+            # Blend only inside the sector's bounding box (clipped to the image)
+            x, y, bw, bh = cv2.boundingRect(pts)
+            x0, y0 = max(x, 0), max(y, 0)
+            x1, y1 = min(x + bw, w), min(y + bh, h)
+            if x1 > x0 and y1 > y0:
+                roi = img[y0:y1, x0:x1]
+                overlay = roi.copy()
+                cv2.fillPoly(overlay, [pts], color, offset=(-x0, -y0))
+                cv2.addWeighted(overlay, alpha, roi, 1 - alpha, 0, roi)
         
         # Draw boundary lines
         start_pt = angle_to_point(start_angle)
@@ -157,7 +182,8 @@ def main():
 
     # Initialize RGB hand detector
     print("\nInitializing RGB hand detector...")
-    hd = RGBHandDetector(fps=30, resolution=(1280, 720), pd_score_thresh=0.5, use_gesture=False)
+    hd = RGBHandDetector(fps=30, resolution=(1280, 720), pd_score_thresh=0.5, use_gesture=False,
+                         mirror=True)  # selfie view, flipped on the camera
     
     if not hd.connect():
         print("❌ Failed to connect!"); 
@@ -168,31 +194,44 @@ def main():
     print("✓ Ready!")
     
     saved = 0
+    reset_requested = threading.Event()
+    limiter = DisplayLimiter()  # window refresh capped (OAK_DISPLAY_FPS, default 30)
+    saver = FrameSaver()  # 's' snapshots are encoded/written off this thread
+
+    def capture():
+        """Capture thread: grab and run the detector on the next frame"""
+        frame, hands, depth = hd.get_frame_and_hands()
+        if frame is None:
+            return None
+
+        # Frames and landmarks arrive already mirrored (mirror=True on the camera)
+
+        if reset_requested.is_set():  # 'r' pressed; reset on this thread
+            reset_requested.clear()
+            det.reset()
+
+        # Update detector (None = no hand)
+        hand = hands[0] if hands else None
+        pos, ang, state = det.update(hand)
+        return frame, hand, pos, ang, state
+
+    # Camera I/O + detection on a worker thread (only the newest result is
+    # kept); this thread draws and runs the window
+    worker = LatestFrameWorker(capture, name="wrist-capture").start()
     try:
         while True:
-            # Get frame
-            frame, hands, depth = hd.get_frame_and_hands()
-            if frame is None: 
+            item = worker.get()
+            if item is None:
+                # No frame yet: keep the window responsive and 'q' working during a stall
+                if (cv2.waitKey(1) & 0xFF) == ord('q'):
+                    break
                 continue
-
-            # Mirror frame
-            frame = cv2.flip(frame, 1)
+            frame, hand, pos, ang, state = item
             h, w = frame.shape[:2]
 
-            # Mirror landmarks
-            for hnd in hands:
-                if hasattr(hnd, 'landmarks') and hnd.landmarks is not None:
-                    hnd.landmarks[:, 0] = w - hnd.landmarks[:, 0]
+            disp = frame  # the capture thread hands over a fresh frame, draw on it directly
 
-            disp = frame.copy()
-
-            if hands:
-                hand = hands[0]
-                
-                # Update detector
-                pos, ang, state = det.update(hand)
-                info = det.get_state_info()
-                
+            if hand is not None:
                 # Get wrist position
                 wrist_pt = hand.landmarks[WRIST]
                 
@@ -203,89 +242,67 @@ def main():
                 draw_hand_landmarks(disp, hand)
 
                 # Info panel (top-left)
-                overlay = disp.copy()
-                cv2.rectangle(overlay, (10, 10), (450, 180), (0, 0, 0), -1)
-                cv2.addWeighted(overlay, 0.7, disp, 0.3, 0, disp)
+                # 70% black over the panel area only, i.e. darken it to 30%
+                panel = disp[10:181, 10:451]
+                panel[:] = cv2.convertScaleAbs(panel, alpha=0.3)
 
                 y = 40
                 
                 # Mode indicator
-                cv2.putText(disp, "RGB MODE", (20, y), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+                put_cached_text(disp, "RGB MODE", (20, y), 0.6, (0, 255, 255), 2)
                 y += 35
                 
                 # Hand State
-                if state == HandState.FISTED:
-                    txt, col = "FISTED = 1", (0, 0, 255)
-                elif state == HandState.OPEN:
-                    txt, col = "HAND OPEN = 1", (0, 255, 0)
-                else:
-                    txt, col = "PUT YOUR FISTED HAND", (128, 128, 128)
-                
-                cv2.putText(disp, txt, (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.8, col, 2)
+                txt, col = STATE_HUD.get(state, STATE_HUD_UNKNOWN)
+                put_cached_text(disp, txt, (20, y), 0.8, col, 2)
                 y += 45
 
                 # Position (ALWAYS shown!)
                 pos_txt = f"Position: {pos.value}"
-                cv2.putText(disp, pos_txt, (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 0), 2)
+                put_cached_text(disp, pos_txt, (20, y), 0.8, (255, 255, 0), 2)
                 y += 40
 
                 # Angle
                 if ang is not None:
-                    cv2.putText(disp, f"Angle: {ang:.1f}°", (20, y), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 128, 0), 2)
+                    put_label_value(disp, "Angle: ", f"{ang:.1f}°", (20, y), 0.7, (255, 128, 0), 2)
 
                 # Large position indicator (bottom-right)
-                pos_colors = {
-                    1: (0, 255, 255),    # Yellow
-                    2: (0, 255, 0),      # Green
-                    3: (255, 128, 0),    # Orange
-                    4: (0, 0, 255)       # Red
-                }
-                
                 if pos.value > 0:
-                    col = pos_colors.get(pos.value, (255, 255, 255))
-                    cv2.putText(disp, str(pos.value), (w - 120, h - 50),
-                               cv2.FONT_HERSHEY_SIMPLEX, 3.5, col, 8)
+                    col = POS_COLORS.get(pos.value, (255, 255, 255))
+                    put_cached_text(disp, str(pos.value), (w - 120, h - 50), 3.5, col, 8)
                     
                     # Position circle
                     cv2.circle(disp, (w - 70, h - 60), 45, col, 4)
 
             else:
-                # NO HAND - notify detector
-                det.update(None)
-                
                 # No hand message
-                cv2.putText(disp, "PUT YOUR HAND IN VIEW", (w//2 - 220, h//2),
-                           cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 255), 3)
+                put_cached_text(disp, "PUT YOUR HAND IN VIEW", (w//2 - 220, h//2), 1.0, (0, 0, 255), 3)
                 
                 # Mode indicator
-                cv2.putText(disp, "RGB MODE", (20, 40), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+                put_cached_text(disp, "RGB MODE", (20, 40), 0.6, (0, 255, 255), 2)
 
             # FPS
             fps = hd.fps_counter.get_global()
-            cv2.putText(disp, f"FPS: {fps:.1f}", (w - 160, 30),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+            put_label_value(disp, "FPS: ", f"{fps:.1f}", (w - 160, 30), 0.7, (0, 255, 0), 2)
 
             # Show
-            cv2.imshow("Wrist Rotation Detection (RGB)", disp)
+            limiter.show("Wrist Rotation Detection (RGB)", disp)
 
             # Keys
             k = cv2.waitKey(1) & 0xFF
             if k == ord('q'): 
                 break
             elif k == ord('r'): 
-                det.reset()
+                reset_requested.set()
             elif k == ord('s'):
-                fname = f"wrist_rgb_{saved:04d}.jpg"
-                cv2.imwrite(fname, disp)
-                print(f"Saved {fname}")
+                saver.save(f"wrist_rgb_{saved:04d}.jpg", disp)
                 saved += 1
                 
     except KeyboardInterrupt:
         print("\nStopped")
     finally:
+        worker.stop()
+        saver.close()
         hd.close()
         cv2.destroyAllWindows()
         print("Done!")
@@ -47,6 +47,9 @@ class HandTracker:
     - solo: boolean, when True detect one hand max (much faster since we run the pose detection model only if no hand was detected in the previous frame)
     - xyz : boolean, when True get the (x, y, z) coords of the detected hands (if the device supports depth measure).
     - crop : boolean which indicates if square cropping on source images is applied or not
+    - mirror : boolean, when True frames are mirrored horizontally (selfie view) before inference,
+                    on the sensor for the internal camera. Landmarks then match the mirrored frame.
+                    Handedness is inferred on the mirrored frame as well; no explicit label swap is done.
     - internal_fps : when using the internal color camera as input source, set its FPS to this value (calling setFps()).
     - resolution : sensor resolution "full" (1920x1080) or "ultra" (3840x2160),
     - internal_frame_height : when using the internal color camera, set the frame height (calling setIspScale()).
@@ -77,6 +80,7 @@ class HandTracker:
                 solo=False,
                 xyz=False,
                 crop=False,
+                mirror=False,
                 internal_fps=23,
                 resolution="full",
                 internal_frame_height=640,
@@ -121,6 +125,7 @@ class HandTracker:
             self.max_hands = 20
         self.xyz = False
         self.crop = crop 
+        self.mirror = mirror
         self.use_world_landmarks = use_world_landmarks
         self.internal_fps = internal_fps     
         self.stats = stats
@@ -182,6 +187,9 @@ class HandTracker:
             if input_src.isdigit():
                 input_src = int(input_src)
             self.cap = cv2.VideoCapture(input_src)
+            if isinstance(input_src, int):
+                # Live webcam: keep only the newest frame so a slow consumer doesn't lag behind
+                self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
             self.video_fps = int(self.cap.get(cv2.CAP_PROP_FPS))
             self.img_w = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
             self.img_h = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
@@ -277,6 +285,9 @@ class HandTracker:
                 cam.setResolution(dai.ColorCameraProperties.SensorResolution.THE_4_K)
             cam.setBoardSocket(dai.CameraBoardSocket.RGB)
             cam.setInterleaved(False)
+            if self.mirror:
+                # Mirrored on the device: no host-side flip of frames or landmarks needed
+                cam.setImageOrientation(dai.CameraImageOrientation.HORIZONTAL_MIRROR)
             cam.setIspScale(self.scale_nd[0], self.scale_nd[1])
             cam.setFps(self.internal_fps)
 
@@ -511,6 +522,8 @@ class HandTracker:
                 ok, frame = self.cap.read()
                 if not ok:
                     return None, None, None
+                if self.mirror:
+                    frame = cv2.flip(frame, 1)
             # Cropping and/or padding of the video frame
             video_frame = frame[self.crop_h:self.crop_h+self.frame_size, self.crop_w:self.crop_w+self.frame_size]
             if self.pad_h or self.pad_w:
@@ -52,7 +52,8 @@ class HandDetector:
       - LEFT/RIGHT mono cameras -> StereoDepth for mm depth
       - Light image enhancement for IR
       - Non-blocking host queues
-      - Palm & Landmark NNs + postproc script (Script node orchestrated)
+      - Palm & Landmark NNs + postproc script (Script node orchestrated);
+        palm detection only re-runs when landmark tracking is lost
       - Depth-aware filtering (distance-aware variance tolerance)
     """
 
@@ -62,14 +63,23 @@ class HandDetector:
         resolution=(640, 480),
         pd_score_thresh: float = 0.15,
         pd_nms_thresh: float = 0.3,
+        lm_score_thresh: float = 0.10,
         use_gesture: bool = True,
-        use_rgb: bool = True  # not used in IR path; kept for API compat
+        use_rgb: bool = True,  # not used in IR path; kept for API compat
+        use_depth=None
     ):
         self.fps_target = fps
         self.resolution = resolution
         self.pd_score_thresh = pd_score_thresh
         self.pd_nms_thresh = pd_nms_thresh
+        # Landmark score below which the manager script drops the tracked ROI
+        # and runs palm detection again on the next frame. Above it, the ROI
+        # comes from the previous landmarks and the palm NN is skipped.
+        self.lm_score_thresh = lm_score_thresh
         self.use_gesture = use_gesture
+        # Depth only feeds filter_hands_by_depth; without it the stereo node and
+        # depth stream are not created at all. None = follow OAK_DEPTH_FILTER.
+        self.use_depth = os.environ.get("OAK_DEPTH_FILTER", "1") == "1" if use_depth is None else bool(use_depth)
 
         # Model/template assets (paths resolved to work in source and PyInstaller)
         self.pd_model = _find_asset("models/palm_detection_sh4.blob")
@@ -94,6 +104,12 @@ class HandDetector:
         # Runtime stats
         self.fps_counter = FPS()
 
+        # enhance_ir_frame state, reused across frames. The scratch images are
+        # only touched by the thread calling get_frame_and_hands; the frame it
+        # returns is always a fresh array, since the caller may still hold it.
+        self._clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        self._gray = self._clahe_buf = self._smooth_buf = None
+
         # Continuity helpers
         self.last_hand_positions = []
         self.frames_without_detection = 0
@@ -115,19 +131,25 @@ class HandDetector:
         cam_left.setBoardSocket(dai.CameraBoardSocket.LEFT)
         cam_left.setFps(min(self.fps_target, 30))
 
-        cam_right = pipeline.createMonoCamera()
-        cam_right.setResolution(dai.MonoCameraProperties.SensorResolution.THE_400_P)
-        cam_right.setBoardSocket(dai.CameraBoardSocket.RIGHT)
-        cam_right.setFps(min(self.fps_target, 30))
-
-        # Stereo depth (mm)
-        depth = pipeline.createStereoDepth()
-        depth.setDefaultProfilePreset(dai.node.StereoDepth.PresetMode.HIGH_DENSITY)
-        depth.initialConfig.setMedianFilter(dai.MedianFilter.KERNEL_7x7)
-        depth.setLeftRightCheck(True)
-        depth.setSubpixel(True)  # better precision at range
-        cam_left.out.link(depth.left)
-        cam_right.out.link(depth.right)
+        if self.use_depth:
+            cam_right = pipeline.createMonoCamera()
+            cam_right.setResolution(dai.MonoCameraProperties.SensorResolution.THE_400_P)
+            cam_right.setBoardSocket(dai.CameraBoardSocket.RIGHT)
+            cam_right.setFps(min(self.fps_target, 30))
+
+            # Stereo depth (mm)
+            depth = pipeline.createStereoDepth()
+            depth.setDefaultProfilePreset(dai.node.StereoDepth.PresetMode.HIGH_DENSITY)
+            depth.initialConfig.setMedianFilter(dai.MedianFilter.KERNEL_7x7)
+            depth.setLeftRightCheck(True)
+            depth.setSubpixel(True)  # better precision at range
+            cam_left.out.link(depth.left)
+            cam_right.out.link(depth.right)
+
+            # Depth XLink out
+            depth_out = pipeline.createXLinkOut()
+            depth_out.setStreamName("depth_out")
+            depth.depth.link(depth_out.input)
 
         # Convert mono to RGB888p so downstream matches expected layout
         mono_to_rgb = pipeline.createImageManip()
@@ -135,11 +157,6 @@ class HandDetector:
         mono_to_rgb.initialConfig.setFrameType(dai.ImgFrame.Type.RGB888p)
         cam_left.out.link(mono_to_rgb.inputImage)
 
-        # Depth XLink out
-        depth_out = pipeline.createXLinkOut()
-        depth_out.setStreamName("depth_out")
-        depth.depth.link(depth_out.input)
-
         # Camera (RGB888p) XLink out
         cam_out = pipeline.createXLinkOut()
         cam_out.setStreamName("cam_out")
@@ -227,7 +244,7 @@ class HandDetector:
             _TRACE1="#",
             _TRACE2="#",
             _pd_score_thresh=self.pd_score_thresh,
-            _lm_score_thresh=0.10,  # lenient to keep hands at distance
+            _lm_score_thresh=self.lm_score_thresh,  # default lenient to keep hands at distance
             _pad_h=self.pad_h,
             _img_h=self.img_h,
             _img_w=self.img_w,
@@ -257,7 +274,8 @@ class HandDetector:
             # Non-blocking host queues (small sizes to reduce latency)
             self.q_video = self.device.getOutputQueue(name="cam_out", maxSize=2, blocking=False)
             self.q_manager_out = self.device.getOutputQueue(name="manager_out", maxSize=2, blocking=False)
-            self.q_depth = self.device.getOutputQueue(name="depth_out", maxSize=2, blocking=False)
+            if self.use_depth:
+                self.q_depth = self.device.getOutputQueue(name="depth_out", maxSize=2, blocking=False)
             return True
         except Exception as e:
             print(f"Failed to connect to OAK-D: {e}")
@@ -294,6 +312,8 @@ class HandDetector:
             hand.landmarks[:, 0] -= self.pad_w
             for i in range(len(hand.rect_points)):
                 hand.rect_points[i][0] -= self.pad_w
+        # Same corners as an int32 polyline, built once here instead of at every draw
+        hand.rect_points_i32 = np.array(hand.rect_points, dtype=np.int32).reshape(-1, 1, 2)
 
         if self.use_gesture:
             mpu.recognize_gesture(hand)
@@ -359,17 +379,17 @@ class HandDetector:
         """Light IR enhancement to keep edges and reduce noise."""
         # input is RGB888p from ImageManip; convert to gray
         if len(frame.shape) == 3:
-            gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+            gray = self._gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY, dst=self._gray)
         else:
             gray = frame
 
         # CLAHE + light bilateral keeps features for palm/LM models
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-        enhanced = clahe.apply(gray)
-        enhanced = cv2.bilateralFilter(enhanced, 5, 50, 50)
+        # (dst=None on the first frame allocates; later frames write in place)
+        self._clahe_buf = self._clahe.apply(gray, dst=self._clahe_buf)
+        self._smooth_buf = cv2.bilateralFilter(self._clahe_buf, 5, 50, 50, dst=self._smooth_buf)
 
         # back to 3-channel RGB for any consumers expecting it
-        enhanced_rgb = cv2.cvtColor(enhanced, cv2.COLOR_GRAY2RGB)
+        enhanced_rgb = cv2.cvtColor(self._smooth_buf, cv2.COLOR_GRAY2RGB)
         return enhanced_rgb
 
     # ---------------------------------------------------------------------
@@ -409,8 +429,8 @@ class HandDetector:
                 hand = self.extract_hand_data(res, i)
                 hands.append(hand)
 
-            # Depth-based filtering (can disable via env OAK_DEPTH_FILTER=0)
-            if depth_frame is not None and len(hands) > 0 and os.environ.get("OAK_DEPTH_FILTER", "1") == "1":
+            # Depth-based filtering (can disable via env OAK_DEPTH_FILTER=0 / use_depth=False)
+            if depth_frame is not None and len(hands) > 0:
                 hands = self.filter_hands_by_depth(hands, depth_frame)
 
 
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 
+import os
+
 import cv2
 import numpy as np
-from collections import deque
 from ..utils.FPS import FPS
 
 
@@ -17,7 +18,8 @@ class MotionDetector:
                  min_area=500,
                  max_area=50000,
                  blur_size=21,
-                 background_learning_rate=0.01):
+                 background_learning_rate=0.01,
+                 use_opencl=None):
         
         self.motion_threshold = motion_threshold
         self.min_area = min_area
@@ -25,40 +27,61 @@ class MotionDetector:
         self.blur_size = blur_size
         self.background_learning_rate = background_learning_rate
         
+        # OpenCL (T-API): 前処理と背景差分をUMatでGPU実行（このインスタンスのみ）。
+        # 640x480ではカーネルのコンパイルと転送で遅くなることもあるのでオプトイン:
+        # None = 環境変数 OAK_OPENCL=1 かつOpenCLが使える場合のみ有効。
+        # cv2.ocl.setUseOpenCL（プロセス全体の設定）は変更しない
+        if use_opencl is None:
+            use_opencl = os.environ.get("OAK_OPENCL", "0") == "1"
+        self.use_opencl = bool(use_opencl) and cv2.ocl.haveOpenCL()
+        self.kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+        
         # Background subtractor
         self.bg_subtractor = cv2.createBackgroundSubtractorMOG2(
             detectShadows=True,
             varThreshold=50
         )
         
-        # Motion tracking
-        self.motion_points = deque(maxlen=30)  # 30フレーム分の軌跡
+        # Motion tracking: 30フレーム分の軌跡をリングバッファ（座標/時刻の配列）で保持
+        # 各点を i と i+N の2か所に書くので、直近の軌跡は常に連続したビューで取れる
+        self.trail_len = 30
+        self._trail_xy = np.empty((2 * self.trail_len, 2), np.int32)
+        self._trail_t = np.empty(2 * self.trail_len, np.float64)
+        self._trail_head = 0   # 次に書く位置 (0..N-1)
+        self._trail_count = 0
         self.fps_counter = FPS()
         
         # Calibration
         self.calibration_frames = 0
         self.calibration_needed = 30  # 30フレームで背景学習
         
-    def detect_motion(self, frame):
-        """フレームから動きを検出"""
+    def detect_motion(self, frame, frame_step=1):
+        """
+        フレームから動きを検出
+        frame_step: 前回の呼び出しから進んだフレーム数（Nフレームに1回呼ぶ場合はN）。
+        背景の学習率をN倍して、毎フレーム呼んだ場合と同じ速さで背景に追従させる
+        """
         if frame is None:
             return []
         
         self.fps_counter.update()
         
-        # グレースケール変換
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        # グレースケール変換（OpenCL有効時はUMatのままGPU上で処理）
+        src = cv2.UMat(frame) if self.use_opencl else frame
+        gray = cv2.cvtColor(src, cv2.COLOR_BGR2GRAY)
         
         # ガウシアンブラー
         blurred = cv2.GaussianBlur(gray, (self.blur_size, self.blur_size), 0)
         
         # 背景差分
-        fg_mask = self.bg_subtractor.apply(blurred, learningRate=self.background_learning_rate)
+        learning_rate = min(self.background_learning_rate * frame_step, 1.0)
+        fg_mask = self.bg_subtractor.apply(blurred, learningRate=learning_rate)
         
         # ノイズ除去
-        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
-        fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_CLOSE, kernel)
-        fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, kernel)
+        fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_CLOSE, self.kernel)
+        fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, self.kernel)
+        if self.use_opencl:
+            fg_mask = fg_mask.get()  # 輪郭検出はCPUのみ
         
         # 輪郭検出
         contours, _ = cv2.findContours(fg_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -90,20 +113,29 @@ class MotionDetector:
         return motion_objects
     
     def update_motion_trail(self, motion_objects):
-        """動きの軌跡を更新"""
+        """
+        動きの軌跡を更新
+        戻り値: (xy, t) 古い順の (n, 2) int32 座標と (n,) 秒。内部バッファのビュー
+        なので次の更新までに使うこと
+        """
         if motion_objects:
             # 最も大きな動きを追跡（おそらく手）
             largest_motion = max(motion_objects, key=lambda x: x['area'])
-            center = largest_motion['center']
             
             # 軌跡に追加
-            self.motion_points.append({
-                'position': center,
-                'timestamp': cv2.getTickCount(),
-                'area': largest_motion['area']
-            })
+            n, i = self.trail_len, self._trail_head
+            self._trail_xy[i] = self._trail_xy[i + n] = largest_motion['center']
+            self._trail_t[i] = self._trail_t[i + n] = cv2.getTickCount() / cv2.getTickFrequency()
+            self._trail_head = (i + 1) % n
+            self._trail_count = min(self._trail_count + 1, n)
         
-        return list(self.motion_points)
+        return self.get_motion_trail()
+    
+    def get_motion_trail(self):
+        """現在の軌跡 (xy, t)（古い順、コピーなし）"""
+        start = (self._trail_head - self._trail_count) % self.trail_len
+        end = start + self._trail_count
+        return self._trail_xy[start:end], self._trail_t[start:end]
     
     def is_calibrating(self):
         """キャリブレーション中かどうか"""
@@ -116,7 +148,7 @@ class MotionDetector:
     def reset_calibration(self):
         """キャリブレーションをリセット"""
         self.calibration_frames = 0
-        self.motion_points.clear()
+        self._trail_head = self._trail_count = 0
         self.bg_subtractor = cv2.createBackgroundSubtractorMOG2(
             detectShadows=True,
             varThreshold=50
@@ -37,19 +37,23 @@ class MotionSwipeDetector:
         self.detection_start_time = None
         self.detection_start_pos = None
         
-        # 軌跡バッファ
+        # 軌跡バッファ（座標のみ）
         self.trail_buffer = deque(maxlen=50)
         
-    def analyze_motion_trail(self, motion_points):
-        """モーション軌跡を解析してスワイプを検出"""
-        if len(motion_points) < 3:
+        # get_current_progress() の戻り値（毎回上書きして再利用）
+        self._progress = {'state': 'idle', 'distance': 0, 'velocity': 0, 'progress': 0.0, 'y_deviation': 0}
+        
+    def analyze_motion_trail(self, motion_trail):
+        """モーション軌跡 (xy, t) を解析してスワイプを検出"""
+        xy, _ = motion_trail
+        if len(xy) < 3:
             self.current_state = 'idle'
             return False
         
         current_time = time.time()
         
         # 軌跡をスムージング
-        smoothed_trail = self._smooth_trail(motion_points)
+        smoothed_trail = self._smooth_trail(xy)
         
         if len(smoothed_trail) < 3:
             return False
@@ -66,35 +70,29 @@ class MotionSwipeDetector:
         
         return False
     
-    def _smooth_trail(self, motion_points):
-        """軌跡をスムージング"""
-        if len(motion_points) < self.smoothing_window:
-            return [(p['position'], p['timestamp']) for p in motion_points]
-        
-        smoothed = []
-        positions = [p['position'] for p in motion_points]
-        timestamps = [p['timestamp'] for p in motion_points]
-        
-        for i in range(len(positions)):
-            start_idx = max(0, i - self.smoothing_window // 2)
-            end_idx = min(len(positions), i + self.smoothing_window // 2 + 1)
-            
-            window_positions = positions[start_idx:end_idx]
-            avg_x = sum(pos[0] for pos in window_positions) / len(window_positions)
-            avg_y = sum(pos[1] for pos in window_positions) / len(window_positions)
-            
-            smoothed.append(((int(avg_x), int(avg_y)), timestamps[i]))
-        
-        return smoothed
+    def _smooth_trail(self, xy):
+        """軌跡をスムージング（中心移動平均、端は窓を縮める）。(n, 2) int32 を返す"""
+        n = len(xy)
+        if n < self.smoothing_window:
+            return xy
+        
+        # 累積和で全点の窓平均を一度に計算
+        half = self.smoothing_window // 2
+        csum = np.zeros((n + 1, 2), np.float64)
+        np.cumsum(xy, axis=0, out=csum[1:])
+        idx = np.arange(n)
+        lo = np.maximum(idx - half, 0)
+        hi = np.minimum(idx + half + 1, n)
+        return ((csum[hi] - csum[lo]) / (hi - lo)[:, None]).astype(np.int32)
     
     def _start_detection(self, trail, current_time):
         """検出開始"""
         if len(trail) >= 3:
             self.current_state = 'detecting'
             self.detection_start_time = current_time
-            self.detection_start_pos = trail[0][0]
+            self.detection_start_pos = tuple(trail[0].tolist())
             self.trail_buffer.clear()
-            self.trail_buffer.extend(trail)
+            self.trail_buffer.extend(map(tuple, trail.tolist()))
         
         return False
     
@@ -112,7 +110,7 @@ class MotionSwipeDetector:
             return False
         
         # 軌跡バッファ更新
-        self.trail_buffer.extend(trail[-3:])  # 最新の3ポイントを追加
+        self.trail_buffer.extend(map(tuple, trail[-3:].tolist()))  # 最新の3ポイントを追加
         
         # 最低継続時間チェック
         if duration >= self.min_duration:
@@ -127,7 +125,7 @@ class MotionSwipeDetector:
             return False
         
         # 最新の位置
-        latest_pos = trail[-1][0]
+        latest_pos = trail[-1].tolist()
         
         # 距離計算
         total_distance = latest_pos[0] - self.detection_start_pos[0]  # X方向の移動
@@ -169,26 +167,18 @@ class MotionSwipeDetector:
         pass
     
     def get_current_progress(self):
-        """現在のスワイプ進行状況を取得"""
-        if self.current_state == 'idle':
-            return {
-                'state': 'idle',
-                'distance': 0,
-                'velocity': 0,
-                'progress': 0.0,
-                'y_deviation': 0
-            }
-        
-        if not self.detection_start_pos or len(self.trail_buffer) == 0:
-            return {
-                'state': self.current_state,
-                'distance': 0,
-                'velocity': 0,
-                'progress': 0.0,
-                'y_deviation': 0
-            }
-        
-        latest_pos = self.trail_buffer[-1]['position'] if isinstance(self.trail_buffer[-1], dict) else self.trail_buffer[-1][0]
+        """
+        現在のスワイプ進行状況を取得
+        毎回同じdictを上書きして返す（保持する場合はコピーすること）
+        """
+        p = self._progress
+        p['state'] = self.current_state
+        if self.current_state == 'idle' or not self.detection_start_pos or len(self.trail_buffer) == 0:
+            p['distance'] = p['velocity'] = p['y_deviation'] = 0
+            p['progress'] = 0.0
+            return p
+        
+        latest_pos = self.trail_buffer[-1]
         
         distance = latest_pos[0] - self.detection_start_pos[0]
         y_distance = abs(latest_pos[1] - self.detection_start_pos[1])
@@ -196,17 +186,15 @@ class MotionSwipeDetector:
         current_time = time.time()
         duration = current_time - (self.detection_start_time or current_time)
         
-        velocity = distance / max(duration, 0.01)
-        progress = min(distance / self.min_distance, 1.0)
-        y_deviation = y_distance / max(abs(distance), 1)
-        
-        return {
-            'state': self.current_state,
-            'distance': distance,
-            'velocity': velocity,
-            'progress': max(progress, 0.0),
-            'y_deviation': y_deviation
-        }
+        p['distance'] = distance
+        p['velocity'] = distance / max(duration, 0.01)
+        p['progress'] = max(min(distance / self.min_distance, 1.0), 0.0)
+        p['y_deviation'] = y_distance / max(abs(distance), 1)
+        return p
+    
+    def get_counts(self):
+        """(検出数, 除外数) を返す（毎フレームのHUD用、dictを作らない）"""
+        return self.total_swipes_detected, self.false_positives_filtered
     
     def get_statistics(self):
         """統計情報を取得"""
@@ -58,7 +58,8 @@ class RGBHandDetector:
                  fps: int = 30,
                  resolution=(640, 480),
                  pd_score_thresh: float = 0.15,
-                 use_gesture: bool = True):
+                 use_gesture: bool = True,
+                 mirror: bool = False):
         """
         Initialize RGB hand detector
         
@@ -67,6 +68,8 @@ class RGBHandDetector:
             resolution: Output resolution (width, height)
             pd_score_thresh: Palm detection threshold (lower = more sensitive)
             use_gesture: Enable gesture recognition
+            mirror: Mirror frames on the camera (selfie view); frames and landmarks
+                    come back already mirrored, no cv2.flip needed
         """
         self.fps_target = min(fps, 30)  # OAK-D RGB max is ~30fps
         self.resolution = resolution
@@ -86,6 +89,7 @@ class RGBHandDetector:
             internal_fps=self.fps_target,
             resolution="full",       # 1920x1080 sensor resolution
             internal_frame_height=resolution[1],
+            mirror=mirror,           # Horizontal mirror done by the camera
             pd_score_thresh=pd_score_thresh,
             lm_score_thresh=0.6,     # Landmark detection threshold
             single_hand_tolerance_thresh=10,
@@ -120,7 +124,7 @@ class RGBHandDetector:
         Returns:
             tuple: (frame, hands, depth)
                 - frame: RGB image (numpy array)
-                - hands: List of detected hand objects with landmarks
+                - hands: List of detected hand objects; every one has a landmarks array
                 - depth: None (RGB mode has no depth)
         """
         self.fps_counter.update()
@@ -131,6 +135,9 @@ class RGBHandDetector:
         if frame is None:
             return None, [], None
         
+        # Only hands with landmarks, so callers can use hand.landmarks without checks
+        hands = [hand for hand in hands if getattr(hand, 'landmarks', None) is not None]
+        
         # Resize frame to target resolution if needed
         if frame.shape[:2][::-1] != self.resolution:
             orig_h, orig_w = frame.shape[:2]
@@ -140,11 +147,10 @@ class RGBHandDetector:
             scale_x = self.resolution[0] / orig_w
             scale_y = self.resolution[1] / orig_h
             for hand in hands:
-                if hasattr(hand, 'landmarks') and hand.landmarks is not None:
-                    # Convert to float, scale, then convert back
-                    hand.landmarks = hand.landmarks.astype(float)
-                    hand.landmarks[:, 0] *= scale_x
-                    hand.landmarks[:, 1] *= scale_y
+                # Convert to float, scale, then convert back
+                hand.landmarks = hand.landmarks.astype(float)
+                hand.landmarks[:, 0] *= scale_x
+                hand.landmarks[:, 1] *= scale_y
         
         # Return in format compatible with IR detector
         # depth is None for RGB mode
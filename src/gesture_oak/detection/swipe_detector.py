@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 import time
 import numpy as np
-from collections import deque
 from enum import Enum
 from typing import Optional, Tuple
 import socket
@@ -44,8 +43,7 @@ class SwipeDetector:
         self.max_y_deviation = float(max_y_deviation)
 
         self.state = SwipeState.IDLE
-        self.position_buffer = deque(maxlen=buffer_size)  # (x, y)
-        self.time_buffer = deque(maxlen=buffer_size)      # t (s)
+        self._init_ring(buffer_size)  # position/time history, see get_trail()
 
         self.swipe_start_time: Optional[float] = None
         self.swipe_start_pos: Optional[Tuple[float, float]] = None
@@ -56,6 +54,9 @@ class SwipeDetector:
         self.total_swipes_detected = 0
         self.false_positives_filtered = 0
 
+        # Returned by get_current_swipe_progress(), refilled in place each call
+        self._progress = {"state": "", "distance": 0.0, "duration": 0.0, "velocity": 0.0, "progress": 0.0}
+
         # UDP socket
         try:
             self._udp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -83,10 +84,9 @@ class SwipeDetector:
             self._reset_detection()
             return False
 
-        self.position_buffer.append(hand_center)
-        self.time_buffer.append(now)
+        self._ring_push(hand_center, now)
 
-        if len(self.position_buffer) < 3:
+        if self._ring_count < 3:
             return False
 
         if self.state == SwipeState.IDLE:
@@ -98,22 +98,40 @@ class SwipeDetector:
         return False
 
     def get_current_swipe_progress(self) -> Optional[dict]:
-        if self.state == SwipeState.IDLE or not self.swipe_start_pos or not self.position_buffer:
+        """
+        Progress of the swipe being tracked, or None when idle.
+        The same dict is returned (and overwritten) on every call; copy it to keep it.
+        """
+        if self.state == SwipeState.IDLE or not self.swipe_start_pos or not self._ring_count:
             return None
 
-        cur = self.position_buffer[-1]
-        cur_t = self.time_buffer[-1]
+        xy, t = self.get_trail()
+        cur = xy[-1]
+        cur_t = float(t[-1])
         dist_x = float(cur[0] - self.swipe_start_pos[0])
         dur = max(cur_t - (self.swipe_start_time or cur_t), 1e-6)
-        vel = dist_x / dur
 
-        return {
-            "state": self.state.value,
-            "distance": dist_x,
-            "duration": dur,
-            "velocity": vel,
-            "progress": min(max(dist_x / self.min_distance, 0.0), 1.0),
-        }
+        p = self._progress
+        p["state"] = self.state.value
+        p["distance"] = dist_x
+        p["duration"] = dur
+        p["velocity"] = dist_x / dur
+        p["progress"] = min(max(dist_x / self.min_distance, 0.0), 1.0)
+        return p
+
+    def get_trail(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Position history (last buffer_size hand centers), oldest first:
+        (n, 2) float64 positions and (n,) times. Views into a ring buffer, valid until the next update().
+        """
+        n = len(self._ring_t) // 2
+        start = (self._ring_head - self._ring_count) % n
+        end = start + self._ring_count
+        return self._ring_xy[start:end], self._ring_t[start:end]
+
+    def get_counts(self) -> Tuple[int, int]:
+        """(total_swipes_detected, false_positives_filtered) for per-frame HUDs, no dict built"""
+        return self.total_swipes_detected, self.false_positives_filtered
 
     def get_statistics(self) -> dict:
         return {
@@ -126,23 +144,71 @@ class SwipeDetector:
         self.total_swipes_detected = 0
         self.false_positives_filtered = 0
 
+    def reconfigure(
+        self,
+        buffer_size: int,
+        min_distance: float,
+        min_duration: float,
+        max_duration: float,
+        min_velocity: float,
+        max_velocity: float,
+        max_y_deviation: float,
+    ):
+        """
+        Change thresholds in place (e.g. a sensitivity preset) instead of building a new detector.
+        Statistics are kept; a swipe in progress is dropped since it was judged by the old thresholds.
+        """
+        if buffer_size != len(self._ring_t) // 2:
+            # Only the history ring is rebuilt, keeping its newest entries
+            xy, t = self.get_trail()
+            self._init_ring(buffer_size)  # new arrays; xy/t still view the old ones
+            for pos, ts in zip(xy[-buffer_size:], t[-buffer_size:]):
+                self._ring_push(pos, ts)
+        self.buffer_size = buffer_size
+        self.min_distance = float(min_distance)
+        self.min_duration = float(min_duration)
+        self.max_duration = float(max_duration)
+        self.min_velocity = float(min_velocity)
+        self.max_velocity = float(max_velocity)
+        self.max_y_deviation = float(max_y_deviation)
+        self._reset_detection()
+
+    # ------------------------------------------------------------------ #
+    # History ring: every entry is written twice (i and i + n) so the last
+    # n entries are always one contiguous slice, no np.roll/copy needed
+    # ------------------------------------------------------------------ #
+    def _init_ring(self, size: int):
+        self._ring_xy = np.empty((2 * size, 2), np.float64)
+        self._ring_t = np.empty(2 * size, np.float64)
+        self._ring_head = 0   # next slot to write (0..n-1)
+        self._ring_count = 0
+
+    def _ring_push(self, pos, t: float):
+        n, i = len(self._ring_t) // 2, self._ring_head
+        self._ring_xy[i] = self._ring_xy[i + n] = pos
+        self._ring_t[i] = self._ring_t[i + n] = t
+        self._ring_head = (i + 1) % n
+        self._ring_count = min(self._ring_count + 1, n)
+
     # ------------------------------------------------------------------ #
     # Internal state machine
     # ------------------------------------------------------------------ #
     def _check_start_detection(self) -> bool:
         # Look at the last 3 points → must be moving right consistently
-        x0, x1, x2 = self.position_buffer[-3][0], self.position_buffer[-2][0], self.position_buffer[-1][0]
+        xy, t = self.get_trail()
+        x0, x1, x2 = xy[-3:, 0]
         if (x1 - x0) > 3 and (x2 - x1) > 3:  # tiny threshold to start tracking
             self.state = SwipeState.DETECTING
-            self.swipe_start_time = self.time_buffer[-3]
-            self.swipe_start_pos = self.position_buffer[-3]
+            self.swipe_start_time = float(t[-3])
+            self.swipe_start_pos = (float(xy[-3, 0]), float(xy[-3, 1]))  # copied out of the ring
         return False
 
     def _process_detection(self) -> bool:
         assert self.swipe_start_time is not None and self.swipe_start_pos is not None
 
-        cur_pos = self.position_buffer[-1]
-        cur_time = self.time_buffer[-1]
+        xy, t = self.get_trail()
+        cur_pos = xy[-1]
+        cur_time = float(t[-1])
 
         # Timeout
         if (cur_time - self.swipe_start_time) > self.max_duration:
@@ -163,7 +229,7 @@ class SwipeDetector:
     def _validate_swipe(self) -> bool:
         assert self.swipe_start_time is not None and self.swipe_start_pos is not None
 
-        cur_time = self.time_buffer[-1]
+        cur_time = float(self.get_trail()[1][-1])
         duration = cur_time - self.swipe_start_time
 
         if duration < self.min_duration:
@@ -195,8 +261,7 @@ class SwipeDetector:
 
     def _validate_swipe_characteristics(self) -> bool:
         # Use only the portion after swipe_start_time
-        times = np.asarray(self.time_buffer, dtype=float)
-        poses = np.asarray(self.position_buffer, dtype=float)
+        poses, times = self.get_trail()
 
         # find start index
         start_idx = np.searchsorted(times, self.swipe_start_time, side="left")
@@ -15,6 +15,7 @@ from typing import Optional, Tuple, List
 import numpy as np
 import math
 import socket
+import statistics
 import time
 
 __all__ = ["WristRotationDetector", "HandState", "RotationPosition", "__version__", "WRIST"]
@@ -43,14 +44,27 @@ class RotationPosition(Enum):
     RIGHT_FAR = 4   # 120-180°
 
 
-def _distance(p1, p2):
-    return np.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
+# Finger order used by _detect_hand_state (thumb..pinky)
+FINGER_NAMES = ("thumb", "index", "middle", "ring", "pinky")
+_FINGER_TIPS = np.array([THUMB_TIP, INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP])
+_FINGER_MCPS = np.array([THUMB_MCP, INDEX_MCP, MIDDLE_MCP, RING_MCP, PINKY_MCP])
+_LONG_TIPS = _FINGER_TIPS[1:]  # index..pinky
+# finger_mask (bit 0..4 = thumb..pinky extended) -> finger_states dict
+_MASK_TO_STATES = tuple(
+    {name: bool(mask >> i & 1) for i, name in enumerate(FINGER_NAMES)}
+    for mask in range(1 << len(FINGER_NAMES))
+)
+
+
+def _norms(vecs: np.ndarray) -> np.ndarray:
+    """Row-wise length of an (N, 2) array"""
+    return np.hypot(vecs[:, 0], vecs[:, 1])
 
 
 def _median(seq: List[float]):
     if not seq:
         return None
-    return float(np.median(np.asarray(seq, dtype=float)))
+    return float(statistics.median(seq))
 
 
 class WristRotationDetector:
@@ -95,8 +109,8 @@ class WristRotationDetector:
         self._calib_samples = []
         self._calibrated = False
         
-        # Debug
-        self._finger_states = {}
+        # Debug (bit 0..4 = thumb..pinky extended)
+        self._finger_mask = 0
         
         # Output
         self.result_file = "result.txt"
@@ -152,7 +166,7 @@ class WristRotationDetector:
         # Apply calibration
         if self._neutral_angle is not None:
             angle = raw_angle + (90.0 - self._neutral_angle)
-            angle = float(np.clip(angle, 0.0, 180.0))
+            angle = min(max(angle, 0.0), 180.0)
         else:
             angle = raw_angle
 
@@ -191,59 +205,36 @@ class WristRotationDetector:
         Method 2: Finger spread (for slightly open hands)
         Both must agree for OPEN
         """
-        wrist = lms[WRIST]
-        
+        # Wrist distance of every landmark in one pass; the per-finger
+        # checks below are then just index lookups
+        wrist_dist = _norms(lms - lms[WRIST])
+
         # Get palm size
-        palm_width = _distance(lms[INDEX_MCP], lms[PINKY_MCP])
+        index_mcp, pinky_mcp = lms[INDEX_MCP], lms[PINKY_MCP]
+        palm_width = math.hypot(index_mcp[0] - pinky_mcp[0], index_mcp[1] - pinky_mcp[1])
         if palm_width < 1e-6:
             palm_width = 50.0
-        
-        # METHOD 1: Distance ratio (BALANCED threshold)
-        def is_finger_extended(tip_idx, mcp_idx):
-            tip_dist = _distance(wrist, lms[tip_idx])
-            mcp_dist = _distance(wrist, lms[mcp_idx])
-            if mcp_dist < 1e-6:
-                return False
-            ratio = tip_dist / mcp_dist
-            # BALANCED - 1.2 (20% farther)
-            return ratio > 1.2
-        
-        # Check all fingers
-        thumb_open = is_finger_extended(THUMB_TIP, THUMB_MCP)
-        index_open = is_finger_extended(INDEX_TIP, INDEX_MCP)
-        middle_open = is_finger_extended(MIDDLE_TIP, MIDDLE_MCP)
-        ring_open = is_finger_extended(RING_TIP, RING_MCP)
-        pinky_open = is_finger_extended(PINKY_TIP, PINKY_MCP)
-        
-        extended_count = sum([thumb_open, index_open, middle_open, ring_open, pinky_open])
-        
+
+        # METHOD 1: Distance ratio (BALANCED - tip 20% farther than MCP)
+        tip_dist = wrist_dist[_FINGER_TIPS]
+        mcp_dist = wrist_dist[_FINGER_MCPS]
+        extended = (mcp_dist >= 1e-6) & (tip_dist > 1.2 * mcp_dist)
+        extended_count = int(np.count_nonzero(extended))
+
         # METHOD 2: Finger spread
         # When fisted: fingertips bunched together
         # When open: fingertips spread apart
-        tips = [lms[INDEX_TIP], lms[MIDDLE_TIP], lms[RING_TIP], lms[PINKY_TIP]]
-        total_spread = sum(_distance(tips[i], tips[i+1]) for i in range(len(tips)-1))
+        tips = lms[_LONG_TIPS]
+        total_spread = float(_norms(np.diff(tips, axis=0)).sum())
         spread_ratio = total_spread / max(palm_width, 1e-6)
-        
+
         # METHOD 3: Check if all fingertips are close to palm center
         # Fisted hand: all tips near palm
-        palm_center_x = (lms[INDEX_MCP][0] + lms[PINKY_MCP][0]) / 2
-        palm_center_y = (lms[INDEX_MCP][1] + lms[PINKY_MCP][1]) / 2
-        palm_center = np.array([palm_center_x, palm_center_y])
-        
-        tips_near_palm = 0
-        for tip_idx in [INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP]:
-            dist_to_palm = _distance(palm_center, lms[tip_idx])
-            if dist_to_palm < palm_width * 0.8:  # Tips very close to palm
-                tips_near_palm += 1
-        
-        self._finger_states = {
-            'thumb': thumb_open,
-            'index': index_open,
-            'middle': middle_open,
-            'ring': ring_open,
-            'pinky': pinky_open
-        }
-        
+        palm_center = (index_mcp + pinky_mcp) / 2
+        tips_near_palm = int(np.count_nonzero(_norms(tips - palm_center) < palm_width * 0.8))
+
+        self._finger_mask = int(np.packbits(extended, bitorder='little')[0])
+
         # DECISION LOGIC:
         # FISTED if: ALL fingers close to palm (tight fist)
         if tips_near_palm >= 3:
@@ -277,15 +268,16 @@ class WristRotationDetector:
         """Calculate wrist rotation angle"""
         wrist = lms[WRIST]
         middle_mcp = lms[MIDDLE_MCP]
-        vec = middle_mcp - wrist
-        if np.linalg.norm(vec) < 1e-3:
+        dx = float(middle_mcp[0] - wrist[0])
+        dy = float(middle_mcp[1] - wrist[1])
+        if math.hypot(dx, dy) < 1e-3:
             return None
-        angle = math.degrees(math.atan2(-vec[1], vec[0]))
+        angle = math.degrees(math.atan2(-dy, dx))
         angle = abs(angle) % 360.0
         if angle > 180.0:
             angle = 360.0 - angle
         angle = 180.0 - angle
-        return float(np.clip(angle, 0.0, 180.0))
+        return min(max(angle, 0.0), 180.0)
 
     def _extract_landmarks(self, hand):
         """Extract landmarks"""
@@ -391,9 +383,15 @@ class WristRotationDetector:
             "position": int(self._current_position.value),
             "position_name": self._position_name(self._current_position),
             "calibrated": self._calibrated,
-            "finger_states": self._finger_states.copy(),
+            "finger_mask": self._finger_mask,
+            "finger_states": dict(_MASK_TO_STATES[self._finger_mask]),
         }
 
+    @property
+    def finger_mask(self) -> int:
+        """Extended fingers of the last hand, bit 0..4 = thumb..pinky"""
+        return self._finger_mask
+
     def _position_name(self, pos: RotationPosition) -> str:
         names = {
             RotationPosition.NONE: "NONE",
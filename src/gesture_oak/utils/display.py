@@ -0,0 +1,55 @@
+# src/gesture_oak/utils/display.py
+import os
+import time
+
+import cv2
+
+# Non-blocking key poll that still pumps the window's events (OpenCV >= 4.5);
+# waitKey(1) can oversleep several ms on some compositors. Older builds fall
+# back to waitKey(1).
+poll_key = getattr(cv2, "pollKey", None) or (lambda: cv2.waitKey(1))
+
+
+def open_window(title: str):
+    """
+    Create the preview window before the first imshow.
+    With OAK_GL=1 the window is an OpenGL one (frames are uploaded as a texture
+    and drawn by the GPU instead of the GDI/X11 blit). Needs an OpenCV build
+    with OpenGL; otherwise falls back to a normal window. Overlays are still
+    drawn on the CPU, so this only pays off at large preview sizes (~1080p).
+    """
+    if os.environ.get("OAK_GL", "0") == "1":
+        try:
+            cv2.namedWindow(title, cv2.WINDOW_AUTOSIZE | cv2.WINDOW_OPENGL)
+            return True
+        except cv2.error as e:
+            print(f"OpenGL window not available, using the default one: {e}")
+    cv2.namedWindow(title, cv2.WINDOW_AUTOSIZE)
+    return False
+
+
+class DisplayLimiter:
+    """
+    imshow at most max_fps times a second, independent of the capture rate.
+    Keys should still be polled every iteration. max_fps None = OAK_DISPLAY_FPS
+    env (default 30), 0 = no cap.
+    - The deadline advances by one period per shown frame (not to "now"), and a
+      frame up to half a period early still counts, so a camera running at the
+      cap rate with some jitter is shown in full instead of every other late one.
+    """
+
+    def __init__(self, max_fps: float = None):
+        if max_fps is None:
+            max_fps = float(os.environ.get("OAK_DISPLAY_FPS", "30"))
+        self._period = 1.0 / max_fps if max_fps > 0 else 0.0
+        self._next = float("-inf")
+
+    def show(self, title: str, img) -> bool:
+        """imshow if the display is due; returns whether it was shown"""
+        now = time.monotonic()
+        if now < self._next - self._period / 2:
+            return False
+        # After a stall, restart from now instead of bursting to catch up
+        self._next = max(self._next + self._period, now)
+        cv2.imshow(title, img)
+        return True
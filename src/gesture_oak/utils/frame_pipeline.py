@@ -0,0 +1,110 @@
+# src/gesture_oak/utils/frame_pipeline.py
+import queue
+import threading
+import time
+from pathlib import Path
+
+import cv2
+
+
+class LatestFrameWorker:
+    """
+    Run a capture/process step on a background thread so the next frame is
+    fetched while the caller draws and displays the current one.
+    - produce() returns one item per call, or None to skip (no frame yet);
+      the worker then sleeps idle_sleep so a stalled camera doesn't spin a core.
+    - Only the newest item is kept (queue of 1, oldest dropped), so a slow
+      consumer never falls behind the camera.
+    - An exception in produce() stops the worker and is re-raised by get().
+    """
+
+    def __init__(self, produce, name: str = "capture", idle_sleep: float = 0.001):
+        self._produce = produce
+        self._idle_sleep = idle_sleep
+        self._queue = queue.Queue(maxsize=1)
+        self._stop = threading.Event()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 1.0):
+        self._stop.set()
+        self._thread.join(timeout)
+
+    def _run(self):
+        try:
+            while not self._stop.is_set():
+                item = self._produce()
+                if item is not None:
+                    self._put_latest(item)
+                else:
+                    time.sleep(self._idle_sleep)
+        except BaseException as e:
+            if not self._stop.is_set():
+                self._error = e
+            self._stop.set()
+
+    def _put_latest(self, item):
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()  # drop the stale frame
+                except queue.Empty:
+                    pass
+
+    def get(self, timeout: float = 0.1):
+        """Newest item, or None if nothing arrived within timeout"""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            if self._error is not None:
+                raise self._error
+            if self._stop.is_set():
+                raise RuntimeError("capture thread stopped")
+            return None
+
+
+class FrameSaver:
+    """
+    Save snapshots ('s' key) on a background thread so the frame loop doesn't
+    wait for JPEG encoding and the disk write.
+    - save() copies the frame (the caller keeps drawing on its own) and
+      returns immediately; the format follows the file extension.
+    - close() writes whatever is still queued, then stops the thread.
+    - jpeg_quality defaults to 95, cv2.imwrite's own default, so snapshots
+      come out the same as when they were written on the loop.
+    """
+
+    def __init__(self, jpeg_quality: int = 95):
+        self._params = [cv2.IMWRITE_JPEG_QUALITY, jpeg_quality]
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="frame-saver", daemon=True)
+        self._thread.start()
+
+    def save(self, filename, frame):
+        self._queue.put((Path(filename), frame.copy()))
+
+    def close(self, timeout: float = 2.0):
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            path, frame = item
+            try:
+                ok, data = cv2.imencode(path.suffix or ".jpg", frame, self._params)
+                if not ok:
+                    raise ValueError("encoding failed")
+                path.write_bytes(data.tobytes())
+                print(f"Frame saved as {path}")
+            except Exception as e:
+                print(f"Could not save {path}: {e}")
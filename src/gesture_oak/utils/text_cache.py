@@ -0,0 +1,72 @@
+# src/gesture_oak/utils/text_cache.py
+"""
+HUD text from cached bitmaps: a label is rasterised with cv2.putText once and
+pasted (masked copy) on later frames. Works for any repeating string; text
+is clipped at the image edges like cv2.putText, and its color must not be
+black (black = mask).
+Changing numbers are composed from per-character bitmaps (a glyph atlas
+filled on first use), so nothing is stroke-rasterised in steady state.
+"""
+from functools import lru_cache
+
+import cv2
+import numpy as np
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+
+@lru_cache(maxsize=256)
+def _text_sprite(text, color, scale, thickness):
+    """Rasterise a label once: (sprite, mask, dx, dy), dx/dy = sprite corner relative to the putText origin"""
+    (tw, th), baseline = cv2.getTextSize(text, FONT, scale, thickness)
+    pad = thickness
+    sprite = np.zeros((th + baseline + 2 * pad, tw + 2 * pad, 3), dtype=np.uint8)
+    cv2.putText(sprite, text, (pad, pad + th), FONT, scale, color, thickness)
+    return sprite, sprite.any(axis=2, keepdims=True), -pad, -(pad + th)
+
+
+@lru_cache(maxsize=1024)
+def _glyph_offsets(text, scale, thickness):
+    """
+    x of each character relative to the putText origin, where one
+    cv2.putText(text) would put it. getTextSize width = round(sum of advances
+    + thickness), so prefix widths are exact where summing per-character
+    widths would lose up to 1 px per glyph.
+    """
+    return tuple(cv2.getTextSize(text[:i], FONT, scale, thickness)[0][0] - thickness if i else 0
+                 for i in range(len(text)))
+
+
+def _put_glyphs(img, text, first, org, scale, color, thickness):
+    """Paste text[first:] from cached glyphs, laid out as the whole of text"""
+    x, y = org
+    offsets = _glyph_offsets(text, scale, thickness)
+    for i in range(first, len(text)):
+        ch = text[i]
+        if ch != " ":
+            put_cached_text(img, ch, (x + offsets[i], y), scale, color, thickness)
+
+
+def put_cached_text(img, text, org, scale, color, thickness):
+    """cv2.putText for labels that repeat frame to frame"""
+    sprite, mask, dx, dy = _text_sprite(text, color, scale, thickness)
+    x, y = org[0] + dx, org[1] + dy
+    h, w = sprite.shape[:2]
+    # Clip to the image (a negative start would wrap the slice)
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + w, img.shape[1]), min(y + h, img.shape[0])
+    if x0 >= x1 or y0 >= y1:
+        return
+    sy, sx = slice(y0 - y, y1 - y), slice(x0 - x, x1 - x)
+    np.copyto(img[y0:y1, x0:x1], sprite[sy, sx], where=mask[sy, sx])
+
+
+def put_glyph_text(img, text, org, scale, color, thickness):
+    """Text that changes every frame, pasted character by character from cached glyphs"""
+    _put_glyphs(img, text, 0, org, scale, color, thickness)
+
+
+def put_label_value(img, label, value, org, scale, color, thickness):
+    """Fixed label (e.g. "Velocity: ") as one cached bitmap, then the changing value from glyphs"""
+    put_cached_text(img, label, org, scale, color, thickness)
+    _put_glyphs(img, label + value, len(label), org, scale, color, thickness)